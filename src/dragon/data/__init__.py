@@ -1 +1 @@
-from .ddict import DDict
\ No newline at end of file
+from .ddict import DDict, AsyncDDict
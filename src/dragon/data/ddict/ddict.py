@@ -33,10 +33,15 @@ import time
 import socket
 import os
 import copy
+import struct
+import asyncio
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 import heapq
 from types import FunctionType
+from collections import OrderedDict
 from collections.abc import Iterator
+from contextlib import ExitStack
 import random
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -88,6 +93,11 @@ DDICT_DEFAULT_TIMEOUT = None
 # overridden.
 DDICT_MIN_SIZE = 3 * 1024**2  # 3 MB
 
+# This is the number of stream channels a client provides for managers to respond
+# on concurrently in multi-key and asynchronous operations. A manager waits for a
+# free stream channel when more managers than this are responding at once.
+DDICT_STREAM_RETURN_CHANNELS = 8
+
 
 class DDictError(DragonLoggingError):
     """
@@ -172,6 +182,16 @@ def strip_pickled_bytes(byte_str):
     return byte_str
 
 
+# Read and discard the rest of a response stream. Closing a receive handle with
+# data left in its stream raises, so a response that is tossed is drained first.
+def _drain_stream(recvh, timeout=None):
+    try:
+        while not recvh.stream_received:
+            recvh.recv_bytes(timeout=timeout)
+    except EOFError:
+        pass
+
+
 @dataclass
 class DDictManagerStats:
     """
@@ -514,6 +534,87 @@ class PickleFDReadAdapter:
         self.read()
 
 
+class CountingReadAdapter:
+    def __init__(self, file):
+        self._file = file
+        self.nbytes = 0
+
+    def read(self, sz=0):
+        data = self._file.read(sz)
+        self.nbytes += len(data)
+        return data
+
+    def readline(self):
+        data = self._file.readline()
+        self.nbytes += len(data)
+        return data
+
+    def readinto(self, b):
+        n = self._file.readinto(b)
+        self.nbytes += n
+        return n
+
+
+class DDictReadCache:
+    """
+    A least recently used cache of values read by a single DDict client. Entries
+    are keyed by the pickled key together with the checkpoint id the value was
+    read from. The cache is bounded by the serialized size of the values it
+    holds, so the least recently used values are evicted once the size of a new
+    value would exceed the bound.
+    """
+
+    def __init__(self, max_bytes: int):
+        if max_bytes <= 0:
+            raise ValueError("The read cache size must be a positive number of bytes.")
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def nbytes(self) -> int:
+        return self._nbytes
+
+    def lookup(self, pickled_key: bytes, chkpt_id: int) -> tuple[bool, object]:
+        entry_key = (pickled_key, chkpt_id)
+        entry = self._entries.get(entry_key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(entry_key)
+        self.hits += 1
+        return True, entry[0]
+
+    def insert(self, pickled_key: bytes, chkpt_id: int, value: object, nbytes: int) -> None:
+        if nbytes > self._max_bytes:
+            return
+
+        entry_key = (pickled_key, chkpt_id)
+        old_entry = self._entries.pop(entry_key, None)
+        if old_entry is not None:
+            self._nbytes -= old_entry[1]
+
+        self._entries[entry_key] = (value, nbytes)
+        self._nbytes += nbytes
+        while self._nbytes > self._max_bytes:
+            _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= evicted_nbytes
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._nbytes = 0
+
+
 class CheckpointPersister(ABC):
     """
 
@@ -638,6 +739,8 @@ class NULLCheckpointPersister(CheckpointPersister):
         pass
 
 class PosixCheckpointPersister(CheckpointPersister):
+    _FNAME_SUFFIX = ".ddict"
+
     def __init__(
         self,
         ddict_name: str,
@@ -665,7 +768,6 @@ class PosixCheckpointPersister(CheckpointPersister):
         self._available_persisted_checkpoints = []
         self._path = Path(self._persist_path)
         self._FNAME_PREFIX = f"{self._ddict_name}_{self._manager_id}_"
-        self._FNAME_SUFFIX = ".ddict"
         dat_files = list(self._path.glob(f"{self._FNAME_PREFIX}*{self._FNAME_SUFFIX}"))
         # Remove prefix and suffix of files to get available persisted checkpoint IDs.
         for f in dat_files:
@@ -845,7 +947,7 @@ class PosixCheckpointPersister(CheckpointPersister):
             # Remove any persisted file with chkpt later than restore_from so that the persisted file
             # won't be overwritten later.
             FNAME_PREFIX = f"{name}_"
-            FNAME_SUFFIX = f".ddict"
+            FNAME_SUFFIX = cls._FNAME_SUFFIX
             # filename = {FNAME_PREFIX}{managerID}_{chkptID}{FNAME_SUFFIX}
             path = Path(persist_path)
             dat_files = list(path.glob(f"{FNAME_PREFIX}*{FNAME_SUFFIX}"))
@@ -884,6 +986,301 @@ class PosixCheckpointPersister(CheckpointPersister):
         return self._current_chkpt_id
 
 
+class PosixDeltaCheckpointPersister(PosixCheckpointPersister):
+    """
+    Persist checkpoints to disk as a chain of segments, each holding only the
+    keys that changed since the previously persisted checkpoint.
+
+    A segment starts with the length of a pickled header followed by the
+    header, which records the checkpoint id and the id of the checkpoint the
+    segment is relative to (None for a full segment). It is followed by one
+    record per key that was added, changed or deleted. Values are written
+    straight from the pool and read straight back into it on load, so neither
+    direction copies them through Python bytes.
+
+    Unchanged keys are found by comparing the ids of their value allocations
+    with those of the last persisted checkpoint. Retiring a checkpoint moves
+    unchanged values forward without reallocating them, and allocation ids are
+    never reused by a pool.
+
+    Loading a checkpoint replays its chain from the most recent full segment.
+    A full segment is written every COMPACT_EVERY segments, or sooner once the
+    deltas of the chain add up to more than its full segment, which bounds
+    the cost of a load. A segment is only removed to honor persist_count
+    together with the rest of its chain, so up to one chain more than
+    persist_count segments may remain on disk.
+    """
+
+    _FNAME_SUFFIX = ".ddelta"
+
+    COMPACT_EVERY = 8
+
+    _PUT = 1
+    _DEL = 2
+    # op, persist flag, key length, number of values
+    _RECORD = struct.Struct("=BBQQ")
+    _LENGTH = struct.Struct("=Q")
+
+    def __init__(
+        self,
+        ddict_name: str,
+        persist_path: str,
+        manager_id: int,
+        log,
+        manager,
+        persist_freq: int = 0,
+        persist_count: int = 0,
+    ):
+        super().__init__(ddict_name, persist_path, manager_id, log, manager, persist_freq, persist_count)
+
+        # Maps each persisted checkpoint ID to the ID its segment is relative to.
+        self._parents = {}
+        for chkpt_id in list(self._available_persisted_checkpoints):
+            try:
+                with open(self._file_name(chkpt_id), "rb") as file:
+                    self._parents[chkpt_id] = self._read_header(file)["parent"]
+            except Exception as ex:
+                self._log(f"Caught exception while reading header of persisted checkpoint {chkpt_id}: {ex}")
+                self._available_persisted_checkpoints.remove(chkpt_id)
+        self._num_persists = len(self._available_persisted_checkpoints)
+
+        # Keys of the last persisted checkpoint, by key allocation ID. None means
+        # the next dump writes a full segment.
+        self._state = None
+        self._last_persisted = None
+        self._segments_since_full = 0
+        self._full_bytes = 0
+        self._delta_bytes = 0
+
+    def _file_name(self, chkpt_id):
+        return self._path / f"{self._FNAME_PREFIX}{chkpt_id}{self._FNAME_SUFFIX}"
+
+    def _read_header(self, file):
+        len_header_bytes = file.read(self._LENGTH.size)
+        if len(len_header_bytes) != self._LENGTH.size:
+            raise RuntimeError("Could not read the length of the segment header from disk.")
+        (len_header,) = self._LENGTH.unpack(len_header_bytes)
+        return pickle.loads(file.read(len_header))
+
+    def _read_records(self, file):
+        """
+        Yield (op, key, persist, extents) for each record of a segment, where
+        extents holds the file offset and length of each value.
+        """
+        while True:
+            record = file.read(self._RECORD.size)
+            if not record:
+                return
+            op, persist, key_len, num_vals = self._RECORD.unpack(record)
+            key = file.read(key_len)
+            extents = []
+            for _ in range(num_vals):
+                (val_len,) = self._LENGTH.unpack(file.read(self._LENGTH.size))
+                extents.append((file.tell(), val_len))
+                file.seek(val_len, os.SEEK_CUR)
+            yield op, key, bool(persist), extents
+
+    def _chain(self, restore_id):
+        chain = []
+        chkpt_id = restore_id
+        while chkpt_id is not None:
+            if chkpt_id not in self._parents:
+                raise DDictPersistCheckpointError(
+                    DragonError.DDICT_PERSIST_CHECKPOINT_UNAVAILABLE,
+                    f"Persisted checkpoint {chkpt_id} needed to restore checkpoint {restore_id} is missing.",
+                )
+            chain.append(chkpt_id)
+            chkpt_id = self._parents[chkpt_id]
+        chain.reverse()
+        return chain
+
+    def _remove_expired_chains(self, keep):
+        # Remove the oldest chain of segments as a whole once the newest persist_count
+        # checkpoints no longer need it.
+        ids = self._available_persisted_checkpoints
+        while len(ids) > 0:
+            end = 1
+            while end < len(ids) and self._parents.get(ids[end]) is not None:
+                end += 1
+            if keep in ids[:end] or len(ids) - end < self._persist_count - 1:
+                return
+            for chkpt_id in ids[:end]:
+                os.remove(self._file_name(chkpt_id))
+                self._log(f"PosixDeltaPersister removed {self._file_name(chkpt_id)}.")
+                del self._parents[chkpt_id]
+            del ids[:end]
+            self._num_persists = len(ids)
+
+    def _cleanup_later_chkpts(self):
+        super()._cleanup_later_chkpts()
+        self._parents = {chkpt_id: self._parents[chkpt_id] for chkpt_id in self._available_persisted_checkpoints}
+        self._num_persists = len(self._available_persisted_checkpoints)
+        self._state = None
+
+    def dump(self, chkpt, force: bool = False):
+        """
+        Dump the keys of a retiring checkpoint that changed since the last persisted
+        checkpoint to disk and retire the checkpoint.
+        """
+        if not force and (self._persist_freq == 0 or self._persist_count == 0 or chkpt.id % self._persist_freq != 0):
+            return
+
+        with self._lock:
+            full = (
+                self._state is None
+                or self._persist_count == 1
+                or chkpt.id in self._parents
+                or self._segments_since_full + 1 >= self.COMPACT_EVERY
+                or self._delta_bytes > self._full_bytes
+            )
+            parent = None if full else self._last_persisted
+
+            state = dict()
+            puts = []
+            for key_mem, val_mems in chkpt.map.items():
+                persist = key_mem in chkpt.persist
+                val_ids = tuple(val_mem.id for val_mem in val_mems)
+                prev = None if full else self._state.get(key_mem.id)
+                if prev is not None and prev[1] == persist and prev[2] == val_ids:
+                    state[key_mem.id] = prev
+                else:
+                    key = key_mem.get_memview().tobytes()
+                    state[key_mem.id] = (key, persist, val_ids)
+                    puts.append((key, persist, val_mems))
+
+            deletes = []
+            if not full:
+                # A key put again in a later checkpoint has a new key allocation and is
+                # written as a put, so only keys missing from the new state are deleted.
+                rewritten = set(key for key, _, _ in puts)
+                for key_id, (key, _, _) in self._state.items():
+                    if key_id not in state and key not in rewritten:
+                        deletes.append(key)
+
+            if self._persist_count != -1:
+                self._remove_expired_chains(keep=parent)
+
+            file_name = self._file_name(chkpt.id)
+            self._log(
+                f"About to dump checkpoint {chkpt.id} to {file_name} with {len(puts)} puts and {len(deletes)} deletes relative to {parent}."
+            )
+            try:
+                num_bytes = 0
+                with open(file_name, "wb") as file:
+                    header = pickle.dumps(
+                        {
+                            "id": chkpt.id,
+                            "parent": parent,
+                            "writers": set(chkpt.writers),
+                            "deleted": [key_mem.get_memview().tobytes() for key_mem in chkpt.deleted],
+                        }
+                    )
+                    file.write(self._LENGTH.pack(len(header)))
+                    file.write(header)
+                    for key in deletes:
+                        file.write(self._RECORD.pack(self._DEL, 0, len(key), 0))
+                        file.write(key)
+                    for key, persist, val_mems in puts:
+                        file.write(self._RECORD.pack(self._PUT, persist, len(key), len(val_mems)))
+                        file.write(key)
+                        for val_mem in val_mems:
+                            mem_view = val_mem.get_memview()
+                            file.write(self._LENGTH.pack(len(mem_view)))
+                            file.write(mem_view)
+                    num_bytes = file.tell()
+            except Exception:
+                # Leave no partial segment behind and start over from a full segment.
+                if file_name.exists():
+                    os.remove(file_name)
+                if chkpt.id in self._available_persisted_checkpoints:
+                    self._available_persisted_checkpoints.remove(chkpt.id)
+                    self._parents.pop(chkpt.id, None)
+                    self._num_persists -= 1
+                self._state = None
+                raise
+
+            self._log(f"PosixDeltaPersister dump chkpt {chkpt.id} completed!")
+            if chkpt.id not in self._available_persisted_checkpoints:
+                self._available_persisted_checkpoints.append(chkpt.id)
+                self._available_persisted_checkpoints.sort()
+                self._num_persists += 1
+            self._parents[chkpt.id] = parent
+            self._state = state
+            self._last_persisted = chkpt.id
+            if full:
+                self._segments_since_full = 0
+                self._full_bytes = num_bytes
+                self._delta_bytes = 0
+            else:
+                self._segments_since_full += 1
+                self._delta_bytes += num_bytes
+            chkpt.retire()
+
+    def load(self, pool: dmem.MemoryPool, cleanup: bool = False):
+        """
+        Load persisted checkpoint from disk by replaying its chain of segments and
+        return the checkpoint.
+        """
+        # The manager module imports this one.
+        from .manager import Checkpoint
+
+        self._log(f"About to load checkpoint {self._current_chkpt_id}.")
+        try:
+            chain = self._chain(self._current_chkpt_id)
+
+            # Replay the chain to find the segment and file offsets holding each key.
+            state = dict()
+            header = None
+            for idx, chkpt_id in enumerate(chain):
+                with open(self._file_name(chkpt_id), "rb") as file:
+                    header = self._read_header(file)
+                    for op, key, persist, extents in self._read_records(file):
+                        if op == self._DEL:
+                            state.pop(key, None)
+                        else:
+                            state[key] = (idx, persist, extents)
+
+            def alloc_bytes(data):
+                mem = pool.alloc(size=len(data))
+                mem.get_memview()[:] = data
+                return mem
+
+            chkpt = Checkpoint(id=header["id"], move_to_pool=self._manager._move_to_pool, manager=self._manager)
+            chkpt.writers = header["writers"]
+            with ExitStack() as stack:
+                files = [stack.enter_context(open(self._file_name(chkpt_id), "rb")) for chkpt_id in chain]
+                for key, (idx, persist, extents) in state.items():
+                    key_mem = alloc_bytes(key)
+                    val_mems = []
+                    for offset, val_len in extents:
+                        val_mem = pool.alloc(size=val_len)
+                        files[idx].seek(offset)
+                        if files[idx].readinto(val_mem.get_memview()) != val_len:
+                            raise RuntimeError("Could not read the memory content from disk.")
+                        val_mems.append(val_mem)
+                    chkpt.key_allocs[key_mem] = key_mem
+                    chkpt.map[key_mem] = val_mems
+                    if persist:
+                        chkpt.persist.add(key_mem)
+
+            for key in header["deleted"]:
+                chkpt.deleted.add(alloc_bytes(key))
+
+            self._log(f"PosixDeltaPersister load checkpoint {chkpt.id} from {len(chain)} segments completed!")
+
+            # The pool allocations are new, so the next dump starts a new chain.
+            self._state = None
+
+            if cleanup:
+                self._cleanup_later_chkpts()
+
+            return chkpt
+        except Exception as ex:
+            tb = traceback.format_exc()
+            log.debug("There is an exception while loading persisted checkpoint from disk: %s\n %s", ex, tb)
+            raise
+
+
 class DAOSCheckpointPersister(CheckpointPersister):
     def __init__(
         self,
@@ -1128,6 +1525,182 @@ class DAOSCheckpointPersister(CheckpointPersister):
         return self._current_chkpt_id
 
 
+class DDictRequestDispatcher:
+    """
+    Keeps many requests of a DDict client outstanding at once and completes
+    a future for each of them as its response arrives. The dispatcher
+    attaches its own client to the dictionary so that its return connectors
+    are read by nothing but its two receiver threads, one for the buffered
+    return connector and one for the stream return connector. Responses are
+    matched to their requests by ref.
+    """
+
+    def __init__(self, ddict: DDict):
+        self._client = DDict.attach(ddict.serialize(), timeout=ddict._timeout, trace=ddict._trace)
+        # Connecting to a manager waits for a response on the buffered return connector,
+        # so all connections are made before the receiver threads start.
+        self._client._check_manager_connection(all=True)
+        self._client._get_stream_return_connector()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._closing = False
+        self._threads = [
+            threading.Thread(target=self._recv_buffered, daemon=True),
+            threading.Thread(target=self._recv_streams, daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+
+    @staticmethod
+    def _check_err(err, errInfo):
+        if err == DragonError.MEMORY_POOL_FULL:
+            raise DDictFullError(err, f"Distributed Dictionary Manager is full. The key/value pair was not stored.")
+        elif err == DragonError.DDICT_CHECKPOINT_RETIRED:
+            raise DDictCheckpointSyncError(err, errInfo)
+        elif err == DragonError.DDICT_FUTURE_CHECKPOINT:
+            raise DDictFutureCheckpointError(err, errInfo)
+        elif err != DragonError.SUCCESS:
+            raise DDictError(err, errInfo)
+
+    def _complete(self, resp_msg, *args):
+        with self._lock:
+            entry = self._pending.pop(resp_msg.ref, None)
+
+        if entry is None:
+            log.info("Tossing lost/timed out response message in DDict Client: %s", resp_msg)
+            return
+
+        future, handler = entry
+        try:
+            future.set_result(handler(resp_msg, *args))
+        except Exception as ex:
+            future.set_exception(ex)
+
+    def _recv_buffered(self):
+        connector = self._client._buffered_return_connector
+        while not self._closing:
+            try:
+                with connector.recvh() as recvh:
+                    resp_ser_msg, _ = recvh.recv_bytes()
+                self._complete(dmsg.parse(resp_ser_msg))
+            except Exception as ex:
+                if not self._closing:
+                    log.debug("There was an exception receiving a DDict response: %s", ex)
+
+    def _recv_streams(self):
+        connector = self._client._stream_return_connector
+        while not self._closing:
+            try:
+                with connector.recvh() as recvh:
+                    resp_ser_msg, _ = recvh.recv_bytes()
+                    self._complete(dmsg.parse(resp_ser_msg), recvh)
+                    # a tossed response or a failed request leaves values unread
+                    _drain_stream(recvh)
+            except Exception as ex:
+                if not self._closing:
+                    log.debug("There was an exception receiving a DDict response: %s", ex)
+
+    def _submit(self, msg, handler, send) -> Future:
+        future = Future()
+        with self._lock:
+            if self._closing:
+                raise DDictError(DragonError.INVALID_OPERATION, "The request dispatcher has been closed.")
+            self._pending[msg.tag] = (future, handler)
+
+        try:
+            send()
+        except Exception:
+            with self._lock:
+                del self._pending[msg.tag]
+            raise
+
+        return future
+
+    def get(self, manager_id: int, pickled_key: bytes, key: object, chkpt_id: int, value_pickler, missing) -> Future:
+        def handler(resp_msg, recvh):
+            self._check_err(resp_msg.err, resp_msg.errInfo)
+            err = resp_msg.errs[0]
+            if err == DragonError.KEY_NOT_FOUND:
+                return missing(key, err=err)
+            self._check_err(err, "Failed to get key in the distributed dictionary.")
+            free_mem = resp_msg.freeMem or manager_id not in self._client._local_managers
+            return self._client._load_value(recvh, free_mem, value_pickler)
+
+        with self._send_lock:
+            msg = dmsg.DDMultiGet(
+                self._client._tag_inc(),
+                self._client._client_id,
+                chkptID=chkpt_id,
+                keys=[pickled_key],
+                respFLI=self._client._serialized_stream_return_connector,
+            )
+            return self._submit(
+                msg, handler, lambda: self._client._send([(msg, None)], self._client._managers[manager_id], buffered=True)
+            )
+
+    def put(self, manager_id: int, pickled_key: bytes, value: object, chkpt_id: int, persist: bool, value_pickler) -> Future:
+        def handler(resp_msg):
+            self._check_err(resp_msg.err, resp_msg.errInfo)
+
+        def send():
+            with self._client._managers[manager_id].sendh(
+                stream_channel=self._client._main_stream_channel, timeout=self._client._timeout
+            ) as sendh:
+                sendh.send_bytes(msg.serialize(), timeout=self._client._timeout)
+                sendh.send_bytes(pickled_key, arg=KEY_HINT, timeout=self._client._timeout)
+                writer = PickleWriteAdapter(sendh=sendh, hint=VALUE_HINT, timeout=self._client._timeout)
+                if value_pickler is not None:
+                    value_pickler.dump(value, file=writer)
+                else:
+                    cloudpickle.dump(value, file=writer, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self._send_lock:
+            msg = dmsg.DDPut(self._client._tag_inc(), self._client._client_id, chkptID=chkpt_id, persist=persist)
+            return self._submit(msg, handler, send)
+
+    def contains(self, manager_id: int, pickled_key: bytes, chkpt_id: int) -> Future:
+        def handler(resp_msg):
+            if resp_msg.err == DragonError.KEY_NOT_FOUND:
+                return False
+            self._check_err(resp_msg.err, resp_msg.errInfo)
+            return True
+
+        with self._send_lock:
+            msg = dmsg.DDContains(self._client._tag_inc(), self._client._client_id, chkptID=chkpt_id, key=pickled_key)
+            return self._submit(
+                msg, handler, lambda: self._client._send([(msg, None)], self._client._managers[manager_id], buffered=True)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closing:
+                return
+            self._closing = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+        # Each receiver thread is woken by a message that no request is waiting on.
+        wakeup = dmsg.DDPutResponse(self._client._tag_inc(), ref=self._client._tag_inc(), err=DragonError.SUCCESS)
+        try:
+            with self._client._buffered_return_connector.sendh(timeout=self._client._timeout) as sendh:
+                sendh.send_bytes(wakeup.serialize(), timeout=self._client._timeout)
+            with self._client._stream_return_connector.sendh(timeout=self._client._timeout) as sendh:
+                sendh.send_bytes(wakeup.serialize(), timeout=self._client._timeout)
+            for t in self._threads:
+                t.join()
+        except Exception as ex:
+            log.debug("There was an exception while closing the request dispatcher: %s", ex)
+
+        for future, _ in pending:
+            future.set_exception(
+                DDictError(DragonError.INVALID_OPERATION, "The request dispatcher was closed before a response arrived.")
+            )
+
+        self._client.detach()
+        self._client._free_process_local_channels()
+
+
 class DDictMappingProxy:
     """
     A read-only live copy of the DDict. This mimics the mapping proxy of a dict.
@@ -1393,6 +1966,7 @@ class DDict:
         persist_path: str = "",
         persister_class: CheckpointPersister = NULLCheckpointPersister,
         streams_per_manager=5,
+        threads_per_manager: int = 1,
     ) -> None:
         """
 
@@ -1427,6 +2001,14 @@ class DDict:
              some clients will use their own stream channels when
              connecting.
 
+        :param threads_per_manager: The number of worker threads each manager
+             uses to serve lookups (get, contains, mget and mcontains). When
+             greater than one, the key space of a manager is sharded across
+             its worker threads so lookups of different keys are served
+             concurrently while all other requests are still served one at a
+             time. Lookups sent by one client without waiting for the
+             previous response may then complete in any order. Defaults to 1.
+
         :param n_nodes: The number of nodes that will have managers
              deployed on them. This must be set to None if a list of policies is
              provided. Defaults to 1.
@@ -1533,7 +2115,7 @@ class DDict:
              be stored. The default is the current working directory.
 
         :param persister_class: A Checkpoint Persister class. One of PosixCheckpointPersister,
-             DAOSCheckpointPersister, a user-defined Persister class, or the default
+             PosixDeltaCheckpointPersister, DAOSCheckpointPersister, a user-defined Persister class, or the default
              NULLCheckpointPersister (which does not persist checkpoints) should be
              specified. Each of these persisters is called when a checkpoint is retired
              from the DDict. The NULLCheckpointPersister frees the storage associated with
@@ -1673,6 +2255,7 @@ class DDict:
                 persist_count,
                 persister_class,
                 streams_per_manager,
+                max(1, threads_per_manager),
             )
 
             self._managers_per_node = managers_per_node
@@ -1735,6 +2318,16 @@ class DDict:
         self._key_pickler = None
         self._value_pickler = None
 
+        # Created on first use by multi-key and asynchronous operations
+        self._stream_return_connector = None
+        self._serialized_stream_return_connector = None
+        self._stream_return_channels = []
+        self._dispatcher = None
+
+        # Opt-in read cache, only consulted while this client knows the DDict is frozen
+        self._read_cache = None
+        self._read_cache_frozen = False
+
         try:
             self._traceit("Connecting to ddict.")
             self._return_channel = Channel.make_process_local()
@@ -1832,6 +2425,14 @@ class DDict:
             self._chkpt_id = self._input_args["restore_from"]
 
     def _free_process_local_channels(self):
+        try:
+            if self._stream_return_connector is not None:
+                self._stream_return_connector.destroy()
+                self._stream_return_connector = None
+            while len(self._stream_return_channels) > 0:
+                self._stream_return_channels.pop().destroy_process_local()
+        except:
+            pass
         try:
             self._return_channel.destroy_process_local()
             self._return_channel = None
@@ -2077,7 +2678,7 @@ class DDict:
 
         return resp_msgs
 
-    def _recv_dmsg_and_val(self, req_msg, key, manager_not_local=False):
+    def _recv_dmsg_and_val(self, req_msg, key, manager_not_local=False, pickled_key=None):
         self._traceit("About to open receive handle on fli to receive response and value.")
         with self._return_connector.recvh(use_main_as_stream_channel=True, timeout=self._timeout) as recvh:
             ref = -1
@@ -2094,28 +2695,9 @@ class DDict:
             elif resp_msg.err != DragonError.SUCCESS:
                 raise DDictError(resp_msg.err, resp_msg.errInfo)
             else:
-                try:
-                    free_mem = resp_msg.freeMem or manager_not_local
-                    log.debug(f"{free_mem=}")
-                    if self._value_pickler is None:
-                        value = cloudpickle.load(
-                            file=PickleReadAdapter(
-                                recvh=recvh, hint=VALUE_HINT, free_mem=free_mem, timeout=self._timeout
-                            )
-                        )
-                    else:
-                        value = self._value_pickler.load(
-                            file=PickleReadAdapter(
-                                recvh=recvh, hint=VALUE_HINT, free_mem=free_mem, timeout=self._timeout
-                            )
-                        )
-                except Exception as e:
-                    tb = traceback.format_exc()
-                    try:
-                        log.info("Exception caught in cloudpickle load: %s \n Traceback: %s", e, tb)
-                    except:
-                        pass
-                    raise RuntimeError(f"Exception caught in cloudpickle load: {e} \n Traceback: {tb}")
+                free_mem = resp_msg.freeMem or manager_not_local
+                log.debug(f"{free_mem=}")
+                value = self._load_value(recvh, free_mem, pickled_key=pickled_key)
 
         return value
 
@@ -2243,6 +2825,7 @@ class DDict:
         if self._destroyed:
             return
 
+        self._close_dispatcher()
         self._traceit("Destroying the ddict.")
 
         self._destroyed = True
@@ -2343,6 +2926,8 @@ class DDict:
 
         """
 
+        self._close_dispatcher()
+
         try:
             if self._destroyed or self._detached or not self._creator:
                 return
@@ -2575,6 +3160,7 @@ class DDict:
         mgr_dd = copy.copy(self)
         mgr_dd._chosen_manager = id
         mgr_dd._creator = False
+        mgr_dd._reset_copied_resources()
         mgr_dd._key_pickler = self._key_pickler
         mgr_dd._value_pickler = self._value_pickler
 
@@ -2596,6 +3182,7 @@ class DDict:
 
         """
         pickler_dd = copy.copy(self)
+        pickler_dd._reset_copied_resources()
         pickler_dd._key_pickler = key_pickler
         pickler_dd._value_pickler = value_pickler
         pickler_dd._chosen_manager = self._chosen_manager
@@ -2658,11 +3245,17 @@ class DDict:
 
         """
         manager_id, pickled_key = self._choose_manager_pickle_key(key)
+        caching = self._read_cache_active()
+        if caching:
+            found, value = self._read_cache.lookup(pickled_key, self._chkpt_id)
+            if found:
+                return value
+
         msg = dmsg.DDGet(self._tag_inc(), self._client_id, chkptID=self._chkpt_id, key=pickled_key)
         self._check_manager_connection(manager_id)
         self._send([(msg, None)], self._managers[manager_id], buffered=True)
         manager_not_local = manager_id not in self._local_managers
-        value = self._recv_dmsg_and_val(msg, key, manager_not_local)
+        value = self._recv_dmsg_and_val(msg, key, manager_not_local, pickled_key=pickled_key if caching else None)
 
         return value
 
@@ -2974,6 +3567,303 @@ class DDict:
         value = self._recv_dmsg_and_val(msg, key, manager_not_local)
         return value
 
+    def _get_stream_return_connector(self):
+        # Unlike the return connector, the stream return connector supplies its own stream
+        # channels so that several managers may respond to this client at the same time.
+        # It is created on first use since most clients never need it.
+        if self._stream_return_connector is None:
+            main_ch = Channel.make_process_local()
+            mgr_ch = Channel.make_process_local()
+            self._stream_return_channels = [main_ch, mgr_ch]
+            strm_chs = [Channel.make_process_local() for _ in range(DDICT_STREAM_RETURN_CHANNELS)]
+            self._stream_return_channels.extend(strm_chs)
+            self._stream_return_connector = fli.FLInterface(main_ch=main_ch, manager_ch=mgr_ch, stream_channels=strm_chs)
+            self._serialized_stream_return_connector = b64encode(self._stream_return_connector.serialize())
+
+        return self._stream_return_connector
+
+    def _load_value(self, recvh, free_mem, value_pickler=None, pickled_key=None):
+        # When a pickled key is given the value is also inserted into the read cache,
+        # which is charged with the number of serialized bytes that were received.
+        if value_pickler is None:
+            value_pickler = self._value_pickler
+
+        try:
+            file = PickleReadAdapter(recvh=recvh, hint=VALUE_HINT, free_mem=free_mem, timeout=self._timeout)
+            if pickled_key is not None:
+                file = CountingReadAdapter(file)
+
+            if value_pickler is None:
+                value = cloudpickle.load(file=file)
+            else:
+                value = value_pickler.load(file=file)
+
+            if pickled_key is not None:
+                self._read_cache.insert(pickled_key, self._chkpt_id, value, file.nbytes)
+
+            return value
+        except Exception as e:
+            tb = traceback.format_exc()
+            try:
+                log.info("Exception caught in cloudpickle load: %s \n Traceback: %s", e, tb)
+            except:
+                pass
+            raise RuntimeError(f"Exception caught in cloudpickle load: {e} \n Traceback: {tb}")
+
+    def _group_keys_by_manager(self, keys: list) -> dict[int, list]:
+        groups = {}
+        for index, key in enumerate(keys):
+            manager_id, pickled_key = self._choose_manager_pickle_key(key)
+            if manager_id not in groups:
+                groups[manager_id] = []
+            groups[manager_id].append((index, pickled_key))
+        return groups
+
+    def mget(self, keys: list) -> list:
+        """
+
+        Get the values associated with a collection of keys. The keys are
+        grouped by the manager that holds them and a single request is sent
+        to each of those managers. All requests are sent before any response
+        is received, so the managers look up their share of the keys in
+        parallel and each one streams back all of its values in one
+        response.
+
+        :param keys: An iterable of keys of stored key/value pairs.
+
+        :returns: A list of the values associated with the keys, in the same
+            order as the keys.
+
+        :raises Exception: Various exceptions can be raised including
+            TimeoutError and KeyError. A KeyError is raised, through
+            __missing__, only after all responses have been received.
+
+        """
+        keys = list(keys)
+        values = [None] * len(keys)
+        missing = []
+        groups = {}
+        caching = self._read_cache_active()
+
+        try:
+            respFLI = self._get_stream_return_connector()
+            for manager_id, group in self._group_keys_by_manager(keys).items():
+                if caching:
+                    uncached = []
+                    for index, pickled_key in group:
+                        found, value = self._read_cache.lookup(pickled_key, self._chkpt_id)
+                        if found:
+                            values[index] = value
+                        else:
+                            uncached.append((index, pickled_key))
+                    group = uncached
+                    if len(group) == 0:
+                        continue
+
+                self._check_manager_connection(manager_id)
+                msg = dmsg.DDMultiGet(
+                    self._tag_inc(),
+                    self._client_id,
+                    chkptID=self._chkpt_id,
+                    keys=[pickled_key for _, pickled_key in group],
+                    respFLI=self._serialized_stream_return_connector,
+                )
+                groups[msg.tag] = (manager_id, group)
+                self._send([(msg, None)], self._managers[manager_id], buffered=True)
+
+            # Managers respond concurrently, each on its own stream channel, so the
+            # responses are handled in whatever order they arrive.
+            while len(groups) > 0:
+                with respFLI.recvh(timeout=self._timeout) as recvh:
+                    resp_ser_msg, _ = recvh.recv_bytes(timeout=self._timeout)
+                    resp_msg = dmsg.parse(resp_ser_msg)
+                    self._traceit("Response: %s", resp_msg)
+                    if resp_msg.ref not in groups:
+                        log.info("Tossing lost/timed out message in DDict Client: %s", resp_msg)
+                        _drain_stream(recvh, self._timeout)
+                        continue
+
+                    manager_id, group = groups.pop(resp_msg.ref)
+                    if resp_msg.err == DragonError.DDICT_CHECKPOINT_RETIRED:
+                        raise DDictCheckpointSyncError(resp_msg.err, resp_msg.errInfo)
+                    elif resp_msg.err != DragonError.SUCCESS:
+                        raise DDictError(resp_msg.err, resp_msg.errInfo)
+
+                    free_mem = resp_msg.freeMem or manager_id not in self._local_managers
+                    for (index, pickled_key), err in zip(group, resp_msg.errs):
+                        if err == DragonError.KEY_NOT_FOUND:
+                            missing.append(index)
+                        elif err != DragonError.SUCCESS:
+                            raise DDictError(err, "Failed to get key in the distributed dictionary.")
+                        else:
+                            values[index] = self._load_value(
+                                recvh, free_mem, pickled_key=pickled_key if caching else None
+                            )
+        except TimeoutError as ex:
+            raise DDictTimeoutError(
+                DragonError.TIMEOUT,
+                f"The operation timed out. This could be a network failure or an out of memory condition.\n{str(ex)}",
+            )
+
+        for index in missing:
+            values[index] = self.__missing__(keys[index], err=DragonError.KEY_NOT_FOUND)
+
+        return values
+
+    def mput(self, mapping: dict, persist: bool = False) -> None:
+        """
+
+        Store a collection of key/value pairs in the current checkpoint. This
+        is a batch put of all the pairs, so the pairs are streamed to each
+        manager over a single request and each manager sends one response
+        once it has stored all of its pairs.
+
+        :param mapping: A dictionary, or an iterable of (key, value) pairs, to store.
+
+        :param persist: If True, then the pairs are stored persistently as with
+            pput. Defaults to False.
+
+        :raises Exception: Various exceptions can be raised including TimeoutError.
+
+        """
+        if self._batch_put_started:
+            raise DDictError(DragonError.INVALID_OPERATION, "Could not perform mput during a batch put.")
+
+        if hasattr(mapping, "items"):
+            mapping = mapping.items()
+
+        self.start_batch_put(persist=persist)
+        try:
+            for key, value in mapping:
+                self._batch_put(key, value, persist)
+        finally:
+            self.end_batch_put()
+
+    def mcontains(self, keys: list) -> list[bool]:
+        """
+
+        Check a collection of keys for membership in the Distributed
+        Dictionary. One request is sent to each manager holding any of the
+        keys and all requests are sent before any response is received.
+
+        :param keys: An iterable of possible keys stored in the DDict.
+
+        :returns: A list of True or False values, in the same order as the keys.
+
+        :raises: Various exceptions can be raised including TimeoutError.
+
+        """
+        keys = list(keys)
+        found = [False] * len(keys)
+        groups = {}
+
+        for manager_id, group in self._group_keys_by_manager(keys).items():
+            self._check_manager_connection(manager_id)
+            msg = dmsg.DDMultiContains(
+                self._tag_inc(),
+                self._client_id,
+                chkptID=self._chkpt_id,
+                keys=[pickled_key for _, pickled_key in group],
+            )
+            groups[msg.tag] = group
+            self._send([(msg, None)], self._managers[manager_id], buffered=True)
+
+        resp_msgs = self._recv_responses(set(groups.keys()), len(groups))
+        for resp_msg in resp_msgs:
+            if resp_msg.err == DragonError.DDICT_CHECKPOINT_RETIRED:
+                raise DDictCheckpointSyncError(resp_msg.err, resp_msg.errInfo)
+            elif resp_msg.err != DragonError.SUCCESS:
+                raise DDictError(resp_msg.err, resp_msg.errInfo)
+
+            for (index, _), err in zip(groups[resp_msg.ref], resp_msg.errs):
+                if err == DragonError.SUCCESS:
+                    found[index] = True
+                elif err != DragonError.KEY_NOT_FOUND:
+                    raise DDictError(err, "Failed to check key in the distributed dictionary.")
+
+        return found
+
+    def _reset_copied_resources(self):
+        # Resources created on first use belong to the client that created them
+        # and are not shared with copies of it.
+        self._stream_return_connector = None
+        self._serialized_stream_return_connector = None
+        self._stream_return_channels = []
+        self._dispatcher = None
+        self._read_cache = None
+        self._read_cache_frozen = False
+
+    def _get_dispatcher(self) -> DDictRequestDispatcher:
+        if self._dispatcher is None:
+            self._dispatcher = DDictRequestDispatcher(self)
+        return self._dispatcher
+
+    def _close_dispatcher(self):
+        try:
+            if self._dispatcher is not None:
+                self._dispatcher.close()
+                self._dispatcher = None
+        except Exception as ex:
+            log.debug("There was an exception while closing the request dispatcher: %s", ex)
+
+    def get_async(self, key: object) -> Future:
+        """
+
+        Request the value associated with a key without waiting for it. Any
+        number of requests may be outstanding at once. They are completed by
+        a dispatcher, started on first use, that receives the responses for
+        all outstanding requests of this client.
+
+        :param key: The key of a stored key/value pair.
+
+        :returns: A concurrent.futures.Future which completes with the value
+            or with the exception that __getitem__ would have raised.
+
+        """
+        manager_id, pickled_key = self._choose_manager_pickle_key(key)
+        return self._get_dispatcher().get(
+            manager_id, pickled_key, key, self._chkpt_id, self._value_pickler, self.__missing__
+        )
+
+    def put_async(self, key: object, value: object, persist: bool = False) -> Future:
+        """
+
+        Store a key/value pair in the current checkpoint without waiting for
+        the manager to confirm it. The key and value are sent before this
+        returns so the value may be changed afterward.
+
+        :param key: The key of the pair. It must be serializable.
+
+        :param value: the value of the pair. It also must be serializable.
+
+        :param persist: If True, then the pair is stored persistently as with
+            pput. Defaults to False.
+
+        :returns: A concurrent.futures.Future which completes with None once
+            the pair is stored or with the exception that __setitem__
+            would have raised.
+
+        """
+        if self._batch_put_started:
+            raise DDictError(DragonError.INVALID_OPERATION, "Could not perform an asynchronous put during a batch put.")
+
+        manager_id, pickled_key = self._choose_manager_pickle_key(key)
+        return self._get_dispatcher().put(manager_id, pickled_key, value, self._chkpt_id, persist, self._value_pickler)
+
+    def contains_async(self, key: object) -> Future:
+        """
+
+        Check whether a key is in the Distributed Dictionary without waiting
+        for the answer.
+
+        :param key: A possible key stored in the DDict.
+
+        :returns: A concurrent.futures.Future which completes with True or False.
+
+        """
+        manager_id, pickled_key = self._choose_manager_pickle_key(key)
+        return self._get_dispatcher().contains(manager_id, pickled_key, self._chkpt_id)
+
     def _keys(self, managers: set[int]) -> Iterator[DDict]:
         try:
             # Since there could be multiple iterators in the same process over a DDict,
@@ -3249,6 +4139,7 @@ class DDict:
 
         # After restoring complete, every client should sync to newest checkpoint ID
         self._chkpt_id = chkpt
+        self._invalidate_read_cache()
 
     def local_len(self) -> int:
         """
@@ -3622,6 +4513,7 @@ class DDict:
         if self._batch_put_started:
             raise DDictError(DragonError.INVALID_OPERATION, "Could not proceed checkpoint during batch put.")
         self._chkpt_id += 1
+        self._invalidate_read_cache()
 
     def rollback(self) -> None:
         """
@@ -3645,6 +4537,7 @@ class DDict:
             except:
                 pass
             self._chkpt_id = 0
+        self._invalidate_read_cache()
 
     def sync_to_newest_checkpoint(self) -> None:
         """
@@ -3680,6 +4573,8 @@ class DDict:
                 raise DDictError(resp_msg.err, resp_msg.errInfo)
             chkpt_id = max(chkpt_id, resp_msg.chkptID)
 
+        if chkpt_id != self._chkpt_id:
+            self._invalidate_read_cache()
         self._chkpt_id = chkpt_id
 
     def advance(self) -> None:
@@ -3894,6 +4789,9 @@ class DDict:
         resp_msg = self._send_receive([(msg, None)], self._main_manager_connection)
         if resp_msg.err != DragonError.SUCCESS:
             raise DDictError(resp_msg.err, resp_msg.errInfo)
+        if not resp_msg.freeze:
+            self._invalidate_read_cache()
+        self._read_cache_frozen = resp_msg.freeze
         return resp_msg.freeze
 
     def freeze(self) -> None:
@@ -3912,15 +4810,19 @@ class DDict:
         for resp in resp_msgs:
             if resp.err != DragonError.SUCCESS:
                 raise DDictError(resp.err, resp.errInfo)
+        self._read_cache_frozen = True
 
     def unfreeze(self) -> None:
         """
 
-        Unfreeze the DDict by resetting the read-only state to False.
+        Unfreeze the DDict by resetting the read-only state to False. Any
+        values held in this client's read cache are discarded.
 
         :raises DDictError: If the DDict could not be unfrozen for some reason.
 
         """
+        self._invalidate_read_cache()
+        self._read_cache_frozen = False
         tag = self._tag_inc()
         msg = dmsg.DDUnFreeze(tag, self._serialized_buffered_return_connector)
         self._check_manager_connection(0)
@@ -3930,6 +4832,63 @@ class DDict:
             if resp.err != DragonError.SUCCESS:
                 raise DDictError("Failed to unfreeze DDict.")
 
+    def enable_read_cache(self, max_bytes: int) -> None:
+        """
+
+        Enable a read cache for this client. While the DDict is frozen, values
+        read by this client with a get or mget are kept in a least recently
+        used cache and repeated reads of the same key are served locally
+        without contacting a manager or unpickling the value again. The cache
+        is keyed by the pickled key and the checkpoint id, is bounded by the
+        serialized size of the cached values, and is discarded when this
+        client calls unfreeze, advance, checkpoint or otherwise changes its
+        checkpoint id.
+
+        The cache belongs to this client only. It is not shared with other
+        clients or with copies returned by manager or pickler. Values returned
+        from the cache are the same objects on every read, so they should not
+        be modified. The client learns that the DDict is frozen when it calls
+        freeze or is_frozen. If another client unfreezes the DDict, this
+        client continues to serve cached values until it checks is_frozen.
+
+        :param max_bytes: The maximum number of serialized value bytes held
+            in the cache.
+
+        :raises ValueError: If max_bytes is not positive.
+
+        """
+        self._read_cache = DDictReadCache(max_bytes)
+        # Checking the state here also records it for the cache.
+        self.is_frozen
+
+    def disable_read_cache(self) -> None:
+        """
+
+        Disable the read cache of this client and discard any cached values.
+
+        """
+        self._read_cache = None
+
+    @property
+    def read_cache(self) -> DDictReadCache:
+        """
+
+        Returns the read cache of this client, or None if it is not enabled.
+        The cache provides hits, misses and nbytes for inspecting how well it
+        is working.
+
+        :returns: The read cache of this client or None.
+
+        """
+        return self._read_cache
+
+    def _read_cache_active(self) -> bool:
+        return self._read_cache is not None and self._read_cache_frozen and not self._batch_put_started
+
+    def _invalidate_read_cache(self):
+        if self._read_cache is not None:
+            self._read_cache.clear()
+
     @property
     def checkpoint_id(self) -> int:
         """
@@ -3960,6 +4919,8 @@ class DDict:
         """
         if chkpt_id < 0:
             raise ValueError("The checkpoint_id cannot be negative.")
+        if chkpt_id != self._chkpt_id:
+            self._invalidate_read_cache()
         self._chkpt_id = chkpt_id
 
     @property
@@ -4019,4 +4980,50 @@ class DDict:
             self._cleanup()
             raise DDictError(resp_msg.err, f"Failed to create dictionary! {resp_msg.errInfo}")
 
-        return resp_msg.managers
\ No newline at end of file
+        return resp_msg.managers
+
+
+class AsyncDDict:
+    """
+    An asyncio interface to a Distributed Dictionary. Every operation is
+    sent as soon as it is called and is awaited without blocking the event
+    loop, so a single thread may have many operations outstanding at once.
+    Sending a request happens on the event loop thread so large values
+    briefly block the loop while they are sent.
+
+    Example usage:
+
+        .. highlight:: python
+        .. code-block:: python
+
+            async def lookup(d, keys):
+                ad = AsyncDDict(d)
+                return await asyncio.gather(*[ad.get(key) for key in keys])
+
+    """
+
+    def __init__(self, ddict: DDict) -> None:
+        """
+
+        Create an asyncio interface over an existing DDict client.
+
+        :param ddict: The DDict to access.
+
+        """
+        self._ddict = ddict
+
+    @property
+    def ddict(self) -> DDict:
+        return self._ddict
+
+    async def get(self, key: object) -> object:
+        return await asyncio.wrap_future(self._ddict.get_async(key))
+
+    async def put(self, key: object, value: object, persist: bool = False) -> None:
+        return await asyncio.wrap_future(self._ddict.put_async(key, value, persist))
+
+    async def contains(self, key: object) -> bool:
+        return await asyncio.wrap_future(self._ddict.contains_async(key))
+
+    async def mget(self, keys: list) -> list:
+        return await asyncio.gather(*[self.get(key) for key in keys])
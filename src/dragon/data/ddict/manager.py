@@ -21,6 +21,7 @@ import socket
 import cloudpickle
 import pickle
 import threading
+from contextlib import contextmanager
 from queue import SimpleQueue
 
 from ...utils import b64decode, b64encode, set_local_kv, host_id, B64, hash as dragon_hash
@@ -140,6 +141,48 @@ class BytesKey:
         return self._key_bytes == other.get_memview()
 
 
+class SharedLock:
+    """
+    A lock that any number of threads may hold in shared mode or that a single
+    thread may hold in exclusive mode. Once a thread asks for exclusive mode,
+    no new shared holders are admitted until it has released the lock.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._num_shared = 0
+        self._exclusive = False
+
+    @contextmanager
+    def shared(self):
+        with self._cond:
+            while self._exclusive:
+                self._cond.wait()
+            self._num_shared += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._num_shared -= 1
+                if self._num_shared == 0:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        with self._cond:
+            while self._exclusive:
+                self._cond.wait()
+            self._exclusive = True
+            while self._num_shared > 0:
+                self._cond.wait()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
+
+
 class Checkpoint:
     """
     Key_allocs maps keys to their memory allocation within the dictionary's pool.
@@ -845,18 +888,14 @@ class ContainsOp(DictOp):
         super().__init__(manager, client_id, chkpt_id, tag)
         self.client_key = client_key
 
-    def perform(self) -> bool:
-        """
-        Returns True when it was performed and false otherwise.
-        Defer the operation if a non-persistent key hasn't been added to the checkpoint.
-        """
+    def _contains(self, client_key: BytesKey) -> DragonError:
         # if request a future checkpoint that hasn't existed in current working set,
         # we look into all checkpoints in current working set
         newest_chkpt_id_chkpt = self.manager._working_set.newest_chkpt_id
         if self.chkpt_id > newest_chkpt_id_chkpt:
-            chkpt = self.manager._working_set.get(self.client_key, newest_chkpt_id_chkpt)
+            chkpt = self.manager._working_set.get(client_key, newest_chkpt_id_chkpt)
         else:
-            chkpt = self.manager._working_set.get(self.client_key, self.chkpt_id)
+            chkpt = self.manager._working_set.get(client_key, self.chkpt_id)
 
         if chkpt is None:
             # We don't wait in contains operation
@@ -864,7 +903,7 @@ class ContainsOp(DictOp):
             log.info("Key Not Found because checkpoint is None.")
 
         else:
-            ec, key_mem = chkpt._contains(self.client_key)
+            ec, key_mem = chkpt._contains(client_key)
             # a future checkpoint shouldn't return a nonpersistent key in newest checkpoint
             if self.chkpt_id > newest_chkpt_id_chkpt and key_mem not in chkpt.persist and self.manager._wait_for_keys:
                 log.info(
@@ -872,6 +911,15 @@ class ContainsOp(DictOp):
                 )
                 ec = DragonError.KEY_NOT_FOUND
 
+        return ec
+
+    def perform(self) -> bool:
+        """
+        Returns True when it was performed and false otherwise.
+        Defer the operation if a non-persistent key hasn't been added to the checkpoint.
+        """
+        ec = self._contains(self.client_key)
+
         resp_msg = dmsg.DDContainsResponse(self.manager._tag_inc(), ref=self.tag, err=ec)
         self.manager._send_msg(resp_msg, self.manager._buffered_client_connections_map[self.client_id])
 
@@ -880,6 +928,112 @@ class ContainsOp(DictOp):
         return True
 
 
+class MultiGetOp(DictOp):
+
+    def __init__(self, manager: object, client_id: int, chkpt_id: int, tag: int, client_keys: list, respFLI: str):
+        super().__init__(manager, client_id, chkpt_id, tag)
+        self.client_keys = client_keys
+        self.respFLI = respFLI
+
+    def _send_error(self, err: DragonError, errInfo: str):
+        resp_msg = dmsg.DDMultiGetResponse(self.manager._tag_inc(), ref=self.tag, err=err, errInfo=errInfo)
+        connection = fli.FLInterface.attach(b64decode(self.respFLI))
+        self.manager._send_dmsg_and_values(resp_msg, connection, None, True, use_main_as_stream_channel=False)
+
+    def perform(self) -> bool:
+        """
+        Returns True when it was performed and false otherwise. The whole
+        set of keys is deferred if any one of them must wait for its
+        checkpoint so that the values are always sent in request order.
+        """
+        try:
+            chkpts = []
+            for client_key in self.client_keys:
+                chkpt = self.manager._working_set.get(client_key, self.chkpt_id)
+                if chkpt is None:
+                    # We are waiting for keys or for some other reason
+                    # cannot perform this yet.
+                    return False
+                chkpts.append(chkpt)
+
+            errs = []
+            values = []
+            for client_key, chkpt in zip(self.client_keys, chkpts):
+                with chkpt.lock:
+                    ec, key_mem = chkpt._contains(client_key)
+                    if ec == DragonError.SUCCESS:
+                        values.append(chkpt.map[key_mem])
+                errs.append(ec)
+
+            free_mem = not self.manager._read_only
+            resp_msg = dmsg.DDMultiGetResponse(
+                self.manager._tag_inc(), ref=self.tag, err=DragonError.SUCCESS, errs=errs, freeMem=free_mem
+            )
+            connection = fli.FLInterface.attach(b64decode(self.respFLI))
+
+            # The values are streamed from a thread so the manager can keep serving other
+            # clients while this client drains the responses of all managers it sent to.
+            # The client supplies the stream channels so several managers may respond at once.
+            t = threading.Thread(
+                target=self.manager._send_dmsg_and_values,
+                args=(
+                    resp_msg,
+                    connection,
+                    values,
+                    True,
+                    self.manager._read_only,
+                ),
+                kwargs={"use_main_as_stream_channel": False},
+            )
+            t.start()
+            self.manager._threads.append(t)
+            self.manager._working_set.update_writer_checkpoint(self.client_id, self.chkpt_id)
+
+            return True
+
+        except DDictCheckpointSyncError as ex:
+            log.info(
+                "Manager %s with PUID=%s could not process multi-get request. %s",
+                self.manager._manager_id,
+                self.manager._puid,
+                ex,
+            )
+            errInfo = f"The requested multi-get operation for checkpoint id {self.chkpt_id} was older than the working set range of {self.manager._working_set.range}"
+            log.info(errInfo)
+            self._send_error(DragonError.DDICT_CHECKPOINT_RETIRED, errInfo)
+            return True
+
+        except Exception as ex:
+            tb = traceback.format_exc()
+            errInfo = f"There was an unexpected exception in multi-get in manager {self.manager._manager_id} with PUID {self.manager._puid}, {self.client_id=}: {ex} \n{tb}"
+            self._send_error(DragonError.FAILURE, errInfo)
+            raise RuntimeError(
+                f"There was an unexpected exception in multi-get in manager {self.manager._manager_id} with PUID {self.manager._puid=}, {self.client_id=}"
+            )
+
+
+class MultiContainsOp(ContainsOp):
+
+    def __init__(self, manager: object, client_id: int, chkpt_id: int, tag: int, client_keys: list):
+        super().__init__(manager, client_id, chkpt_id, tag, None)
+        self.client_keys = client_keys
+
+    def perform(self) -> bool:
+        """
+        Returns True when it was performed and false otherwise.
+        """
+        errs = [self._contains(client_key) for client_key in self.client_keys]
+
+        resp_msg = dmsg.DDMultiContainsResponse(
+            self.manager._tag_inc(), ref=self.tag, err=DragonError.SUCCESS, errs=errs
+        )
+        self.manager._send_msg(resp_msg, self.manager._buffered_client_connections_map[self.client_id])
+
+        self.manager._working_set.update_writer_checkpoint(self.client_id, self.chkpt_id)
+
+        return True
+
+
 class LengthOp(DictOp):
 
     def __init__(self, manager: object, client_id: int, chkpt_id: int, tag: int, respFLI: str):
@@ -1489,6 +1643,11 @@ class Manager:
 
     _DTBL = {}  # dispatch router, keyed by type of message
 
+    # Requests that only look up keys. When the manager runs worker threads these
+    # are sharded by key across the workers and served concurrently while all
+    # other requests are served one at a time by the main thread.
+    _SHARED_OPS = frozenset((dmsg.DDGet, dmsg.DDContains, dmsg.DDMultiGet, dmsg.DDMultiContains))
+
     def __init__(
         self,
         pool_size: int,
@@ -1514,6 +1673,7 @@ class Manager:
             self._persist_count,
             self._persister,
             self._main_streams_per_manager,
+            self._threads_per_manager,
         ) = args
         self._puid = parameters.this_process.my_puid
         self._trace = trace
@@ -1537,6 +1697,12 @@ class Manager:
         self._reattach = True  # Used for dictionary synchronization
         self._threads = []
         self._deferred_ops_lock = threading.Lock()
+        self._tag_lock = threading.Lock()
+
+        # worker threads serving lookups, one work queue per shard of the key space
+        self._ops_lock = SharedLock()
+        self._worker_queues = []
+        self._workers = []
 
         # batch put
         self._num_batch_puts = {}
@@ -1895,8 +2061,9 @@ class Manager:
         set_local_kv(key=self._serialized_main_orc, value=self._serialized_main_connector)
 
     def _tag_inc(self):
-        tag = self._tag
-        self._tag += 1
+        with self._tag_lock:
+            tag = self._tag
+            self._tag += 1
         return tag
 
     def _iter_inc(self):
@@ -1920,10 +2087,11 @@ class Manager:
         return client_mem
 
     def _defer(self, dictop: DictOp):
-        if dictop.chkpt_id not in self._deferred_ops:
-            self._deferred_ops[dictop.chkpt_id] = []
-        self._traceit("Operation deferred: %s", dictop)
-        self._deferred_ops[dictop.chkpt_id].append(dictop)
+        with self._deferred_ops_lock:
+            if dictop.chkpt_id not in self._deferred_ops:
+                self._deferred_ops[dictop.chkpt_id] = []
+            self._traceit("Operation deferred: %s", dictop)
+            self._deferred_ops[dictop.chkpt_id].append(dictop)
 
     def _process_deferred_ops(self, chkpt_id: int):
         with self._deferred_ops_lock:
@@ -2035,7 +2203,13 @@ class Manager:
                                 chkpt.persist.remove(key_mem)
 
     def _send_dmsg_and_values(
-        self, resp_msg, connection, values: list, detach: bool = False, no_copy_read_only: bool = False
+        self,
+        resp_msg,
+        connection,
+        values: list,
+        detach: bool = False,
+        no_copy_read_only: bool = False,
+        use_main_as_stream_channel: bool = True,
     ) -> None:
 
 
@@ -2045,7 +2219,9 @@ class Manager:
             turbo_mode=False
 
         try:
-            with connection.sendh(use_main_as_stream_channel=True, timeout=self._timeout, turbo_mode=turbo_mode) as sendh:
+            with connection.sendh(
+                use_main_as_stream_channel=use_main_as_stream_channel, timeout=self._timeout, turbo_mode=turbo_mode
+            ) as sendh:
                 sendh.send_bytes(resp_msg.serialize(), timeout=self._timeout)
                 if resp_msg.err == DragonError.SUCCESS:
                     for val_list in values:
@@ -2245,7 +2421,62 @@ class Manager:
     def check_for_key_existence_before_free(self, key):
         self._working_set.check_for_key_existence_before_free(key)
 
+    def _start_workers(self):
+        for _ in range(self._threads_per_manager):
+            work_queue = SimpleQueue()
+            t = threading.Thread(target=self._serve_shard, args=(work_queue,), daemon=True)
+            t.start()
+            self._worker_queues.append(work_queue)
+            self._workers.append(t)
+
+    def _stop_workers(self):
+        for work_queue in self._worker_queues:
+            work_queue.put(None)
+        for t in self._workers:
+            t.join(timeout=5)
+        self._worker_queues = []
+        self._workers = []
+
+    def _shard(self, msg) -> int:
+        # Requests for the same key always go to the same worker so they are served in
+        # the order they arrived. Multi-key requests are spread by tag.
+        if isinstance(msg, (dmsg.DDGet, dmsg.DDContains)):
+            return hash(msg.key) % len(self._worker_queues)
+        return msg.tag % len(self._worker_queues)
+
+    def _serve_shard(self, work_queue: SimpleQueue):
+        while True:
+            item = work_queue.get()
+            if item is None:
+                return
+
+            msg, recvh = item
+            try:
+                with self._ops_lock.shared():
+                    self._DTBL[type(msg)][0](self, msg=msg, recvh=recvh)
+                self._traceit("Finished processing: %s", msg)
+            except Exception as ex:
+                tb = traceback.format_exc()
+                log.debug("Caught exception in manager worker:\n%s\n%s", ex, tb)
+
+    def _dispatch(self, msg, recvh):
+        if len(self._worker_queues) == 0:
+            self._DTBL[type(msg)][0](self, msg=msg, recvh=recvh)
+            self._traceit("Finished processing: %s", msg)
+        elif type(msg) in self._SHARED_OPS:
+            # Lookups need nothing more from the receive handle, so it is closed
+            # here and the worker is handed the message alone.
+            recvh.close()
+            self._worker_queues[self._shard(msg)].put((msg, recvh))
+        else:
+            with self._ops_lock.exclusive():
+                self._DTBL[type(msg)][0](self, msg=msg, recvh=recvh)
+            self._traceit("Finished processing: %s", msg)
+
     def run(self):
+        if self._threads_per_manager > 1:
+            self._start_workers()
+
         try:
             while self._serving:
                 with self._main_connector.recvh(destination_pool=self._pool) as recvh:
@@ -2257,8 +2488,7 @@ class Manager:
                         self._traceit("About to process: %s", msg)
 
                         if type(msg) in self._DTBL:
-                            self._DTBL[type(msg)][0](self, msg=msg, recvh=recvh)
-                            self._traceit("Finished processing: %s", msg)
+                            self._dispatch(msg, recvh)
                         else:
                             self._serving = False
                             self._abnormal_termination = True
@@ -2291,6 +2521,8 @@ class Manager:
             tb = traceback.format_exc()
             log.debug("There was an exception in manager:\n%s\n Traceback:\n%s", ex, tb)
 
+        self._stop_workers()
+
         try:
             # Because there are potentially many of DDDestroy requests sent, the
             # orchestrator will get overwhelmed with pending
@@ -3400,6 +3632,67 @@ class Manager:
                 f"There was an unexpected exception in contains in manager {self._manager_id} with PUID {self._puid}"
             )
 
+    @dutil.route(dmsg.DDMultiGet, _DTBL)
+    def multi_get(self, msg: dmsg.DDMultiGet, recvh):
+        try:
+            recvh.close()
+
+        except Exception as ex:
+            tb = traceback.format_exc()
+            errInfo = f"There was an unexpected exception in multi-get in manager {self._manager_id} with PUID {self._puid}, {msg.clientID=}: {ex} \n{tb}"
+            resp_msg = dmsg.DDMultiGetResponse(self._tag_inc(), ref=msg.tag, err=DragonError.FAILURE, errInfo=errInfo)
+            self._send_dmsg_and_values(
+                resp_msg,
+                fli.FLInterface.attach(b64decode(msg.respFLI)),
+                None,
+                True,
+                use_main_as_stream_channel=False,
+            )
+            raise RuntimeError(
+                f"There was an unexpected exception in multi-get in manager {self._manager_id} with PUID {self._puid=}, {msg.clientID=}"
+            )
+
+        keys = [BytesKey(key) for key in msg.keys]
+        multi_get_op = MultiGetOp(self, msg.clientID, msg.chkptID, msg.tag, keys, msg.respFLI)
+
+        if not multi_get_op.perform():
+            self._defer(multi_get_op)
+
+    @dutil.route(dmsg.DDMultiContains, _DTBL)
+    def multi_contains(self, msg: dmsg.DDMultiContains, recvh):
+        try:
+            recvh.close()
+
+            keys = [BytesKey(key) for key in msg.keys]
+            multi_contains_op = MultiContainsOp(self, msg.clientID, msg.chkptID, msg.tag, keys)
+
+            multi_contains_op.perform()
+
+        except DDictCheckpointSyncError as ex:
+            log.info(
+                "Manager %s with PUID=%s could not process multi-contains request. %s", self._manager_id, self._puid, ex
+            )
+            errInfo = f"The requested multi-contains operation for checkpoint id {msg.chkptID} was older than the working set range of {self._working_set.range}"
+            log.info(errInfo)
+            resp_msg = dmsg.DDMultiContainsResponse(
+                self._tag_inc(),
+                ref=msg.tag,
+                err=DragonError.DDICT_CHECKPOINT_RETIRED,
+                errInfo=errInfo,
+            )
+            self._send_msg(resp_msg, self._buffered_client_connections_map[msg.clientID])
+
+        except Exception as ex:
+            tb = traceback.format_exc()
+            errInfo = f"There was an unexpected exception in multi-contains in manager {self._manager_id} with PUID {self._puid}: {ex}\n{tb}"
+            resp_msg = dmsg.DDMultiContainsResponse(
+                self._tag_inc(), ref=msg.tag, err=DragonError.FAILURE, errInfo=errInfo
+            )
+            self._send_msg(resp_msg, self._buffered_client_connections_map[msg.clientID])
+            raise RuntimeError(
+                f"There was an unexpected exception in multi-contains in manager {self._manager_id} with PUID {self._puid}"
+            )
+
     @dutil.route(dmsg.DDLength, _DTBL)
     def get_length(self, msg: dmsg.DDLength, recvh):
         try:
@@ -296,6 +296,7 @@ class Orchestrator:
             self._persist_count,
             self._persister,
             self._streams_per_manager,
+            self._threads_per_manager,
         ) = args
 
         # the dictionary is restarted with previous manager pool
@@ -358,6 +359,7 @@ class Orchestrator:
             self._persist_count,
             self._persister,
             self._streams_per_manager,
+            self._threads_per_manager,
         )
 
         # create managers
@@ -0,0 +1,146 @@
+"""Asyncio API for managing the life-cycle of objects through Global Services
+
+Each coroutine here is the counterpart of a blocking call in
+:mod:`dragon.globalservices.process`, :mod:`dragon.globalservices.channel` or
+:mod:`dragon.globalservices.pool` and raises the same errors. Any number of
+them may be awaited concurrently; their requests are pipelined to Global
+Services and every response resolves the coroutine waiting on its ``ref``.
+
+.. code-block:: python
+
+   import asyncio
+   import dragon.globalservices.aio as gs
+
+   async def fan_out(exe, args, n):
+       descs = await asyncio.gather(*(gs.process_create(exe, "", args, None) for _ in range(n)))
+       return await gs.query_many([d.p_uid for d in descs])
+"""
+
+import asyncio
+import signal
+
+from . import api_setup as das
+from . import process as dproc
+from . import channel as dchannel
+from . import pool as dpool
+
+
+async def process_create(
+    exe,
+    run_dir,
+    args,
+    env,
+    user_name="",
+    options=None,
+    soft=False,
+    stdin=None,
+    stdout=None,
+    stderr=None,
+    group=None,
+    user=None,
+    umask=-1,
+    pipesize=-1,
+    pmi=None,
+    policy=None,
+):
+    """Asks Global Services to create a new process, see :func:`dragon.globalservices.process.create`.
+
+    :return: ProcessDescriptor object
+    :raises: ProcessError if the process could not be created
+    """
+    policy = dproc._prepare_create(user_name, soft, policy)
+
+    req_msg = dproc.get_create_message(
+        exe=exe,
+        run_dir=run_dir,
+        args=args,
+        env=env,
+        user_name=user_name,
+        options={} if options is None else options,
+        stdin=stdin,
+        stdout=stdout,
+        stderr=stderr,
+        group=group,
+        user=user,
+        umask=umask,
+        pipesize=pipesize,
+        pmi=pmi,
+        policy=policy,
+    )
+
+    reply_msg = await das.gs_request_async(req_msg)
+    return dproc._create_result(req_msg, reply_msg, soft)
+
+
+async def process_query(identifier):
+    """Asks Global Services for the ProcessDescriptor of a managed process, see :func:`dragon.globalservices.process.query`.
+
+    :param identifier: string indicating process name or integer indicating a p_uid
+    :return: ProcessDescriptor object
+    :raises: ProcessError if there is no such process
+    """
+    req_msg = dproc._query_message(identifier)
+    reply_msg = await das.gs_request_async(req_msg)
+    return dproc._query_result(req_msg, reply_msg)
+
+
+async def process_kill(identifier, sig=signal.SIGKILL, hide_stderr=False):
+    """Asks Global Services to signal a managed process, see :func:`dragon.globalservices.process.kill`.
+
+    :param identifier: string indicating process name or integer indicating a p_uid
+    :param sig: signal to send, default=signal.SIGKILL
+    :param hide_stderr: whether to suppress stderr from the process with the delivery of this signal
+    :raises: ProcessError if there is no such process, or if the process has not yet started.
+    """
+    req_msg = dproc._kill_message(identifier, sig, hide_stderr)
+    reply_msg = await das.gs_request_async(req_msg)
+    return dproc._kill_result(req_msg, reply_msg)
+
+
+async def process_join(identifier, timeout=None):
+    """Waits for a managed process to exit, see :func:`dragon.globalservices.process.join`.
+
+    :param identifier: string indicating process name or integer indicating a p_uid
+    :param timeout: Timeout in seconds for max time to wait.  None = default, infinite wait
+    :return: The unix exit code from the process, or None if there is a timeout.
+    :raises: ProcessError if there is no such process or some other error has occurred.
+    """
+    req_msg = dproc._join_message(identifier, timeout)
+    reply_msg = await das.gs_request_async(req_msg)
+    return dproc._join_result(identifier, req_msg, reply_msg)
+
+
+async def channel_query(identifier, *, inc_refcnt=False):
+    """Asks Global Services for a ChannelDescriptor, see :func:`dragon.globalservices.channel.query`.
+
+    :param identifier: string indicating channel name or integer indicating a c_uid
+    :param inc_refcnt: bool indicating whether this query is also to inc the refcnt on the channel
+    :return: ChannelDescriptor object
+    :raises: ChannelError if there is no such channel
+    """
+    req_msg = dchannel._query_message(identifier, inc_refcnt)
+    reply_msg = await das.gs_request_async(req_msg)
+    return dchannel._query_result(req_msg, reply_msg)
+
+
+async def pool_query(identifier):
+    """Asks Global Services for a PoolDescriptor, see :func:`dragon.globalservices.pool.query`.
+
+    :param identifier: string indicating pool name or integer indicating a m_uid
+    :return: PoolDescriptor object
+    :raises: PoolError if there is no such pool
+    """
+    req_msg = dpool._query_message(identifier)
+    reply_msg = await das.gs_request_async(req_msg)
+    return dpool._query_result(req_msg, reply_msg)
+
+
+async def query_many(identifiers, query=process_query, *, return_exceptions=False):
+    """Queries many objects at once with all requests outstanding together.
+
+    :param identifiers: iterable of names or uids
+    :param query: coroutine function used for each identifier, defaults to :func:`process_query`
+    :param return_exceptions: return errors in place of descriptors instead of raising the first one
+    :return: list of descriptors in the order of ``identifiers``
+    """
+    return await asyncio.gather(*(query(identifier) for identifier in identifiers), return_exceptions=return_exceptions)
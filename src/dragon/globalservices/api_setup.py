@@ -1,5 +1,6 @@
 """API for managing the life-cycle of objects, such as processes and channels, through Global Services"""
 
+import asyncio
 import logging
 import sys
 import threading
@@ -146,6 +147,100 @@ _RESULTS = dict()
 
 _INFRASTRUCTURE_CONNECTED = False
 
+# tags of requests awaited by asyncio callers and the thread receiving on their
+# behalf while any are outstanding.
+_ASYNC_LOCK = threading.Lock()
+_ASYNC_PENDING = set()
+_ASYNC_RECEIVER = None
+
+
+def _dispatch_response(resp):
+    """Hand a response from global services to whoever is waiting on its ref."""
+
+    try:
+        wakeup = _WAKEUPS.pop(resp.ref)
+    except KeyError:
+        if resp.ref is not None:
+            logging.warning(f"Received unexpected message {resp.ref}")
+    else:
+        # Save response message
+        _RESULTS[resp.ref] = resp
+        # Alert owner response is available
+        wakeup.set()
+
+
+def _hand_off_receiving():
+    """Wake up one remaining waiter so someone takes over receiving."""
+
+    try:
+        # Avoid iteration for thread-safety using CPython
+        _k, _v = _WAKEUPS.popitem()
+    except KeyError:
+        # No one else is waiting for a response
+        pass
+    else:
+        # Re-add the event to _WAKEUPS and set it
+        _WAKEUPS[_k] = _v
+        _v.set()
+
+
+class _AsyncWakeup:
+    """Takes the place of a waiting thread's Event for a request awaited by asyncio."""
+
+    def __init__(self, tag, future):
+        self.tag = tag
+        self.future = future
+
+    def set(self):
+        if self.tag not in _RESULTS:
+            # A receiving thread is handing off receiving to us.
+            _ensure_async_receiver()
+            return
+
+        resp = _RESULTS.pop(self.tag)
+        with _ASYNC_LOCK:
+            _ASYNC_PENDING.discard(self.tag)
+        try:
+            self.future.get_loop().call_soon_threadsafe(self._resolve, resp)
+        except RuntimeError:
+            # the awaiting event loop has been closed
+            pass
+
+    def _resolve(self, resp):
+        if not self.future.done():
+            self.future.set_result(resp)
+
+
+def _receive_for_async():
+    global _ASYNC_RECEIVER
+
+    while True:
+        # PE-44998, as in gs_request. A finalizer calling gs_request on this thread could not take the receive
+        # lock and would wait for a response that only this thread receives.
+        gc.disable()
+        try:
+            with _GS_RECV_LOCK:
+                while _ASYNC_PENDING:
+                    _dispatch_response(dmsg.parse(_GS_RETURN.recv()))
+
+            _hand_off_receiving()
+        finally:
+            gc.enable()
+
+        with _ASYNC_LOCK:
+            if not _ASYNC_PENDING:
+                _ASYNC_RECEIVER = None
+                return
+
+
+def _ensure_async_receiver():
+    global _ASYNC_RECEIVER
+
+    with _ASYNC_LOCK:
+        if _ASYNC_RECEIVER is None and _ASYNC_PENDING:
+            _ASYNC_RECEIVER = threading.Thread(name="gs async receiver", target=_receive_for_async, daemon=True)
+            _ASYNC_RECEIVER.start()
+
 
 def gs_request(req_msg, *, expecting_response=True):
     """Posts a message to GS and gets the response in a thread safe way
@@ -212,29 +307,10 @@ def gs_request(req_msg, *, expecting_response=True):
                 while req_msg.tag not in _RESULTS:
                     # Receive and parse response
                     resp = dmsg.parse(_GS_RETURN.recv())
-
-                    try:
-                        wakeup = _WAKEUPS.pop(resp.ref)
-                    except KeyError:
-                        if resp.ref is not None:
-                            logging.warning(f"Received unexpected message {resp.ref}")
-                    else:
-                        # Save response message
-                        _RESULTS[resp.ref] = resp
-                        # Alert owner response is available
-                        wakeup.set()
+                    _dispatch_response(resp)
 
                 # Wake up last sender to ensure someone takes over receiving
-                try:
-                    # Avoid iteration for thread-safety using CPython
-                    _k, _v = _WAKEUPS.popitem()
-                except KeyError:
-                    # No one else is waiting for a response
-                    pass
-                else:
-                    # Re-add the event to _WAKEUPS and set it
-                    _WAKEUPS[_k] = _v
-                    _v.set()
+                _hand_off_receiving()
 
                 # I suppose we could return here too
                 gc.enable()
@@ -255,6 +331,56 @@ def gs_request(req_msg, *, expecting_response=True):
     return _RESULTS.pop(req_msg.tag)
 
 
+async def gs_request_async(req_msg, *, expecting_response=True):
+    """Posts a message to GS and awaits the response without blocking the event loop
+
+    Any number of requests may be outstanding at once; they are pipelined over
+    the same GS input and return channels used by :func:`gs_request` and each
+    response resolves the future awaiting its ``ref``. While asyncio requests are
+    outstanding, a helper thread receives responses for both kinds of callers.
+
+    Arguments:
+        :param req_msg: request message to send.
+        :param expecting_response: Bool default True, is a response message expected?
+
+    Returns:
+        the reply to the request message
+    """
+
+    with _GS_API_LOCK:
+        if not _INFRASTRUCTURE_CONNECTED:
+            connect_to_infrastructure()
+
+    # PE-44998, as in gs_request, while the request is registered and sent.
+    gc.disable()
+    try:
+        req_msg_bytes = req_msg.serialize()
+
+        if expecting_response:
+            future = asyncio.get_running_loop().create_future()
+            with _ASYNC_LOCK:
+                _ASYNC_PENDING.add(req_msg.tag)
+            _WAKEUPS[req_msg.tag] = _AsyncWakeup(req_msg.tag, future)
+
+        with _GS_SEND_LOCK:
+            try:
+                _GS_INPUT.send(req_msg_bytes)
+            except Exception:
+                if expecting_response:
+                    _WAKEUPS.pop(req_msg.tag, None)
+                    with _ASYNC_LOCK:
+                        _ASYNC_PENDING.discard(req_msg.tag)
+                raise
+    finally:
+        gc.enable()
+
+    if not expecting_response:
+        return
+
+    _ensure_async_receiver()
+    return await future
+
+
 def test_connection_override(
     test_gs_input=None,
     test_gs_return=None,
@@ -114,24 +114,31 @@ def query(identifier, *, inc_refcnt=False):
     :return: ChannelDescriptor object corresponding to specified channel
     :raises: ChannelError if there is no such channel
     """
+    req_msg = _query_message(identifier, inc_refcnt)
+    reply_msg = das.gs_request(req_msg)
+    return _query_result(req_msg, reply_msg)
+
+
+def _query_message(identifier, inc_refcnt):
     if isinstance(identifier, str):
-        req_msg = dmsg.GSChannelQuery(
+        return dmsg.GSChannelQuery(
             tag=das.next_tag(),
             p_uid=this_process.my_puid,
             r_c_uid=das.get_gs_ret_cuid(),
             inc_refcnt=inc_refcnt,
             user_name=identifier,
         )
-    else:
-        req_msg = dmsg.GSChannelQuery(
-            tag=das.next_tag(),
-            p_uid=this_process.my_puid,
-            r_c_uid=das.get_gs_ret_cuid(),
-            inc_refcnt=inc_refcnt,
-            c_uid=int(identifier),
-        )
 
-    reply_msg = das.gs_request(req_msg)
+    return dmsg.GSChannelQuery(
+        tag=das.next_tag(),
+        p_uid=this_process.my_puid,
+        r_c_uid=das.get_gs_ret_cuid(),
+        inc_refcnt=inc_refcnt,
+        c_uid=int(identifier),
+    )
+
+
+def _query_result(req_msg, reply_msg):
     assert isinstance(reply_msg, dmsg.GSChannelQueryResponse)
 
     if dmsg.GSChannelQueryResponse.Errors.SUCCESS == reply_msg.err:
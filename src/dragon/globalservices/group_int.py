@@ -223,6 +223,68 @@ class PMIJobHelper:
             raise StopIteration
 
 
+class ResponseCount:
+    """
+    Number of responses a group operation is still waiting for, kept for
+    each list of the group. The total over all the lists is kept as well,
+    so that checking whether the whole operation has completed does not
+    need to go through every list on each response.
+    """
+
+    def __init__(self, counts=()):
+        self._counts = [int(count) for count in counts]
+        self._total = sum(self._counts)
+
+    def __len__(self):
+        return len(self._counts)
+
+    def __getitem__(self, lst_idx):
+        return self._counts[lst_idx]
+
+    def __iter__(self):
+        return iter(self._counts)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._counts!r})"
+
+    def append(self, count):
+        """Start counting the responses of a new list.
+
+        :param count: number of responses expected for the list
+        :type count: int
+        """
+        self._counts.append(int(count))
+        self._total += int(count)
+
+    def increment(self, lst_idx):
+        """Expect one more response for a list.
+
+        :param lst_idx: index of the list in the group
+        :type lst_idx: int
+        """
+        self._counts[lst_idx] += 1
+        self._total += 1
+
+    def decrement(self, lst_idx):
+        """Count a response received for a list, if one is expected.
+
+        :param lst_idx: index of the list in the group
+        :type lst_idx: int
+        """
+        if self._counts[lst_idx] >= 1:
+            self._counts[lst_idx] -= 1
+            self._total -= 1
+
+    @property
+    def total(self):
+        return self._total
+
+    @property
+    def done(self):
+        """True when no responses are expected for any of the lists."""
+        return self._total == 0
+
+
 class GroupContext:
     """Everything to do with a single group of resources in global services.
 
@@ -272,8 +334,7 @@ class GroupContext:
         ] = group_desc.GroupDescriptor.GroupMember.from_sdict(member)
         # update the count that measures the number of responses we have received when we're creating the resources
         if related_to_create:
-            if self.server.group_resource_count[this_guid][lst_idx] >= 1:
-                self.server.group_resource_count[this_guid][lst_idx] -= 1
+            self.server.group_resource_count[this_guid].decrement(lst_idx)
 
     def _generate_member(self, guid, proc_context, err_msg_type=None, channel_related=False):
         if err_msg_type:
@@ -299,6 +360,50 @@ class GroupContext:
 
         return member
 
+    def _mk_sh_multi_proc_create(self, contexts, pmi_group_info=None, guid=None):
+        """Builds the SHMultiProcessCreate message for the members placed on one node.
+
+        Members that come from the same list of the group are sent as a single
+        SHProcessCreate template plus the fields that differ for each process,
+        which Local Services expands. Members that need channels created along
+        with them are sent in full.
+        """
+        procs = []
+        templates = []
+        template_index = {}
+        members = []
+        for context in contexts:
+            proc = context.shprocesscreate_msg
+            if any((proc.stdin_msg, proc.stdout_msg, proc.stderr_msg, proc.gs_ret_chan_msg)):
+                procs.append(proc)
+                continue
+
+            _, (lst_idx, _) = self.server.resource_to_group_map[context.descriptor.p_uid]
+            idx = template_index.get(lst_idx)
+            if idx is None:
+                idx = template_index[lst_idx] = len(templates)
+                templates.append(proc)
+
+            members.append(
+                dmsg.ProcessCreateMember(
+                    template=idx,
+                    tag=proc.tag,
+                    t_p_uid=proc.t_p_uid,
+                    layout=None if proc.layout == templates[idx].layout else proc.layout,
+                    pmi_info=proc.pmi_info,
+                )
+            )
+
+        return dmsg.SHMultiProcessCreate(
+            tag=self.server.tag_inc(),
+            r_c_uid=dfacts.GS_INPUT_CUID,
+            procs=procs,
+            pmi_group_info=pmi_group_info,
+            guid=guid,
+            templates=templates,
+            members=members,
+        )
+
     def _remove_proc_from_group(self, puid, lst_idx, item_idx):
         # assign a None value to act as a placeholder temporarily
         self.descriptor.sets[lst_idx][item_idx] = None
@@ -316,9 +421,8 @@ class GroupContext:
                 del self.descriptor.sets[lst_idx]
 
         # next, update the helper DS
-        self.server.group_resource_count[g_uid] = []
+        self.server.group_resource_count[g_uid] = ResponseCount([0] * len(self.descriptor.sets))
         for lst_idx, lst in enumerate(self.descriptor.sets):
-            self.server.group_resource_count[g_uid].append(0)
             for item_idx, item in enumerate(lst):
                 self.server.resource_to_group_map[item.uid] = (g_uid, (lst_idx, item_idx))
 
@@ -423,7 +527,7 @@ class GroupContext:
             server.group_table[this_guid] = group_context
             server.group_resource_count[
                 this_guid
-            ] = []  # list of items corresponding to the multiplicity of each list in server.group_resource_list
+            ] = ResponseCount()  # list of items corresponding to the multiplicity of each list in server.group_resource_list
 
             # Maps a given node (local services instance) to a list of
             # ProcessContexts that are to be created on that instance
@@ -546,14 +650,7 @@ class GroupContext:
                 LOG.debug("PMIGroupInfo: %s", pmi_group_info)
 
             for node, contexts in ls_proccontext_map.items():
-                procs = [context.shprocesscreate_msg for context in contexts]
-                shep_req = dmsg.SHMultiProcessCreate(
-                    tag=server.tag_inc(),
-                    r_c_uid=dfacts.GS_INPUT_CUID,
-                    pmi_group_info=pmi_group_info,
-                    procs=procs,
-                    guid=this_guid,
-                )
+                shep_req = group_context._mk_sh_multi_proc_create(contexts, pmi_group_info, this_guid)
                 shep_hdl = server.shep_inputs[node]
                 server.pending_sends.put((shep_hdl, shep_req.serialize()))
                 LOG.debug(f"request %s to shep %d", shep_req, node)
@@ -640,18 +737,14 @@ class GroupContext:
         succeeded, guid, lst_idx = self._construction_helper(msg)
 
         # if we have received responses for all the members of this list
-        if self.server.group_resource_count[guid][lst_idx] == 0:
-            # next, check if we have responses for the other lists as well
-            if all(item == 0 for item in self.server.group_resource_count[guid]):
-                # Update the group descriptor state to active
-                self.descriptor.state = group_desc.GroupDescriptor.State.ACTIVE
-
-                # now we can send the GSGroupCreateResponse msg back to the client
-                response = dmsg.GSGroupCreateResponse(
-                    tag=self.server.tag_inc(), ref=self.request.tag, desc=self.descriptor
-                )
-                self.reply_channel.send(response.serialize())
-                LOG.debug(f"create response sent, tag {response.tag} ref {response.ref} pending cleared")
+        if self.server.group_resource_count[guid].done:
+            # Update the group descriptor state to active
+            self.descriptor.state = group_desc.GroupDescriptor.State.ACTIVE
+
+            # now we can send the GSGroupCreateResponse msg back to the client
+            response = dmsg.GSGroupCreateResponse(tag=self.server.tag_inc(), ref=self.request.tag, desc=self.descriptor)
+            self.reply_channel.send(response.serialize())
+            LOG.debug(f"create response sent, tag {response.tag} ref {response.ref} pending cleared")
 
         # since this server.pending entry was related to a particular outbound tag
         # and a specific process creation, return the value returned from
@@ -952,10 +1045,7 @@ class GroupContext:
                             raise GroupError("The Group should include at least one member in each subgroup.")
 
                     for node, contexts in ls_proccontext_map.items():
-                        procs = [context.shprocesscreate_msg for context in contexts]
-                        shep_req = dmsg.SHMultiProcessCreate(
-                            tag=server.tag_inc(), r_c_uid=dfacts.GS_INPUT_CUID, procs=procs
-                        )
+                        shep_req = groupctx._mk_sh_multi_proc_create(contexts)
                         shep_hdl = server.shep_inputs[node]
                         server.pending_sends.put((shep_hdl, shep_req.serialize()))
                         LOG.debug(f"request %s to shep %d", shep_req, node)
@@ -985,21 +1075,19 @@ class GroupContext:
         succeeded, guid, lst_idx = self._construction_helper(msg)
 
         # if we have received responses for all the members of this list
-        if self.server.group_resource_count[guid][lst_idx] == 0:
-            # next, check if we have responses for the other lists as well
-            if all(item == 0 for item in self.server.group_resource_count[guid]):
-                # Update the group descriptor state to active
-                self.descriptor.state = group_desc.GroupDescriptor.State.ACTIVE
-
-                # now we can send the GSGroupCreateAddToResponse msg back to the client
-                response = dmsg.GSGroupCreateAddToResponse(
-                    tag=self.server.tag_inc(),
-                    ref=self.request.tag,
-                    err=dmsg.GSGroupCreateAddToResponse.Errors.SUCCESS,
-                    desc=self.descriptor,
-                )
-                self.reply_channel.send(response.serialize())
-                LOG.debug(f"addition response sent, tag {response.tag} ref {response.ref} pending cleared")
+        if self.server.group_resource_count[guid].done:
+            # Update the group descriptor state to active
+            self.descriptor.state = group_desc.GroupDescriptor.State.ACTIVE
+
+            # now we can send the GSGroupCreateAddToResponse msg back to the client
+            response = dmsg.GSGroupCreateAddToResponse(
+                tag=self.server.tag_inc(),
+                ref=self.request.tag,
+                err=dmsg.GSGroupCreateAddToResponse.Errors.SUCCESS,
+                desc=self.descriptor,
+            )
+            self.reply_channel.send(response.serialize())
+            LOG.debug(f"addition response sent, tag {response.tag} ref {response.ref} pending cleared")
 
         # since this server.pending entry was related to a particular outbound tag
         # and a specific process creation, return the value returned from
@@ -1344,7 +1432,7 @@ class GroupContext:
                                     ].desc.state = process_desc.ProcessDescriptor.State.PENDING
                                     server.pending[outbound_tag] = groupctx.complete_kill
                                     server.group_to_pending_resource_map[(outbound_tag, target_uid)] = pctx
-                                    server.group_resource_count[target_uid][lst_idx] += 1
+                                    server.group_resource_count[target_uid].increment(lst_idx)
                                     if not issued_pendings:
                                         issued_pendings = True
                                 else:
@@ -1445,27 +1533,23 @@ class GroupContext:
         # kill response to the client or counting how many kill responses
         # we have received, as this is an intermediate step of destroy()
         if not self.destroy_called:
-            if self.server.group_resource_count[guid][lst_idx] >= 1:
-                self.server.group_resource_count[guid][lst_idx] -= 1
+            self.server.group_resource_count[guid].decrement(lst_idx)
 
             # if we have received responses for all the members, we are ready
             # to send the group kill response back to the client
-            # if we have received responses for all the processess of this list
-            if self.server.group_resource_count[guid][lst_idx] == 0:
-                # next, check if we have responses for the other lists as well
-                if all(item == 0 for item in self.server.group_resource_count[guid]):
-                    # we follow the same pattern with groups as we do with processes
-                    if self.descriptor.state == self.descriptor.State.PENDING:
-                        self.descriptor.state = self.descriptor.State.ACTIVE
-
-                    rm = gsgkr(
-                        tag=self.server.tag_inc(),
-                        ref=self.destroy_request.tag,
-                        err=gsgkr.Errors.SUCCESS,
-                        desc=self.descriptor,
-                    )
-                    LOG.debug(f"sending kill response to request {self.destroy_request}: {rm}")
-                    self.reply_channel.send(rm.serialize())
+            if self.server.group_resource_count[guid].done:
+                # we follow the same pattern with groups as we do with processes
+                if self.descriptor.state == self.descriptor.State.PENDING:
+                    self.descriptor.state = self.descriptor.State.ACTIVE
+
+                rm = gsgkr(
+                    tag=self.server.tag_inc(),
+                    ref=self.destroy_request.tag,
+                    err=gsgkr.Errors.SUCCESS,
+                    desc=self.descriptor,
+                )
+                LOG.debug(f"sending kill response to request {self.destroy_request}: {rm}")
+                self.reply_channel.send(rm.serialize())
 
         return succeeded
 
@@ -1527,13 +1611,12 @@ class GroupContext:
                 groupctx.destroy_request = msg
                 groupctx.reply_channel = reply_channel
 
-                server.group_destroy_resource_count[target_uid] = []
+                server.group_destroy_resource_count[target_uid] = ResponseCount([0] * len(groupdesc.sets))
 
                 ls_kill_context_map: Dict[int, List[ProcessContext]] = defaultdict(list)
 
                 # init the destruction of the group's members
                 for lst_idx, lst in enumerate(groupdesc.sets):
-                    server.group_destroy_resource_count[target_uid].append(0)
 
                     for item_idx, item in enumerate(lst):
                         # TODO: implement for other types of resources apart from processes
@@ -1568,7 +1651,7 @@ class GroupContext:
                                 groupctx.destroy_called = True
                                 server.pending[outbound_tag] = groupctx.complete_kill
 
-                                server.group_destroy_resource_count[target_uid][lst_idx] += 1
+                                server.group_destroy_resource_count[target_uid].increment(lst_idx)
                             else:
                                 # the process is either unknown or dead or pending
                                 groupdesc.sets[lst_idx][item_idx].state = process_desc.ProcessDescriptor.State.DEAD
@@ -1584,7 +1667,7 @@ class GroupContext:
                 # in this case, all the processes were already dead or no pending continuation
                 # was issued and we need to send a response to the client
                 # e.g., kill was called prior to destroy and the kill request completed successully (SHProcessExit was sent)
-                if all(item == 0 for item in server.group_destroy_resource_count[target_uid]):
+                if server.group_destroy_resource_count[target_uid].done:
                     groupdesc.state = gds.DEAD
                     if groupctx.pmi_job_helper:
                         groupctx.pmi_job_helper.cleanup()
@@ -1627,31 +1710,28 @@ class GroupContext:
 
         guid, (lst_idx, item_idx) = self.server.resource_to_group_map[this_puid]
 
-        if self.server.group_destroy_resource_count[guid][lst_idx] >= 1:
-            self.server.group_destroy_resource_count[guid][lst_idx] -= 1
+        self.server.group_destroy_resource_count[guid].decrement(lst_idx)
 
         del self.server.resource_to_group_map[this_puid]
 
         # if we have received responses for all the members, we are ready
         # to send the group destroy response to the client
         # if we have received responses for all the members of this list
-        if self.server.group_destroy_resource_count[guid][lst_idx] == 0:
-            # next, check if we have responses for the other lists as well
-            if all(item == 0 for item in self.server.group_destroy_resource_count[guid]):
-                self.descriptor.state = self.descriptor.State.DEAD
-                if self.pmi_job_helper:
-                    self.pmi_job_helper.cleanup()
-                rm = gsgdr(
-                    tag=self.server.tag_inc(),
-                    ref=self.destroy_request.tag,
-                    err=gsgdr.Errors.SUCCESS,
-                    desc=self.descriptor,
-                )
-                LOG.debug(f"sending destroy response to request {self.destroy_request}: {rm}")
-                self.reply_channel.send(rm.serialize())
+        if self.server.group_destroy_resource_count[guid].done:
+            self.descriptor.state = self.descriptor.State.DEAD
+            if self.pmi_job_helper:
+                self.pmi_job_helper.cleanup()
+            rm = gsgdr(
+                tag=self.server.tag_inc(),
+                ref=self.destroy_request.tag,
+                err=gsgdr.Errors.SUCCESS,
+                desc=self.descriptor,
+            )
+            LOG.debug(f"sending destroy response to request {self.destroy_request}: {rm}")
+            self.reply_channel.send(rm.serialize())
 
-                # no need to keep this entry since the group is destroyed
-                del self.server.group_destroy_resource_count[guid]
+            # no need to keep this entry since the group is destroyed
+            del self.server.group_destroy_resource_count[guid]
 
         return
 
@@ -23,6 +23,12 @@ class ResourceLayout:
 class PolicyEvaluator:
     """
     Based on a list of NodeDescriptors, evaluate policies and apply them
+
+    The evaluator keeps count of the processes Global Services has started on
+    each node and not yet seen exit, through ``process_started`` and
+    ``process_exited``. The LEAST_LOADED, BIN_PACK and SPREAD distributions
+    place each policy by that load, relative to the CPUs of the node, using
+    the strategies in ``self.strategies``.
     """
 
     def __init__(self, nodes: list[NodeDescriptor], default_policy=None):
@@ -33,6 +39,56 @@ class PolicyEvaluator:
         )
         self.overprovision = False  # Should make this into a parameter flag to allow/disallow it?
         self.cur_node = 0
+        self.num_procs = {node.h_uid: 0 for node in nodes}  # key = h_uid, value = running processes on the node
+        self._proc_nodes = {}  # key = p_uid, value = h_uid of the node the process was started on
+        self._evaluated = {}  # key = h_uid, value = layouts given to the node by the current call to evaluate
+        self.strategies = {
+            Policy.Distribution.LEAST_LOADED: self._least_loaded,
+            Policy.Distribution.BIN_PACK: self._bin_pack,
+            Policy.Distribution.SPREAD: self._spread,
+        }
+
+    def process_started(self, p_uid, h_uid):
+        """
+        Account for a process started on a node
+
+        :param p_uid: p_uid of the process
+        :param h_uid: h_uid of the node the process runs on
+        """
+        if p_uid not in self._proc_nodes:
+            self._proc_nodes[p_uid] = h_uid
+            self.num_procs[h_uid] = self.num_procs.get(h_uid, 0) + 1
+
+    def process_exited(self, p_uid):
+        """
+        Stop accounting for a process that exited or failed to start. Processes not started
+        through ``process_started`` are ignored.
+
+        :param p_uid: p_uid of the process
+        """
+        h_uid = self._proc_nodes.pop(p_uid, None)
+        if h_uid is not None:
+            self.num_procs[h_uid] -= 1
+
+    def _load(self, node) -> float:
+        """
+        Processes running on a node, plus those already placed on it by this evaluation, per CPU
+        """
+        procs = self.num_procs.get(node.h_uid, 0) + self._evaluated.get(node.h_uid, 0)
+        return procs / max(node.num_cpus, 1)
+
+    def _least_loaded(self) -> NodeDescriptor:
+        return min(self.nodes, key=self._load)
+
+    def _bin_pack(self) -> NodeDescriptor:
+        # min() and max() both return the first of equal nodes, so nodes fill up in order
+        open_nodes = [node for node in self.nodes if self._load(node) < 1]
+        if not open_nodes:
+            return self._least_loaded()
+        return max(open_nodes, key=self._load)
+
+    def _spread(self) -> NodeDescriptor:
+        return min(self.nodes, key=lambda node: (self._evaluated.get(node.h_uid, 0), self._load(node)))
 
     def _find_next_open(self, cur_idx):
         """
@@ -71,6 +127,7 @@ class PolicyEvaluator:
         numa_node = 0
         layouts.append(ResourceLayout(node.h_uid, node.host_name, node_specified, numa_node, cpu_affinity, gpu_affinity, env_str))
         node.num_policies += 1
+        self._evaluated[node.h_uid] = self._evaluated.get(node.h_uid, 0) + 1
 
     def _node_by_id(self, host_id) -> NodeDescriptor:
         """
@@ -130,6 +187,9 @@ class PolicyEvaluator:
         if distribution == Policy.Distribution.DEFAULT:
             distribution = Policy.Distribution.ROUNDROBIN
 
+        if distribution in self.strategies:
+            return (False, self.strategies[distribution]())
+
         # RoundRobin defaults to always overprovisioning, it will always just assign a policy to "next node"
         # TODO: Mimic some overprovisioning logic like in BLOCK for roundrobin to find the next empty slot?
         if distribution == Policy.Distribution.ROUNDROBIN:
@@ -190,6 +250,7 @@ class PolicyEvaluator:
         """
 
         layouts = []
+        self._evaluated = {}
 
         # Iterate over policies and apply them through node descriptors
         for p in policies:
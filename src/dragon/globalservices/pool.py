@@ -86,16 +86,23 @@ def query(identifier):
     :return: PoolDescriptor object corresponding to specified pool
     :raises: PoolError if there is no such pool
     """
+    req_msg = _query_message(identifier)
+    reply_msg = das.gs_request(req_msg)
+    return _query_result(req_msg, reply_msg)
+
+
+def _query_message(identifier):
     if isinstance(identifier, str):
-        req_msg = dmsg.GSPoolQuery(
+        return dmsg.GSPoolQuery(
             tag=das.next_tag(), p_uid=this_process.my_puid, r_c_uid=das.get_gs_ret_cuid(), user_name=identifier
         )
-    else:
-        req_msg = dmsg.GSPoolQuery(
-            tag=das.next_tag(), p_uid=this_process.my_puid, r_c_uid=das.get_gs_ret_cuid(), m_uid=int(identifier)
-        )
 
-    reply_msg = das.gs_request(req_msg)
+    return dmsg.GSPoolQuery(
+        tag=das.next_tag(), p_uid=this_process.my_puid, r_c_uid=das.get_gs_ret_cuid(), m_uid=int(identifier)
+    )
+
+
+def _query_result(req_msg, reply_msg):
     assert isinstance(reply_msg, dmsg.GSPoolQueryResponse)
 
     if dmsg.GSPoolQueryResponse.Errors.SUCCESS == reply_msg.err:
@@ -466,6 +466,38 @@ def create(
     :param policy: If a policy other than the global default is to be used for this process.
     :return: ProcessDescriptor object
     """
+    policy = _prepare_create(user_name, soft, policy)
+
+    if options is None:
+        options = {}
+
+    log.debug("creating GSProcessCreate")
+    req_msg = get_create_message(
+        exe=exe,
+        run_dir=run_dir,
+        args=args,
+        env=env,
+        user_name=user_name,
+        options=options,
+        stdin=stdin,
+        stdout=stdout,
+        stderr=stderr,
+        group=group,
+        user=user,
+        umask=umask,
+        pipesize=pipesize,
+        pmi=pmi,
+        policy=policy,
+    )
+
+    reply_msg = das.gs_request(req_msg)
+    log.debug("got GSProcessCreateResponse")
+
+    return _create_result(req_msg, reply_msg, soft)
+
+
+def _prepare_create(user_name, soft, policy):
+    """Validate a create request and return the policy to apply to it"""
     global _capture_stdout_conn, _capture_stderr_conn, _capture_stdout_chan, _capture_stderr_chan
 
     if policy is not None:
@@ -512,34 +544,13 @@ def create(
         stop_capturing_child_mp_output()
         mk_capture_threads()
 
-    if options is None:
-        options = {}
-
     if soft and not user_name:
         raise ProcessError("soft create requires a user supplied process name")
 
-    log.debug("creating GSProcessCreate")
-    req_msg = get_create_message(
-        exe=exe,
-        run_dir=run_dir,
-        args=args,
-        env=env,
-        user_name=user_name,
-        options=options,
-        stdin=stdin,
-        stdout=stdout,
-        stderr=stderr,
-        group=group,
-        user=user,
-        umask=umask,
-        pipesize=pipesize,
-        pmi=pmi,
-        policy=policy,
-    )
+    return policy
 
-    reply_msg = das.gs_request(req_msg)
-    log.debug("got GSProcessCreateResponse")
 
+def _create_result(req_msg, reply_msg, soft):
     assert isinstance(reply_msg, dmsg.GSProcessCreateResponse)
 
     ec = dmsg.GSProcessCreateResponse.Errors
@@ -723,16 +734,39 @@ def query(identifier):
     :return: ProcessDescriptor object corresponding to specified managed process
     :raises: ProcessError if there is no such process
     """
+    req_msg = _query_message(identifier)
+    reply_msg = das.gs_request(req_msg)
+    return _query_result(req_msg, reply_msg)
+
+
+def query_list(identifiers):
+    """Asks Global Services for the ProcessDescriptors of many managed processes in one request
+
+    :param identifiers: list of integers indicating p_uids
+    :return: list of ProcessDescriptor objects in the order of identifiers, with None for each unknown p_uid
+    """
+    req_msg = dmsg.GSProcessQueryList(
+        tag=das.next_tag(), p_uid=this_process.my_puid, r_c_uid=das.get_gs_ret_cuid(), t_p_uids=identifiers
+    )
+
+    reply_msg = das.gs_request(req_msg)
+    assert isinstance(reply_msg, dmsg.GSProcessQueryListResponse)
+
+    return [None if desc is None else _create_stdio_connections(desc) for desc in reply_msg.descriptors]
+
+
+def _query_message(identifier):
     if isinstance(identifier, str):
-        req_msg = dmsg.GSProcessQuery(
+        return dmsg.GSProcessQuery(
             tag=das.next_tag(), p_uid=this_process.my_puid, r_c_uid=das.get_gs_ret_cuid(), user_name=identifier
         )
-    else:
-        req_msg = dmsg.GSProcessQuery(
-            tag=das.next_tag(), p_uid=this_process.my_puid, r_c_uid=das.get_gs_ret_cuid(), t_p_uid=int(identifier)
-        )
 
-    reply_msg = das.gs_request(req_msg)
+    return dmsg.GSProcessQuery(
+        tag=das.next_tag(), p_uid=this_process.my_puid, r_c_uid=das.get_gs_ret_cuid(), t_p_uid=int(identifier)
+    )
+
+
+def _query_result(req_msg, reply_msg):
     assert isinstance(reply_msg, dmsg.GSProcessQueryResponse)
 
     if dmsg.GSProcessQueryResponse.Errors.SUCCESS == reply_msg.err:
@@ -787,8 +821,14 @@ def kill(identifier, sig=signal.SIGKILL, hide_stderr=False):
     :return: Nothing if successful
     :raises: ProcessError if there is no such process, or if the process has not yet started.
     """
+    req_msg = _kill_message(identifier, sig, hide_stderr)
+    reply_msg = das.gs_request(req_msg)
+    return _kill_result(req_msg, reply_msg)
+
+
+def _kill_message(identifier, sig, hide_stderr):
     if isinstance(identifier, str):
-        req_msg = dmsg.GSProcessKill(
+        return dmsg.GSProcessKill(
             tag=das.next_tag(),
             p_uid=this_process.my_puid,
             r_c_uid=das.get_gs_ret_cuid(),
@@ -796,17 +836,18 @@ def kill(identifier, sig=signal.SIGKILL, hide_stderr=False):
             sig=int(sig),
             hide_stderr=hide_stderr,
         )
-    else:
-        req_msg = dmsg.GSProcessKill(
-            tag=das.next_tag(),
-            p_uid=this_process.my_puid,
-            r_c_uid=das.get_gs_ret_cuid(),
-            t_p_uid=int(identifier),
-            sig=int(sig),
-            hide_stderr=hide_stderr,
-        )
 
-    reply_msg = das.gs_request(req_msg)
+    return dmsg.GSProcessKill(
+        tag=das.next_tag(),
+        p_uid=this_process.my_puid,
+        r_c_uid=das.get_gs_ret_cuid(),
+        t_p_uid=int(identifier),
+        sig=int(sig),
+        hide_stderr=hide_stderr,
+    )
+
+
+def _kill_result(req_msg, reply_msg):
     assert isinstance(reply_msg, dmsg.GSProcessKillResponse)
 
     ec = dmsg.GSProcessKillResponse.Errors
@@ -831,7 +872,12 @@ def join(identifier, timeout=None):
     :return: The unix exit code from the process, or None if there is a timeout.
     :raises: ProcessError if there is no such process or some other error has occurred.
     """
+    req_msg = _join_message(identifier, timeout)
+    reply_msg = das.gs_request(req_msg)
+    return _join_result(identifier, req_msg, reply_msg)
 
+
+def _join_message(identifier, timeout):
     if timeout is None:
         msg_timeout = -1
     elif timeout < 0:
@@ -840,23 +886,24 @@ def join(identifier, timeout=None):
         msg_timeout = int(1000000 * timeout)
 
     if isinstance(identifier, str):
-        req_msg = dmsg.GSProcessJoin(
+        return dmsg.GSProcessJoin(
             tag=das.next_tag(),
             p_uid=this_process.my_puid,
             r_c_uid=das.get_gs_ret_cuid(),
             timeout=msg_timeout,
             user_name=identifier,
         )
-    else:
-        req_msg = dmsg.GSProcessJoin(
-            tag=das.next_tag(),
-            p_uid=this_process.my_puid,
-            r_c_uid=das.get_gs_ret_cuid(),
-            timeout=msg_timeout,
-            t_p_uid=int(identifier),
-        )
 
-    reply_msg = das.gs_request(req_msg)
+    return dmsg.GSProcessJoin(
+        tag=das.next_tag(),
+        p_uid=this_process.my_puid,
+        r_c_uid=das.get_gs_ret_cuid(),
+        timeout=msg_timeout,
+        t_p_uid=int(identifier),
+    )
+
+
+def _join_result(identifier, req_msg, reply_msg):
     assert isinstance(reply_msg, dmsg.GSProcessJoinResponse)
 
     ec = dmsg.GSProcessJoinResponse.Errors
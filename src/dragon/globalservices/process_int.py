@@ -261,6 +261,7 @@ class ProcessContext:
                 msg.policy = Policy.global_policy()
 
             which_node, node_huid = server.choose_shepherd(msg)
+            server.process_policy_evaluator.process_started(this_puid, node_huid)
 
             context = cls(
                 server=server, request=msg, reply_channel=reply_channel, p_uid=this_puid, node=which_node, h_uid=node_huid
@@ -518,6 +519,7 @@ class ProcessContext:
             succeeded = True
         elif dmsg.SHProcessCreateResponse.Errors.FAIL == msg.err:
             self.descriptor.state = process_desc.ProcessDescriptor.State.DEAD
+            self.server.process_policy_evaluator.process_exited(self.descriptor.p_uid)
 
             # clean up tables - don't keep ProcessDescriptor stuff around
             # for things that never were alive.
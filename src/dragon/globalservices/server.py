@@ -80,6 +80,10 @@ class GlobalContext(object):
 
     DTBL = {}  # dispatch table for handlers, no metadata
 
+    # Messages the main loop handles back to back, when they are already waiting,
+    # before it goes back to pending sends and join timeouts
+    MSGS_PER_ITERATION = 64
+
     def __init__(self, test_gs_stdout=None):
         self.process_table = dict()  # key = p_uid, value = ProcessContext
         self.channel_table = dict()  # key = c_uid, value = ChannelContext
@@ -103,10 +107,10 @@ class GlobalContext(object):
         )  # used for pending resources of a group, key = (msg tag, g_uid), value = resource_context
         self.group_resource_count = (
             dict()
-        )  # key = g_uid, value = list of items corresponding to the multiplicity of each list item in GroupDescriptor.sets
+        )  # key = g_uid, value = group_int.ResponseCount of the responses pending for each list item in GroupDescriptor.sets
         self.group_destroy_resource_count = (
             dict()
-        )  # is applied only when destroy has been called, key = g_uid, value = list of items corresponding to the multiplicity of each list item in GroupDescriptor.sets
+        )  # is applied only when destroy has been called, key = g_uid, value = group_int.ResponseCount of the kills pending for each list item in GroupDescriptor.sets
 
         self.group_destroy_pmix_count = (
             dict()
@@ -453,9 +457,30 @@ class GlobalContext(object):
         """
         return self._resolve_uid(name, g_uid, self.group_names, self.group_table, "group", "g_uid")
 
+    def next_join_deadline(self):
+        """Earliest deadline of the pending process, process list and channel joins.
+
+        :return: the deadline as a time.time() value, or None if no join has a timeout
+        :rtype: float
+        """
+        deadlines = (
+            self.pending_join.next_deadline(),
+            self.pending_join_list.next_deadline(),
+            self.pending_channel_joins.next_deadline(),
+        )
+        return min((deadline for deadline in deadlines if deadline is not None), default=None)
+
     def do_timeouts(self):
         log = self._process_logger
 
+        # nothing to time out yet, which is the common case on each turn of the main loop
+        nearest_deadline = self.next_join_deadline()
+        if nearest_deadline is None:
+            return None
+        now = time.time()
+        if nearest_deadline > now:
+            return nearest_deadline - now
+
         gspjr = dmsg.GSProcessJoinResponse
         timed_out = self.pending_join.get_timed_out()
         for join_request in timed_out:
@@ -496,30 +521,10 @@ class GlobalContext(object):
             self.pending_channel_joins.remove_one(name, req_msg)
             log.debug(f"timed out join response to {req_msg!s}: {rm!s}")
 
-        join_deadline = self.pending_join.next_deadline()
-        join_list_deadline = self.pending_join_list.next_deadline()
-        channel_join_deadline = self.pending_channel_joins.next_deadline()
-
-        if join_deadline is None and join_list_deadline is None and channel_join_deadline is None:
+        nearest_deadline = self.next_join_deadline()
+        if nearest_deadline is None:
             return None
-        elif join_deadline is None and join_list_deadline is None:
-            return max(0, channel_join_deadline - time.time())
-        elif join_deadline is None and channel_join_deadline is None:
-            return max(0, join_list_deadline - time.time())
-        elif join_list_deadline is None and channel_join_deadline is None:
-            return max(0, join_deadline - time.time())
-        elif join_deadline is None:
-            nearest_deadline = min(join_list_deadline, channel_join_deadline)
-            return max(0, nearest_deadline - time.time())
-        elif join_list_deadline is None:
-            nearest_deadline = min(join_deadline, channel_join_deadline)
-            return max(0, nearest_deadline - time.time())
-        elif channel_join_deadline is None:
-            nearest_deadline = min(join_deadline, join_list_deadline)
-            return max(0, nearest_deadline - time.time())
-        else:
-            nearest_deadline = min(join_deadline, join_list_deadline, channel_join_deadline)
-            return max(0, nearest_deadline - time.time())
+        return max(0, nearest_deadline - time.time())
 
     def run_global_server(
         self,
@@ -582,9 +587,17 @@ class GlobalContext(object):
             else:
                 next_timeout = None
 
+            # Handle the messages that are already waiting in one go, so that a burst of
+            # responses, e.g. for a large group, does not pay for the pending sends and
+            # timeouts above on every message.
             the_msg = self.next_msg(next_timeout)
-            if the_msg is not None:
+            msgs_handled = 0
+            while the_msg is not None:
                 self.dispatch(the_msg)
+                msgs_handled += 1
+                if msgs_handled >= self.MSGS_PER_ITERATION or self._state == self.RunState.SHUTTING_DOWN:
+                    break
+                the_msg = self.next_msg(0)
 
         log = self._shutdown_logger
         log.info("main loop exit")
@@ -814,6 +827,27 @@ class GlobalContext(object):
         reply_channel.send(rm.serialize())
         log.debug(f"response to {msg!s}: {rm!s}")
 
+    @dutil.route(dmsg.GSProcessQueryList, DTBL)
+    def handle_process_query_list(self, msg):
+        log = self._process_logger
+        log.debug(f"handling {msg}")
+
+        reply_channel = self.get_reply_handle(msg)
+
+        descriptors = []
+        for t_p_uid in msg.t_p_uids:
+            if t_p_uid in self.process_table:
+                descriptors.append(self.process_table[t_p_uid].descriptor)
+            else:
+                descriptors.append(None)
+
+        rm = dmsg.GSProcessQueryListResponse(
+            tag=self.tag_inc(), ref=msg.tag, err=dmsg.GSProcessQueryListResponse.Errors.SUCCESS, descriptors=descriptors
+        )
+
+        reply_channel.send(rm.serialize())
+        log.debug(f"response to {msg!s}: {rm!s}")
+
     @dutil.route(dmsg.GSProcessKill, DTBL)
     def handle_process_kill(self, msg):
         log = self._process_logger
@@ -973,6 +1007,7 @@ class GlobalContext(object):
         ctx = self.process_table[msg.p_uid]
         ctx.descriptor.state = process_desc.ProcessDescriptor.State.DEAD
         ctx.descriptor.ecode = msg.exit_code
+        self.process_policy_evaluator.process_exited(msg.p_uid)
 
         if ctx.request.options.make_inf_channels:
             clean_chan = dmsg.GSChannelDestroy(
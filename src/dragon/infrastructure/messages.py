@@ -28,6 +28,11 @@ The top level of the JSON structure will be a dictionary (map) where the '_tc' k
 corresponding to an element of the ``dragon.messages.MsgTypes`` enumeration class.  The other fields of this
 map will be defined on a message by message basis.
 
+On the wire, a message whose JSON string is shorter than ``COMPRESSION_THRESHOLD`` is sent as compact JSON
+text. Longer messages are zlib compressed and base64 encoded. Messages exchanged with C code are CapnProto
+encoded instead. The first character of a serialized message identifies which of these encodings was used,
+so ``parse`` selects the matching decoder without trying the others first.
+
 The canonical form of the message will be taken on the JSON level, not the string level.  This means that
 messages should not be compared or sorted as strings.  Internally the Python interface will construct inbound
 messages into class objects of distinct type according to the '_tc' field in the initializer by using a
@@ -129,6 +134,7 @@ Format of Messages List
 """
 
 import sys
+import copy
 import enum
 import json
 import zlib
@@ -442,6 +448,12 @@ class MessageTypes(enum.Enum):
     PG_STOP = enum.auto()  #:
     PG_CLOSE = enum.auto()  #:
     PMIX_FENCE_MSG = enum.auto()  #:
+    DD_MULTI_GET = enum.auto()  #:
+    DD_MULTI_GET_RESPONSE = enum.auto()  #:
+    DD_MULTI_CONTAINS = enum.auto()  #:
+    DD_MULTI_CONTAINS_RESPONSE = enum.auto()  #:
+    GS_PROCESS_QUERY_LIST = enum.auto()  #:
+    GS_PROCESS_QUERY_LIST_RESPONSE = enum.auto()  #:
 
 
 @enum.unique
@@ -513,6 +525,45 @@ class PMIProcessInfo:
             raise ValueError(f"Error deserializing {cls.__name__} {d=}") from exc
 
 
+@dataclass
+class ProcessCreateMember:
+    """
+    Fields of one process in an SHMultiProcessCreate message that differ from
+    the SHProcessCreate template the process is created from.
+    """
+
+    template: int  # index of the template in SHMultiProcessCreate.templates
+    tag: int
+    t_p_uid: int
+    layout: Optional[ResourceLayout] = None  # None when the same as the template
+    pmi_info: Optional[PMIProcessInfo] = None
+
+    @classmethod
+    def fromdict(cls, d):
+        try:
+            d = dict(d)
+            if isinstance(d.get("layout"), dict):
+                d["layout"] = ResourceLayout(**d["layout"])
+            if isinstance(d.get("pmi_info"), dict):
+                d["pmi_info"] = PMIProcessInfo.fromdict(d["pmi_info"])
+            return cls(**d)
+        except Exception as exc:
+            raise ValueError(f"Error deserializing {cls.__name__} {d=}") from exc
+
+
+# Serialized infrastructure messages at least this long are compressed and base64
+# encoded. Shorter ones are sent as compact JSON since compressing and encoding
+# them costs more time than the bytes saved.
+COMPRESSION_THRESHOLD = 4096
+
+# The leading character of a serialized message identifies its encoding, so parse
+# can choose the decoder directly. Base64 encoded zlib data always begins with
+# "e" because the zlib header byte is 0x78. CapnProto messages begin with a
+# little-endian segment count, which is far too small to be either of these.
+JSON_LEAD = ord("{")
+COMPRESSED_JSON_LEAD = ord("e")
+
+
 class InfraMsg(object):
     """Common base for all messages.
 
@@ -598,7 +649,11 @@ class InfraMsg(object):
         return json.dumps(self.get_sdict())
 
     def serialize(self):
-        return b64encode(zlib.compress(json.dumps(self.get_sdict()).encode("utf-8")))
+        jstring = json.dumps(self.get_sdict(), separators=(",", ":"))
+        if len(jstring) < COMPRESSION_THRESHOLD:
+            return jstring
+
+        return b64encode(zlib.compress(jstring.encode("utf-8")))
 
     def __str__(self):
         cn = self.__class__.__name__
@@ -3405,6 +3460,148 @@ class DDDeregisterClientResponse(CapNProtoResponseMsg):
         super().__init__(tag, ref, err, errInfo)
 
 
+class DDMultiGet(CapNProtoMsg):
+    _tc = MessageTypes.DD_MULTI_GET
+
+    def __init__(self, tag, clientID, chkptID, keys, respFLI):
+        super().__init__(tag)
+        self._clientID = clientID
+        self._chkptID = chkptID
+        self._keys = keys
+        self._respFLI = respFLI
+
+    def get_sdict(self):
+        rv = super().get_sdict()
+        rv["clientID"] = self._clientID
+        rv["chkptID"] = self._chkptID
+        rv["keys"] = self._keys
+        rv["respFLI"] = self._respFLI
+        return rv
+
+    def builder(self):
+        cap_msg = super().builder()
+        client_msg = cap_msg.init(self.capnp_name)
+        client_msg.clientID = self._clientID
+        client_msg.chkptID = self._chkptID
+        msg_keys = client_msg.init("keys", len(self._keys))
+        for i in range(len(self._keys)):
+            msg_keys[i] = self._keys[i]
+        client_msg.respFLI = self._respFLI
+        return cap_msg
+
+    @property
+    def clientID(self):
+        return self._clientID
+
+    @property
+    def chkptID(self):
+        return self._chkptID
+
+    @property
+    def keys(self):
+        return self._keys
+
+    @property
+    def respFLI(self):
+        return self._respFLI
+
+
+class DDMultiGetResponse(CapNProtoResponseMsg):
+    _tc = MessageTypes.DD_MULTI_GET_RESPONSE
+
+    def __init__(self, tag, ref, err, errInfo="", errs=[], freeMem=False):
+        super().__init__(tag, ref, err, errInfo)
+        self._errs = errs
+        self._freeMem = freeMem
+
+    def get_sdict(self):
+        rv = super().get_sdict()
+        rv["errs"] = self._errs
+        rv["freeMem"] = self._freeMem
+        return rv
+
+    def builder(self):
+        cap_msg = super().builder()
+        client_msg = cap_msg.init(self.capnp_name)
+        msg_errs = client_msg.init("errs", len(self._errs))
+        for i in range(len(self._errs)):
+            msg_errs[i] = DragonError(self._errs[i]).value
+        client_msg.freeMem = self._freeMem
+        return cap_msg
+
+    @property
+    def errs(self):
+        return self._errs
+
+    @property
+    def freeMem(self):
+        return self._freeMem
+
+
+class DDMultiContains(CapNProtoMsg):
+    _tc = MessageTypes.DD_MULTI_CONTAINS
+
+    def __init__(self, tag, clientID, chkptID, keys):
+        super().__init__(tag)
+        self._clientID = clientID
+        self._chkptID = chkptID
+        self._keys = keys
+
+    def get_sdict(self):
+        rv = super().get_sdict()
+        rv["clientID"] = self._clientID
+        rv["chkptID"] = self._chkptID
+        rv["keys"] = self._keys
+        return rv
+
+    def builder(self):
+        cap_msg = super().builder()
+        client_msg = cap_msg.init(self.capnp_name)
+        client_msg.clientID = self._clientID
+        client_msg.chkptID = self._chkptID
+        msg_keys = client_msg.init("keys", len(self._keys))
+        for i in range(len(self._keys)):
+            msg_keys[i] = self._keys[i]
+        return cap_msg
+
+    @property
+    def clientID(self):
+        return self._clientID
+
+    @property
+    def chkptID(self):
+        return self._chkptID
+
+    @property
+    def keys(self):
+        return self._keys
+
+
+class DDMultiContainsResponse(CapNProtoResponseMsg):
+    _tc = MessageTypes.DD_MULTI_CONTAINS_RESPONSE
+
+    def __init__(self, tag, ref, err, errInfo="", errs=[]):
+        super().__init__(tag, ref, err, errInfo)
+        self._errs = errs
+
+    def get_sdict(self):
+        rv = super().get_sdict()
+        rv["errs"] = self._errs
+        return rv
+
+    def builder(self):
+        cap_msg = super().builder()
+        client_msg = cap_msg.init(self.capnp_name)
+        msg_errs = client_msg.init("errs", len(self._errs))
+        for i in range(len(self._errs)):
+            msg_errs[i] = DragonError(self._errs[i]).value
+        return cap_msg
+
+    @property
+    def errs(self):
+        return self._errs
+
+
 # class setup methodology:
 # 1) the _tc class variable has the value of the typecode
 # for this class.
@@ -3735,6 +3932,66 @@ class GSProcessQueryResponse(InfraMsg):
         return rv
 
 
+class GSProcessQueryList(InfraMsg):
+    """
+    Refer to :ref:`Common Fields<cfs>`
+    for a description of the message structure.
+
+    Asks for the descriptors of many processes in one request.
+    """
+
+    _tc = MessageTypes.GS_PROCESS_QUERY_LIST
+
+    def __init__(self, tag, p_uid, r_c_uid, t_p_uids=None, _tc=None):
+        super().__init__(tag)
+        self.p_uid = int(p_uid)
+        self.r_c_uid = int(r_c_uid)
+
+        if t_p_uids is None:
+            self.t_p_uids = []
+        else:
+            self.t_p_uids = [int(t_p_uid) for t_p_uid in t_p_uids]
+
+    def get_sdict(self):
+        rv = super().get_sdict()
+        rv["p_uid"] = self.p_uid
+        rv["r_c_uid"] = self.r_c_uid
+        rv["t_p_uids"] = self.t_p_uids
+        return rv
+
+
+class GSProcessQueryListResponse(InfraMsg):
+    """
+    Refer to :ref:`Common Fields<cfs>` for a
+    description of the message structure.
+
+    The descriptors are in the order of the p_uids in the request,
+    with None in place of each p_uid Global Services does not know.
+    """
+
+    _tc = MessageTypes.GS_PROCESS_QUERY_LIST_RESPONSE
+
+    @enum.unique
+    class Errors(enum.Enum):
+        SUCCESS = 0  #: Always succeeds
+
+    def __init__(self, tag, ref, err, descriptors=None, _tc=None):
+        super().__init__(tag, ref, err)
+
+        self.descriptors = []
+        if descriptors is not None:
+            for descriptor in descriptors:
+                if descriptor is None or isinstance(descriptor, process_desc.ProcessDescriptor):
+                    self.descriptors.append(descriptor)
+                else:
+                    self.descriptors.append(process_desc.ProcessDescriptor.from_sdict(descriptor))
+
+    def get_sdict(self):
+        rv = super().get_sdict()
+        rv["descriptors"] = [None if desc is None else desc.get_sdict() for desc in self.descriptors]
+        return rv
+
+
 class GSProcessKill(InfraMsg):
     """
     Refer to :ref:`Common Fields<cfs>` for a description of
@@ -6506,6 +6763,14 @@ class SHProcessExit(InfraMsg):
 
 
 class SHMultiProcessCreate(InfraMsg):
+    """
+    Refer to :ref:`Common Fields<cfs>` for a description of the message structure.
+
+    Processes are given either in full in procs or as members, each of which
+    names one of the templates and the few fields that differ from it. Local
+    Services expands the members into full SHProcessCreate messages, see expand().
+    """
+
     _tc = MessageTypes.SH_MULTI_PROCESS_CREATE
 
     def __init__(
@@ -6516,6 +6781,8 @@ class SHMultiProcessCreate(InfraMsg):
         pmi_group_info: Optional[PMIGroupInfo] = None,
         pmix_ddict_desc: str = None,
         guid: int = None,
+        templates: List[Union[Dict, SHProcessCreate]] = None,
+        members: List[Union[Dict, ProcessCreateMember]] = None,
         _tc=None,
     ):
         super().__init__(tag)
@@ -6540,8 +6807,43 @@ class SHMultiProcessCreate(InfraMsg):
             else:
                 raise ValueError("proc is not a supported type %s", type(proc))
 
+        self.templates = []
+        for template in templates or []:
+            if isinstance(template, SHProcessCreate):
+                self.templates.append(template)
+            elif isinstance(template, dict):
+                self.templates.append(SHProcessCreate.from_sdict(template))
+            else:
+                raise ValueError("template is not a supported type %s", type(template))
+
+        self.members = []
+        for member in members or []:
+            if isinstance(member, ProcessCreateMember):
+                self.members.append(member)
+            elif isinstance(member, dict):
+                self.members.append(ProcessCreateMember.fromdict(member))
+            else:
+                raise ValueError("member is not a supported type %s", type(member))
+
         self.pmix_ddict_desc = pmix_ddict_desc
 
+    def expand(self) -> List[SHProcessCreate]:
+        """All processes to create, those given in full followed by the members
+        expanded from their templates.
+        """
+        procs = list(self.procs)
+        for member in self.members:
+            proc = copy.copy(self.templates[member.template])
+            proc.tag = member.tag
+            proc.t_p_uid = member.t_p_uid
+            proc.env = dict(proc.env)
+            proc.env[dfacts.ENV_MY_PUID] = str(member.t_p_uid)
+            if member.layout is not None:
+                proc.layout = member.layout
+            proc.pmi_info = member.pmi_info
+            procs.append(proc)
+        return procs
+
     def get_sdict(self):
         rv = super().get_sdict()
         rv["r_c_uid"] = self.r_c_uid
@@ -6549,6 +6851,8 @@ class SHMultiProcessCreate(InfraMsg):
         rv["procs"] = [proc.get_sdict() for proc in self.procs]
         rv["pmix_ddict_desc"] = self.pmix_ddict_desc
         rv["guid"] = self.guid
+        rv["templates"] = [template.get_sdict() for template in self.templates]
+        rv["members"] = [asdict(member) for member in self.members]
         return rv
 
 
@@ -8508,39 +8812,42 @@ all_message_classes = mk_all_message_classes_set()
 mt_dispatch = {cls._tc.value: cls for cls in all_message_classes}
 
 
-def parse(serialized, restrict=None):
-    try:
-        # if a compressed message, decompress to get the service message
-        try:
-            decoded = b64decode(serialized)
-        except Exception:
-            decoded = serialized
+def _parse_json(serialized, lead):
+    if not isinstance(serialized, (str, bytes)):
+        serialized = bytes(serialized)
 
-        try:
-            jstring = zlib.decompress(decoded)
-        except zlib.error:
-            jstring = decoded
+    if lead == COMPRESSED_JSON_LEAD:
+        if isinstance(serialized, bytes):
+            serialized = serialized.decode("ascii")
+        serialized = zlib.decompress(b64decode(serialized))
 
-        sdict = json.loads(jstring)
-        typecode = sdict["_tc"]
-        if restrict:
-            assert typecode in restrict
+    return json.loads(serialized)
 
-        return mt_dispatch[typecode].from_sdict(sdict)
 
-    except Exception as json_exception:
-        try:
-            # A DecodeError probaby indicates this is a CapnProto message so we'll
-            # try parsing it that way before returning
-
-            msg = CapNProtoMsg.deserialize(serialized)
+def parse(serialized, restrict=None):
+    if isinstance(serialized, str):
+        lead = ord(serialized[0]) if len(serialized) > 0 else None
+    else:
+        lead = serialized[0] if len(serialized) > 0 else None
 
+    try:
+        if lead == JSON_LEAD or lead == COMPRESSED_JSON_LEAD:
+            sdict = _parse_json(serialized, lead)
+            typecode = sdict["_tc"]
             if restrict:
-                assert msg.tc in restrict
+                assert typecode in restrict
 
-            return msg
-        except Exception as ex:
-            tb = traceback.format_exc()
-            raise TypeError(
-                f'The message "{serialized}" could not be parsed.\nJSON Parsing Error Message:{json_exception}\nCapnProto Parsing Error Message:{ex}\n Traceback {tb}'
-            )
+            return mt_dispatch[typecode].from_sdict(sdict)
+
+        msg = CapNProtoMsg.deserialize(serialized)
+
+        if restrict:
+            assert msg.tc in restrict
+
+        return msg
+
+    except Exception as ex:
+        tb = traceback.format_exc()
+        raise TypeError(
+            f'The message "{serialized}" could not be parsed.\nParsing Error Message:{ex}\n Traceback {tb}'
+        )
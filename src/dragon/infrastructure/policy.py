@@ -268,11 +268,17 @@ class Policy:
 
         ROUNDROBIN
         BLOCK
+        LEAST_LOADED - Node running the fewest processes per CPU
+        BIN_PACK - Most loaded node that still has a free CPU, so that other nodes stay idle
+        SPREAD - Node given the fewest processes of the same request, then the least loaded one
         DEFAULT - Defaults to roundrobin
         """
 
         ROUNDROBIN = enum.auto()
         BLOCK = enum.auto()
+        LEAST_LOADED = enum.auto()
+        BIN_PACK = enum.auto()
+        SPREAD = enum.auto()
         DEFAULT = enum.auto()
 
     # TODO: Not implemented
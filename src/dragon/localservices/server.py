@@ -17,6 +17,7 @@ from .. import fli
 from ..rc import DragonError
 
 from .. import pmod
+from . import zygote
 from .. import utils as dutils
 from ..infrastructure import messages as dmsg
 from ..infrastructure import util as dutil
@@ -101,6 +102,12 @@ class PopenProps(subprocess.Popen):
         # XXX be configured to set their own affinity as appropriate.
 
 
+class ZygotePopenProps(zygote.ZygotePopenMixin, PopenProps):
+    def __init__(self, zyg: zygote.Zygote, props: ProcessProps, *args, **kwds):
+        self._zygote = zyg
+        super().__init__(props, *args, **kwds)
+
+
 class PMIxGroupResources:
     def __init__(self, ls_ch=None, ret_ch=None, buffered_resp_ch=None):
         self._pmix_server_up = False
@@ -629,6 +636,7 @@ class LocalServer:
         self.apt = {}  # active process table. key: pid, value PopenProps obj
         self.puid2pid = {}  # key: p_uid, value pid
         self.apt_lock = threading.Lock()
+        self.zygote = None
 
         self.shutdown_sig = threading.Event()
         self.gs_shutdown_sig = threading.Event()
@@ -772,6 +780,10 @@ class LocalServer:
         # clean outstanding processes
         self._clean_procs()
 
+        if self.zygote is not None:
+            self.zygote.stop(self.QUIESCE_TIME)
+            self.zygote = None
+
         # We do not destroy channels because we are shutting down
         # and channels are in pools and are implicitly destroyed
         # right below. Destroying channels this late in shutdown
@@ -829,6 +841,15 @@ class LocalServer:
         self.ls_in = ls_in
         self.is_primary = is_primary
 
+        if zygote.enabled():
+            try:
+                self.zygote = zygote.Zygote()
+                log.info("started zygote pid=%s" % self.zygote.pid)
+                for name, err in self.zygote.preload_failures:
+                    log.warning("zygote could not preload %s: %s" % (name, err))
+            except (OSError, zygote.ZygoteError) as ex:
+                log.warning("could not start zygote, Python processes will be exec'd: %s" % ex)
+
         th = threading.Thread
 
         threads = [
@@ -1244,12 +1265,14 @@ class LocalServer:
         success, fail = mk_response_pairs(dmsg.SHMultiProcessCreateResponse, msg.tag)
         failed = False
         err_info = ""
+        # Members sent as templates are expanded here rather than by GS
+        procs = msg.expand()
         # Stand up the PMIx Server if PMIx backend has been requested
         try:
             base_rank = None
             log.debug("PMI group info multi proc create: %s", msg.pmi_group_info)
             if msg.pmi_group_info.backend == dfacts.PMIBackend.PMIX:
-                my_node_id = msg.procs[0].pmi_info.pmix_nid  # This node's unique value
+                my_node_id = procs[0].pmi_info.pmix_nid  # This node's unique value
 
                 # Parse the ranks->nidlist dict and get all the unique node ids out of it:
                 pmix_nidlist = list(set(msg.pmi_group_info.nid_map.values()))
@@ -1316,7 +1339,7 @@ class LocalServer:
             pass
 
         responses = []
-        for process_create_msg in msg.procs:
+        for process_create_msg in procs:
             response = self.create_process(
                 msg=process_create_msg, pmi_group_info=msg.pmi_group_info, base_rank=base_rank, guid=msg.guid
             )
@@ -1535,7 +1558,7 @@ class LocalServer:
 
             with self.apt_lock:  # race with death watcher; hold lock to get process in table.
                 # The stdout_conn and stderr_conn will be filled in just below.
-                the_proc = PopenProps(
+                the_proc = self._popen(
                     ProcessProps(
                         p_uid=msg.t_p_uid,
                         critical=False,
@@ -1558,6 +1581,7 @@ class LocalServer:
                     stderr=stderr,
                     cwd=working_dir,
                     env=the_env,
+                    allow_zygote=not msg.pmi_info,
                 )
 
                 stdout_connector.add_proc_info(the_proc)
@@ -1613,6 +1637,22 @@ class LocalServer:
 
         return resp_msg
 
+    def _popen(self, props: ProcessProps, args: list, allow_zygote: bool = True, **kwds) -> PopenProps:
+        """Start a process, forking it from the zygote when the zygote can serve it.
+
+        If the zygote fails it is shut down and this and all later processes are exec'd.
+        """
+        if allow_zygote and self.zygote is not None and self.zygote.serves(args[0], args[1:], kwds.get("env")):
+            try:
+                return ZygotePopenProps(self.zygote, props, args, **kwds)
+            except zygote.ZygoteError as ex:
+                log = logging.getLogger("LS.create process")
+                log.warning("zygote failed, Python processes will be exec'd: %s" % ex)
+                self.zygote.stop(0)
+                self.zygote = None
+
+        return PopenProps(props, args, **kwds)
+
     @dutil.route(dmsg.SHMultiProcessKill, _DTBL)
     def kill_group(self, msg: dmsg.SHMultiProcessKill) -> None:
         log = logging.getLogger("LS.kill_group")
@@ -1845,7 +1885,9 @@ class LocalServer:
     def watch_death(self):
         """Thread monitors the demise of child processes of this process.
 
-        Not all children do we care about; only the ones in our process group.
+        Not all children do we care about; only the ones in the process table. Local Services is a
+        child subreaper when the zygote is enabled, so orphaned descendants in any process group are
+        reparented to it. They are reaped here too, so they do not stay zombies, and otherwise ignored.
 
         :return: None, but exits on self.check_shutdown()
         """
@@ -1855,7 +1897,7 @@ class LocalServer:
 
         while not self.check_shutdown():
             try:
-                died_pid, exit_status = os.waitpid(0, os.WNOHANG)
+                died_pid, exit_status = os.waitpid(-1, os.WNOHANG)
             except ChildProcessError:  # no child processes at the moment
                 # There is no error here. There just isn't a child process.
                 died_pid, exit_status = (0, 0)
@@ -1877,7 +1919,7 @@ class LocalServer:
                         proc = self.apt.pop(died_pid)
                         self.puid2pid.pop(proc.props.p_uid)
                     except KeyError:
-                        log.warning("unknown child pid %s exited!" % died_pid)
+                        log.debug("reaped pid %s, which is not a managed process" % died_pid)
                         proc = None
 
                 if proc is None:
@@ -0,0 +1,348 @@
+"""Pre-forked Python process server used by Local Services.
+
+Starting a Dragon Python process normally means exec'ing a fresh interpreter
+that re-imports dragon, capnp and the message definitions before running any
+user code. When enabled with the ``DRAGON_LS_ZYGOTE`` environment variable,
+Local Services instead starts one zygote per node that has those modules (and
+any listed in ``DRAGON_LS_ZYGOTE_PRELOAD``) already imported. Requests to start
+``python -c <code>`` are served by forking the zygote, so the new process
+shares the preloaded pages copy-on-write and starts running ``<code>``
+immediately. A process whose environment would make its interpreter start
+differently from the zygote's, such as a different PYTHONPATH, or whose PATH
+finds a different python, is exec'd instead.
+
+Workers are double-forked and Local Services marks itself as a child
+subreaper, so every worker is reparented to Local Services. They are therefore
+waited on, signalled and monitored exactly like processes started with
+:class:`subprocess.Popen`.
+
+Modules to preload must not create per-process state at import time, such as
+threads or attachments derived from the launch parameters of one process.
+"""
+
+import ctypes
+import importlib
+import os
+import pickle
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import types
+
+ZYGOTE_ENV = "DRAGON_LS_ZYGOTE"
+ZYGOTE_PRELOAD_ENV = "DRAGON_LS_ZYGOTE_PRELOAD"
+
+_DEFAULT_PRELOAD = (
+    "cloudpickle",
+    "dragon.infrastructure.messages",
+    "dragon.globalservices.api_setup",
+    "dragon.native.process",
+)
+
+# Environment variables that change what importing dragon does. The zygote
+# imports dragon without them and each worker applies them for itself.
+_IMPORT_TIME_ENV = ("DRAGON_PATCH_MP", "DRAGON_PATCH_TORCH")
+
+# Environment variables, besides the PYTHON* ones, that the interpreter reads
+# while starting. A forked worker has already started with the zygote's.
+_STARTUP_ENV = ("LANG", "LC_ALL", "LC_CTYPE")
+
+_PR_SET_CHILD_SUBREAPER = 36
+_MAX_REQUEST = 4 * 2**20
+_STDIO = (0, 1, 2)
+
+
+class ZygoteError(Exception):
+    pass
+
+
+def enabled() -> bool:
+    """Whether Local Services should start a zygote on this node."""
+    return os.environ.get(ZYGOTE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _startup_env(env):
+    return {name: value for name, value in env.items() if name.startswith("PYTHON") or name in _STARTUP_ENV}
+
+
+def _set_child_subreaper():
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.prctl(_PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+
+
+class Zygote:
+    """Local Services side handle to the zygote process.
+
+    :param preload: additional module names for the zygote to import
+    :type preload: list of str, optional
+    :param subreaper: make this process a child subreaper, which it must be for the processes the zygote
+        forks to be its children, defaults to True
+    :type subreaper: bool, optional
+    """
+
+    def __init__(self, preload=None, subreaper=True):
+        if preload is None:
+            preload = [m for m in os.environ.get(ZYGOTE_PRELOAD_ENV, "").split(",") if m]
+
+        if subreaper:
+            _set_child_subreaper()
+
+        self._lock = threading.Lock()
+        self._sock, zygote_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+
+        env = dict(os.environ)
+        for name in _IMPORT_TIME_ENV:
+            env.pop(name, None)
+        self._startup_env = _startup_env(env)
+
+        try:
+            self._proc = subprocess.Popen(
+                [sys.executable, "-m", __name__, str(zygote_sock.fileno())] + list(preload),
+                pass_fds=(zygote_sock.fileno(),),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=env,
+            )
+        finally:
+            zygote_sock.close()
+
+        self._executable = os.path.realpath(sys.executable)
+
+        # The zygote reports which modules it failed to import once it is ready.
+        ready = self._sock.recv(_MAX_REQUEST)
+        if not ready:
+            self.stop()
+            raise ZygoteError("zygote exited during startup")
+        self.preload_failures = pickle.loads(ready)
+
+    @property
+    def pid(self):
+        return self._proc.pid
+
+    def serves(self, exe: str, args: list, env: dict = None) -> bool:
+        """Whether a process with this executable, arguments and environment can be forked from the zygote.
+
+        :param exe: executable requested for the process
+        :param args: arguments following the executable
+        :param env: complete environment of the process, defaults to None for this process's environment
+        """
+        if len(args) != 2 or args[0] != "-c":
+            return False
+        if env is None:
+            env = os.environ
+        if _startup_env(env) != self._startup_env:
+            return False
+        exe = shutil.which(exe, path=env.get("PATH", os.defpath)) or exe
+        return os.path.realpath(exe) == self._executable
+
+    def spawn(self, args: list, cwd, env: dict, stdio: tuple) -> int:
+        """Fork a new process from the zygote.
+
+        :param args: full argument vector of the form ``[python, "-c", code]``
+        :param cwd: working directory of the new process, None to inherit it
+        :param env: complete environment of the new process
+        :param stdio: file descriptors for stdin, stdout and stderr, -1 to inherit one
+        :return: pid of the new process, which is a child of this process
+        :raises ZygoteError: if the zygote cannot start the process
+        """
+        fds = [fd for fd in stdio if fd != -1]
+        targets = [target for target, fd in zip(_STDIO, stdio) if fd != -1]
+        request = pickle.dumps((list(args), cwd, dict(env), targets))
+
+        with self._lock:
+            try:
+                socket.send_fds(self._sock, [request], fds)
+                reply = self._sock.recv(4096)
+            except OSError as ex:
+                raise ZygoteError(f"zygote pid {self.pid} is not reachable: {ex}") from ex
+
+        if not reply:
+            raise ZygoteError(f"zygote pid {self.pid} exited")
+
+        reply = pickle.loads(reply)
+        if isinstance(reply, BaseException):
+            raise ZygoteError(f"zygote could not start process: {reply!r}")
+
+        return reply
+
+    def stop(self, timeout=None):
+        """Close the request socket, which makes the zygote exit."""
+        self._sock.close()
+        try:
+            self._proc.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+
+
+class ZygotePopenMixin:
+    """Mixin for :class:`subprocess.Popen` subclasses that fork from a zygote instead of exec'ing.
+
+    The subclass keeps every other Popen behavior; only the creation of the
+    child is replaced. Set ``self._zygote`` before calling ``Popen.__init__``.
+    """
+
+    def _execute_child(
+        self,
+        args,
+        executable,
+        preexec_fn,
+        close_fds,
+        pass_fds,
+        cwd,
+        env,
+        startupinfo,
+        creationflags,
+        shell,
+        p2cread,
+        p2cwrite,
+        c2pread,
+        c2pwrite,
+        errread,
+        errwrite,
+        *unused,
+    ):
+        try:
+            self.pid = self._zygote.spawn(args, cwd, os.environ if env is None else env, (p2cread, c2pwrite, errwrite))
+            self._child_created = True
+        finally:
+            self._close_pipe_fds(p2cread, p2cwrite, c2pread, c2pwrite, errread, errwrite)
+
+
+def _preload(modules):
+    failures = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as ex:
+            failures.append((name, repr(ex)))
+    return failures
+
+
+def _serve(sock):
+    """Serve spawn requests until Local Services closes its end.
+
+    Returns None in the zygote when there are no more requests, and the
+    request in a newly forked worker.
+    """
+
+    while True:
+        try:
+            msg, fds, flags, _ = socket.recv_fds(sock, _MAX_REQUEST, len(_STDIO))
+        except InterruptedError:
+            continue
+        except OSError:
+            return None
+
+        if not msg:
+            return None
+
+        try:
+            if flags & (socket.MSG_TRUNC | socket.MSG_CTRUNC):
+                raise ZygoteError("spawn request was truncated")
+
+            request = pickle.loads(msg)
+            pid_r, pid_w = os.pipe()
+            pid = os.fork()
+        except Exception as ex:
+            for fd in fds:
+                os.close(fd)
+            sock.send(pickle.dumps(ex))
+            continue
+
+        if pid == 0:
+            # Fork again so the worker is reparented to Local Services when we exit.
+            os.close(pid_r)
+            try:
+                worker = os.fork()
+            except OSError:
+                os._exit(1)
+
+            if worker == 0:
+                os.close(pid_w)
+                sock.close()
+                return request, fds
+
+            os.write(pid_w, worker.to_bytes(8, sys.byteorder))
+            os._exit(0)
+
+        os.close(pid_w)
+        for fd in fds:
+            os.close(fd)
+
+        # The worker has been reparented once the intermediate child is reaped,
+        # so Local Services may wait on it as soon as it learns the pid.
+        _, status = os.waitpid(pid, 0)
+        worker = int.from_bytes(os.read(pid_r, 8) or bytes(8), sys.byteorder)
+        os.close(pid_r)
+
+        if os.waitstatus_to_exitcode(status) != 0 or worker == 0:
+            sock.send(pickle.dumps(ZygoteError("fork of worker failed")))
+        else:
+            sock.send(pickle.dumps(worker))
+
+
+def _become(request, fds):
+    """Turn a freshly forked worker into the requested process."""
+
+    args, cwd, env, targets = request
+
+    for fd, target in zip(fds, targets):
+        if fd != target:
+            os.dup2(fd, target)
+            os.close(fd)
+
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    if cwd:
+        os.chdir(cwd)
+
+    os.environ.clear()
+    os.environ.update(env)
+    sys.argv = list(args[1:2])
+    # -m put the zygote's working directory first, where -c puts the current one
+    if not getattr(sys.flags, "safe_path", False):
+        sys.path[0] = ""
+
+    import dragon
+    from dragon.infrastructure import parameters as dp
+
+    # Modules bound this_process at import time in the zygote; refresh the
+    # object they share rather than rebinding the name.
+    dp.this_process.__dict__.update(dp.LaunchParameters.from_env().__dict__)
+
+    if os.environ.get("DRAGON_PATCH_MP", False):
+        dragon._patch_multiprocessing()
+    if os.environ.get("DRAGON_PATCH_TORCH", False):
+        dragon._patch_torch()
+
+    main = types.ModuleType("__main__")
+    main.__builtins__ = __builtins__
+    sys.modules["__main__"] = main
+
+    return compile(args[2], "<string>", "exec"), vars(main)
+
+
+def main():
+    sock = socket.socket(fileno=int(sys.argv[1]))
+    sock.send(pickle.dumps(_preload(_DEFAULT_PRELOAD + tuple(sys.argv[2:]))))
+
+    # Local Services owns our stdio; keep a stray SIGINT from the terminal from killing us.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    request = _serve(sock)
+    if request is None:
+        return
+
+    code, namespace = _become(*request)
+    exec(code, namespace)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,15 +5,28 @@ can be accessed via the array attribute of a Array.
 .. code-block:: python
 
    array = dragon.native.array.Array(typecode_or_type = ctypes.c_char, size_or_initializer = [b"0", b"1"], lock=True)
+
+Numeric arrays can also be created with ``zero_copy=True``. The elements are then
+stored in native C layout in a single managed memory allocation that every process
+maps directly, so element access is O(1) and bulk access runs at memcpy speed.
+Accesses are not serialized in this mode; use the lock explicitly when needed.
+Such an array can only be used by processes on the node that created it.
+
+.. code-block:: python
+
+   array = dragon.native.array.Array("d", 1024, zero_copy=True)
+   with array:
+       array.get_ndarray()[:] += 1.0
 """
 
 import logging
 import ctypes
+from array import array as _pyarray
 from collections.abc import Iterable
 
 import dragon
 from ..channels import Channel, Message, ChannelError
-from ..managed_memory import MemoryPool
+from ..managed_memory import MemoryPool, MemoryAlloc
 from ..utils import B64
 from ..infrastructure.facts import default_pool_muid_from_index
 from ..infrastructure.parameters import this_process
@@ -38,6 +51,7 @@ _DEF_MUID = default_pool_muid_from_index(this_process.index)
 
 
 _TYPE_CONV_ARR = {}  # dispatch router for manipulating the arrays based on datatype
+_ZERO_COPY_TYPES = _SUPPORTED_TYPES - {ctypes.c_char, ctypes.c_wchar}
 
 
 class Array:
@@ -45,6 +59,7 @@ class Array:
 
     _lock = None  # This ensures _get_lock is sane during any point of evaluation
     _type = None  # Needed to make __getattr__ behave correctly
+    _zero_copy = False
 
     def __init__(
         self,
@@ -52,6 +67,7 @@ class Array:
         size_or_initializer: int or range or list,
         lock: Lock or bool = True,
         m_uid: int = _DEF_MUID,
+        zero_copy: bool = False,
     ):
         """Initialize a array object.
         :param typecode_or_type: the typecode or type is returned from the dictionary, _TYPECODE_TO_TYPE
@@ -62,6 +78,10 @@ class Array:
         :type lock: creates lock for synchronization for array
         :param m_uid: memory pool to create the channel in and message to write value and typecode_or_type in managed memory, defaults to _DEF_MUID
         :type m_uid: int, optional
+        :param zero_copy: store the elements in native layout in one managed memory allocation that is accessed
+            in place, defaults to False. Only numeric types are supported, and the array cannot be unpickled on
+            another node.
+        :type zero_copy: bool, optional
         """
         if isinstance(typecode_or_type, str):
             if typecode_or_type in _TYPECODE_TO_TYPE.keys():
@@ -87,6 +107,14 @@ class Array:
 
         LOGGER.debug("Init Dragon Native Array with %s, %s, %s, %s", typecode_or_type, size_or_initializer, lock, m_uid)
 
+        if zero_copy:
+            if self._type not in _ZERO_COPY_TYPES:
+                raise AttributeError(f"zero_copy type not supported, has to be one of {_ZERO_COPY_TYPES}")
+            self._zero_copy = True
+            self._init_zero_copy(size_or_initializer, m_uid)
+            self._init_lock(lock)
+            return
+
         # Figure out how much size we need in our message
         if isinstance(size_or_initializer, int):
             initial_length = size_or_initializer  # Used for initializing a value for string length
@@ -189,6 +217,9 @@ class Array:
         self._sendh.send(msg)
         msg.destroy()
 
+        self._init_lock(lock)
+
+    def _init_lock(self, lock):
         # The strange logic in here flows from requirements outlined in cpython multiprocessing unittests for Value.
         # We respect the absurdity.
         _lock_instance = isinstance(lock, dragon.mpbridge.synchronize.DragonLock) or isinstance(
@@ -221,6 +252,8 @@ class Array:
             self._summed_s0_sizes,
             self._struct1_sizes,
             self._summed_s1_sizes,
+            self._zero_copy,
+            self._mem_ser if self._zero_copy else None,
         )
         return ret
 
@@ -239,11 +272,22 @@ class Array:
             self._summed_s0_sizes,
             self._struct1_sizes,
             self._summed_s1_sizes,
+            self._zero_copy,
+            self._mem_ser,
         ) = state
 
-        self._channel = dragon.channels.Channel.attach(serialized_bytes)
+        channel = dragon.channels.Channel.attach(serialized_bytes)
+        if self._zero_copy and not channel.is_local:
+            # The allocation is mapped directly, which other nodes cannot do. Nothing is
+            # set on self yet, so __del__ does not release a reference we never took.
+            channel.detach()
+            raise RuntimeError("A zero_copy Array can only be used on the node it was created on")
+
+        self._channel = channel
         self._reset()
         get_refcnt(self._channel.cuid)
+        if self._zero_copy:
+            self._attach_view(MemoryAlloc.attach(self._mem_ser))
 
     def __repr__(self):
         return f"{self.__class__.__name__}(typecode_or_type={self._type}, lock={self._lock}, m_uid={self._muid})"
@@ -315,6 +359,13 @@ class Array:
 
     def __setitem__(self, pos, arr):
 
+        if self._zero_copy:
+            if isinstance(pos, slice):
+                self._view[pos] = _pyarray(self._view.format, self._process_input(arr))
+            else:
+                self._view[pos] = arr
+            return
+
         # grab mview from memory pool
         msg = self._recvh.recv()
         mview = msg.bytes_memview()
@@ -381,6 +432,10 @@ class Array:
 
     def __getitem__(self, pos):
 
+        if self._zero_copy:
+            val = self._view[pos]
+            return val.tolist() if isinstance(pos, slice) else val
+
         # grab bytes from memory pool
         if isinstance(pos, int) and pos > (self._data_len) - 1:
             raise IndexError("list index out of range")
@@ -434,6 +489,27 @@ class Array:
         """Release the internal lock object"""
         return self._lock.release()
 
+    def get_memview(self) -> memoryview:
+        """Return a typed memoryview on the shared elements of a ``zero_copy`` array.
+        The view is not synchronized; hold the lock around updates that need it.
+
+        :return: writable memoryview in the native format of the array type
+        :raises AttributeError: if the array was not created with ``zero_copy=True``
+        """
+        if not self._zero_copy:
+            raise AttributeError("get_memview requires an array created with zero_copy=True")
+        return self._view
+
+    def get_ndarray(self):
+        """Return a NumPy array sharing memory with a ``zero_copy`` array. Requires NumPy.
+
+        :return: writable numpy.ndarray backed by the managed memory allocation
+        :raises AttributeError: if the array was not created with ``zero_copy=True``
+        """
+        import numpy as np
+
+        return np.asarray(self.get_memview())
+
     # This seems crazy, but it necessary to always force evaluation of value from
     # the memory pool, which only exists for strings implemented by ctypes.c_char
     @property
@@ -538,7 +614,7 @@ class Array:
 
         return mview[start:stop]
 
-    def _get_msg_from_pool(self, size_or_initializer: int or range or list, stride: int, m_uid: int = _DEF_MUID):
+    def _create_channel(self, m_uid: int = _DEF_MUID):
 
         self._muid = m_uid
 
@@ -548,6 +624,48 @@ class Array:
         self._channel = Channel.attach(descriptor.sdesc)
         self._reset()
 
+    def _init_zero_copy(self, size_or_initializer: int or range or list, m_uid: int = _DEF_MUID):
+        """Allocate the native element storage and hand it to our ref-counted channel"""
+
+        if isinstance(size_or_initializer, int):
+            self._data_len = size_or_initializer
+            values = None
+        else:
+            values = self._process_input(size_or_initializer)
+            self._data_len = len(values)
+
+        self._str_len = 0
+        self.subclass_types, self.tuple_type_list = (None, None)
+        self._struct0_sizes, self._summed_s0_sizes = (None, None)
+        self._struct1_sizes, self._summed_s1_sizes = (None, None)
+
+        self._create_channel(m_uid)
+
+        nbytes = self._data_len * ctypes.sizeof(self._type)
+        mem = self._mpool.alloc(max(nbytes, 1))
+        mem.get_memview()[:nbytes] = bytes(nbytes)
+        self._mem_ser = bytes(mem.serialize())
+        self._attach_view(mem)
+        if values is not None:
+            self._view[:] = _pyarray(self._view.format, values)
+
+        # The message is never received again. Transferring ownership parks the
+        # allocation in the channel without a copy, so it is freed together with
+        # the channel once the last reference is released.
+        msg = Message.create_from_mem(mem)
+        self._sendh.send(msg, ownership=self._sendh.transfer_ownership_on_send)
+        msg.destroy(free_mem=False)
+
+    def _attach_view(self, mem: MemoryAlloc):
+
+        self._mem = mem
+        nbytes = self._data_len * ctypes.sizeof(self._type)
+        self._view = mem.get_memview()[:nbytes].cast(self._type._type_)
+
+    def _get_msg_from_pool(self, size_or_initializer: int or range or list, stride: int, m_uid: int = _DEF_MUID):
+
+        self._create_channel(m_uid)
+
         # Handling structures is also annoying
         if self._is_structure(self._type):
             creation_size = self._summed_s0_sizes + (len(size_or_initializer) - 1) * self._summed_s1_sizes
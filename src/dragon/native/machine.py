@@ -7,13 +7,18 @@ or a list of all nodes.
 import logging
 import os
 
-from ..globalservices.node import query, query_total_cpus, get_list
+from ..globalservices.node import query, query_all, query_total_cpus
 from ..infrastructure.gpu_desc import AccVendor
 from ..infrastructure.policy import Policy
 from ..utils import host_id
 
 LOG = logging.getLogger(__name__)
 
+# Node descriptors this process has already received from Global Services, key = h_uid.
+# The hardware of a node does not change while the runtime is up, so Node objects are
+# built from here instead of asking Global Services again for every one of them.
+_NODE_DESCRIPTORS = {}
+
 # TODO: Decide on a model for system architecture that generalizes
 # well to HPC and cloud environments alike
 
@@ -173,9 +178,13 @@ class Node:
 
     def _update_descriptor(self, ident=None):
         if ident is not None:
+            if ident in _NODE_DESCRIPTORS:
+                self._descr = _NODE_DESCRIPTORS[ident]
+                return
             self._descr = query(ident)
         else:
             self._descr = query(self._descr.h_uid)
+        _NODE_DESCRIPTORS[self._descr.h_uid] = self._descr
 
 
 def current() -> Node:
@@ -191,7 +200,11 @@ def current() -> Node:
 class System:
     def __init__(self):
         """A stub of a system abstraction"""
-        self._nodes = get_list()
+        # One request for all the node descriptors rather than a list request plus one per node
+        descriptors = query_all()
+        for descr in descriptors:
+            _NODE_DESCRIPTORS[descr.h_uid] = descr
+        self._nodes = [descr.h_uid for descr in descriptors]
         self._node_objs = [Node(id) for id in self._nodes]
         self._primary_node = None
 
@@ -5,12 +5,16 @@ import logging
 import queue
 import socket
 import itertools
+import random
 import traceback
 import threading
+import time
 import types
-import signal
+from collections import OrderedDict, deque
 from typing import Iterable, Any
 
+import cloudpickle
+
 import dragon
 
 from .queue import Queue
@@ -29,8 +33,20 @@ from ..infrastructure.policy import Policy
 
 job_counter = itertools.count()
 
+# how often a worker with other nodes' queues to steal from looks for work there
 WORKER_POLL_FREQUENCY = 0.2
-RESULTS_HANDLER_POLL_FREQUENCY = 0.2
+# number of other nodes an idle worker tries to take a task from per poll
+STEAL_ATTEMPTS = 2
+# map jobs whose pickled function is at least this large send it to each worker once
+SHARED_FUNC_MIN_SIZE = 2**16
+# number of map job functions a worker keeps
+FUNC_CACHE_SIZE = 8
+# imap with an adaptive chunksize aims for tasks that take this many seconds
+IMAP_TARGET_TASK_TIME = 0.1
+IMAP_MAX_CHUNKSIZE = 4096
+
+# functions of map jobs by job id, in the workers
+_func_cache = OrderedDict()
 
 
 def get_logs(name):
@@ -225,16 +241,273 @@ class MapResult(ApplyResult):
                 self._pool = None
 
 
+class _IMapResult:
+    """Results of an `imap` job as they arrive. This is what the pool's cache and the feeder thread
+    refer to, so that the `IMapIterator` given to the caller can be garbage collected."""
+
+    def __init__(self, pool: Pool, ordered: bool, max_inflight: int, adaptive: bool):
+        """Initialization method
+
+        :param pool: the pool where work is submitted
+        :type pool: dragon.native.pool.Pool
+        :param ordered: yield results in the order of the input iterable
+        :type ordered: bool
+        :param max_inflight: number of chunks submitted but not yet consumed before submitting blocks
+        :type max_inflight: int
+        :param adaptive: chunks are returned with the time they took to compute
+        :type adaptive: bool
+        """
+        self._pool = pool
+        self._job = next(job_counter)
+        self._cache = pool._cache
+        self._cond = threading.Condition()
+        self._ordered = ordered
+        self._adaptive = adaptive
+        self._slots = threading.Semaphore(max_inflight)
+        self._feeding_stopped = threading.Event()
+        self._closed = False
+        self._chunks = {}
+        self._items = deque()
+        self._length = None
+        self._received = 0
+        self._taken = 0
+        self._item_time = None
+        self._cache[self._job] = self
+
+    def next(self, timeout: float = None) -> Any:
+        with self._cond:
+            while not self._items:
+                if self._closed:
+                    raise StopIteration
+                if not self._cond.wait_for(lambda: self._ready() or self._exhausted(), timeout):
+                    raise TimeoutError
+                if self._exhausted():
+                    raise StopIteration
+
+                if self._ordered:
+                    success, value = self._chunks.pop(self._taken)
+                else:
+                    success, value = self._chunks.pop(next(iter(self._chunks)))
+                self._taken += 1
+                self._slots.release()
+
+                if not success:
+                    raise value
+                self._items.extend(value)
+
+            return self._items.popleft()
+
+    def stop_feeding(self):
+        # no more chunks are submitted, those already submitted can still be consumed
+        self._feeding_stopped.set()
+        # wake the feeder if it waits for the caller to consume a result
+        self._slots.release()
+
+    def close(self):
+        self.stop_feeding()
+        with self._cond:
+            self._closed = True
+            self._chunks.clear()
+            self._items.clear()
+            self._cond.notify_all()
+
+    def _ready(self):
+        return self._taken in self._chunks if self._ordered else len(self._chunks) > 0
+
+    def _exhausted(self):
+        return self._taken == self._length
+
+    def _chunksize(self):
+        with self._cond:
+            if self._item_time is None:
+                return 1
+            return max(1, min(IMAP_MAX_CHUNKSIZE, int(IMAP_TARGET_TASK_TIME / max(self._item_time, 1e-6))))
+
+    def _acquire_slot(self, end_event):
+        # only wakes up to check for terminate while the consumer is behind
+        while not self._slots.acquire(timeout=WORKER_POLL_FREQUENCY):
+            if end_event.is_set() or self._feeding_stopped.is_set():
+                return False
+        return not self._feeding_stopped.is_set()
+
+    def _set(self, i, obj):
+        success, value = obj
+        with self._cond:
+            if self._closed:
+                # chunks submitted before closing are only counted, so the job leaves the cache
+                # once they are done and its function is not destroyed while workers still need it
+                self._received += 1
+                self._check_done()
+                return
+            if self._adaptive and success:
+                duration, value = value
+                if len(value) > 0:
+                    item_time = duration / len(value)
+                    self._item_time = item_time if self._item_time is None else (self._item_time + item_time) / 2
+            self._chunks[i] = (success, value)
+            self._received += 1
+            self._check_done()
+            self._cond.notify_all()
+
+    def _set_length(self, length):
+        with self._cond:
+            self._length = length
+            self._check_done()
+            self._cond.notify_all()
+        self._notify_pool()
+
+    def _check_done(self):
+        if self._received == self._length:
+            self._cache.pop(self._job, None)
+            if self._closed:
+                self._notify_pool()
+
+    def _notify_pool(self):
+        if len(self._cache) == 0 and self._pool is not None:
+            with self._pool._cache_cond:
+                self._pool._cache_cond.notify_all()
+
+
+class IMapIterator:
+    """Returned by `imap` and `imap_unordered`. Iterating over it yields results as they arrive."""
+
+    def __init__(self, result: _IMapResult):
+        """Initialization method
+
+        :param result: results of the imap job
+        :type result: _IMapResult
+        """
+        self._result = result
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return self.next()
+
+    def __del__(self):
+        try:
+            self._result.close()
+        except Exception:
+            pass
+
+    def next(self, timeout: float = None) -> Any:
+        """Returns the next result
+
+        :param timeout: timeout for the next result to arrive, defaults to None
+        :type timeout: float, optional
+        :raises TimeoutError: raised if no result arrived in the specified timeout
+        :raises StopIteration: raised once all results have been returned
+        :return: the next value returned by `func`
+        :rtype: Any
+        """
+        return self._result.next(timeout)
+
+    def close(self) -> None:
+        """Stops taking items from the iterable and discards results not yet returned, so the pool
+        only waits for chunks already submitted in `close` and `join`. Called when the iterator is
+        garbage collected.
+        """
+        self._result.close()
+
+
 def mapstar(args):
     return list(map(*args))
 
 
+def timed_mapstar(args):
+    start = time.monotonic()
+    result = list(map(*args))
+    return time.monotonic() - start, result
+
+
+def _cached_func(job, store):
+    try:
+        func = _func_cache.pop(job)
+    except KeyError:
+        # take a copy of the pickled function and put it back for other workers
+        payload = store.get()
+        store.put(payload)
+        func = cloudpickle.loads(payload)
+
+    _func_cache[job] = func
+    while len(_func_cache) > FUNC_CACHE_SIZE:
+        _func_cache.popitem(last=False)
+    return func
+
+
+class _SharedFunc:
+    """Stands in for the function of a map job in each of its tasks. A worker
+    fetches the pickled function from the job's queue the first time it runs a
+    task of the job and uses its cached copy after that.
+    """
+
+    def __init__(self, job: int, store: Queue):
+        self._job = job
+        self._store = store
+        self._func = None
+
+    def __getstate__(self):
+        return (self._job, self._store)
+
+    def __setstate__(self, state):
+        self._job, self._store = state
+        self._func = None
+
+    def __call__(self, *args, **kwargs):
+        if self._func is None:
+            self._func = _cached_func(self._job, self._store)
+        return self._func(*args, **kwargs)
+
+
+class _NodeQueues:
+    """The input queues of a pool that has one per node. Tasks are dealt to them
+    round robin and workers that run out of tasks on their node take them from
+    the queues of other nodes.
+    """
+
+    def __init__(self, queues: list[Queue]):
+        self.queues = queues
+        self._next = itertools.cycle(queues)
+
+    def put(self, obj, *args, **kwargs) -> None:
+        next(self._next).put(obj, *args, **kwargs)
+
+    def destroy(self) -> None:
+        for q in self.queues:
+            q.destroy()
+
+
+def _steal(queues):
+    for q in random.sample(queues, min(STEAL_ATTEMPTS, len(queues))):
+        try:
+            task = q.get_nowait()
+        except (queue.Empty, TimeoutError):
+            continue
+        if task is None:
+            # this shutdown sentinel is meant for a worker on the other node
+            q.put(None)
+            continue
+        return task
+    return None
+
+
+def _put_sentinels(worker_queues, block=True):
+    for q, nworkers in worker_queues:
+        for _ in range(nworkers):
+            try:
+                q.put(None, block=block)
+            except queue.Full:
+                # the workers reading this queue have tasks to wake up for
+                break
+
+
 class Pool:
     """A Dragon native Pool relying on native Process Group and Queues
 
     The interface resembles the Python Multiprocessing.Pool interface and focuses on the most generic functionality. Here we directly support the asynchronous API. The synchronous version of these calls are supported by calling get on the objects returned from the asynchronous functions. By using a Dragon native Process Group to coordinate the worker processes this implementation addresses scalability limitations with the patched base implementation of Multiprocessing.Pool.
 
-    At this time, `signal.SIGUSR2` is used to signal workers to shutdown. Users should not use or register a handler for this signal if they want to use `close` to shutdown the pool. Using `close` guarantees that all work submitted to the pool is finished before the signal is sent while `terminate` sends the signal immediately. If workers don't immediately exit, `terminate` will send escalating signals (SIGINT, SIGTERM, then SIGKILL) and wait patience amount of time for processes to exit before sending the next signal. The user is expected to call `join` following both of these calls. If `join` is not called, zombie processes may be left and leave the runtime in a corrupted state.
+    Workers wait on their input queue without polling and shut down when they receive a sentinel from it. Using `close` guarantees that all work submitted to the pool is finished before the sentinels are sent while `terminate` sends them immediately. If workers don't immediately exit, `terminate` will send escalating signals (SIGINT, SIGTERM, then SIGKILL) and wait patience amount of time for processes to exit before sending the next signal. The user is expected to call `join` following both of these calls. If `join` is not called, zombie processes may be left and leave the runtime in a corrupted state.
 
     """
 
@@ -247,6 +520,7 @@ class Pool:
         *,
         policy: Policy = None,
         processes_per_policy: int = None,
+        node_queues: bool = False,
     ):
         """Init method
 
@@ -262,6 +536,8 @@ class Pool:
         :type policy: dragon.infrastructure.policy.Policy or list of dragon.infrastructure.policy.Policy
         :param processes_per_policy: determines the number of processes to be placed with a specific policy if a list of policies is provided
         :type processes_per_policy: int
+        :param node_queues: create an input queue on each node workers are placed on instead of a single one on this node. Workers take tasks from their own node's queue and from other nodes' queues once theirs is empty. Without a policy, workers are spread evenly across all nodes.
+        :type node_queues: bool, optional
         :raises ValueError: raised if number of worker processes is less than 1
         """
         myp = current_process()
@@ -274,7 +550,6 @@ class Pool:
         self.fdebug, self.finfo = get_logs("pool main")
 
         self.fdebug(f"pool init on node {socket.gethostname()} by process {myp.ident}")
-        self._inqueue = Queue()
         self._outqueue = Queue()
         self._end_threading_event = threading.Event()
         self._maxtasksperchild = maxtasksperchild
@@ -312,56 +587,90 @@ class Pool:
         self._start_barrier_helper.daemon = True
         self._start_barrier_helper.start()
 
-        self._template = ProcessTemplate(
-            self._worker_function,
-            args=(
-                self._inqueue,
-                self._outqueue,
-                self._start_barrier,
-                self._start_barrier_passed,
-                self._initializer,
-                self._initargs,
-                self._maxtasksperchild,
-            ),
-        )
-        if isinstance(policy, list):
+        if node_queues:
             self._pg = ProcessGroup(restart=True, ignore_error_on_exit=True)
-            for p in policy:
-                # starts a process group with nproc workers
-                placed_template = ProcessTemplate(
-                    self._worker_function,
-                    args=(
-                        self._inqueue,
-                        self._outqueue,
-                        self._start_barrier,
-                        self._start_barrier_passed,
-                        self._initializer,
-                        self._initargs,
-                        self._maxtasksperchild,
-                    ),
-                    policy=p,
-                )
-                self._pg.add_process(processes_per_policy, placed_template)
+            self._add_node_workers(policy, processes_per_policy)
         else:
-            self._pg = ProcessGroup(restart=True, ignore_error_on_exit=True, policy=policy)
-            self._pg.add_process(self._processes, self._template)
+            self._inqueue = Queue()
+            self._worker_queues = [(self._inqueue, self._processes)]
+            self._template = self._worker_template()
+            if isinstance(policy, list):
+                self._pg = ProcessGroup(restart=True, ignore_error_on_exit=True)
+                for p in policy:
+                    # starts a process group with nproc workers
+                    self._pg.add_process(processes_per_policy, self._worker_template(policy=p))
+            else:
+                self._pg = ProcessGroup(restart=True, ignore_error_on_exit=True, policy=policy)
+                self._pg.add_process(self._processes, self._template)
         self._pg.init()
         self._pg.start()
 
         # dict that holds jobs submitted via apply_async and map_async
         self._cache = {}
+        # notified by the results handler when the cache empties and on terminate
+        self._cache_cond = threading.Condition()
+        # queues holding the pickled function of map jobs, by job id
+        self._func_stores = {}
 
         # thread that handles getting results from outqueue and putting in dict
         self._results_handler = threading.Thread(
-            target=self._handle_results, args=(self._outqueue, self._cache, self._end_threading_event)
+            target=self._handle_results, args=(self._outqueue, self._cache, self._cache_cond)
         )
         self._results_handler.start()
 
         # thread used by map_async to chunk input list
         self._map_launch_thread = None
+        # threads pulling the iterables of imap jobs, each with the results of its job
+        self._imap_feeders = []
         # thread used by close to wait for results before sending shutdown signals
         self._close_thread = None
 
+    def _worker_template(self, inqueue=None, stealqueues=(), policy=None):
+        return ProcessTemplate(
+            self._worker_function,
+            args=(
+                self._inqueue if inqueue is None else inqueue,
+                self._outqueue,
+                self._start_barrier,
+                self._start_barrier_passed,
+                self._initializer,
+                self._initargs,
+                self._maxtasksperchild,
+                stealqueues,
+            ),
+            policy=policy,
+        )
+
+    def _add_node_workers(self, policy, processes_per_policy):
+        if isinstance(policy, list):
+            groups = [(p, processes_per_policy) for p in policy]
+        elif policy is not None:
+            groups = [(policy, self._processes)]
+        else:
+            policies = System().hostname_policies()
+            nnodes = min(len(policies), self._processes)
+            groups = [
+                (policies[i], self._processes // nnodes + (i < self._processes % nnodes)) for i in range(nnodes)
+            ]
+
+        # groups placed on the same host share its queue
+        nodes = [p.host_name if p.placement == Policy.Placement.HOST_NAME else id(p) for p, _ in groups]
+        inqueues = {}
+        for node, (p, _) in zip(nodes, groups):
+            if node not in inqueues:
+                inqueues[node] = Queue(policy=p)
+        self._inqueue = _NodeQueues(list(inqueues.values()))
+        nworkers = dict.fromkeys(inqueues, 0)
+        for node, (_, nproc) in zip(nodes, groups):
+            nworkers[node] += nproc
+        self._worker_queues = [(inqueues[node], nworkers[node]) for node in inqueues]
+
+        for node, (p, nproc) in zip(nodes, groups):
+            inqueue = inqueues[node]
+            stealqueues = [q for q in self._inqueue.queues if q is not inqueue]
+            self._template = self._worker_template(inqueue, stealqueues, policy=p)
+            self._pg.add_process(nproc, self._template)
+
     def _check_running(self):
         if self._pg_closed:
             raise ValueError("Checking running of a closed pool")
@@ -382,9 +691,11 @@ class Pool:
         if self._start_barrier_helper is not None:
             self._start_barrier_helper.join()
         self._check_running()
-        self._end_threading_event.set()
+        self._end_threading()
         self.fdebug("stop restart")
         self._pg.stop_restart()
+        # wake up idle workers so they exit without waiting for a signal
+        _put_sentinels(self._worker_queues, block=False)
         self.fdebug("in stop")
         self._pg.stop(patience=patience)
         self.fdebug("in close")
@@ -398,11 +709,17 @@ class Pool:
 
         self.fdebug("killing pool")
         # setting end event to stop all threads
-        self._end_threading_event.set()
+        self._end_threading()
         self._pg.stop_restart()
         self._pg.kill()
         self._can_join = True
 
+    def _end_threading(self):
+        self._end_threading_event.set()
+        with self._cache_cond:
+            self._cache_cond.notify_all()
+        self._outqueue.put(None)
+
     @staticmethod
     def _start_barrier_helper(start_barrier: Barrier = None, start_barrier_passed: Event = None):
         """This is started in a separate thread and is meant to set the event when all workers have passed the barrier. We join on this thread in terminate to avoid sending a sigint when worker processes are in the middle of being started.
@@ -419,25 +736,21 @@ class Pool:
         start_barrier_passed.set()
 
     @staticmethod
-    def _close(cache, start_barrier_passed, end_threading_event, pool):
-        def work_done(cache):
-            return len(cache) == 0
-
+    def _close(cache, cache_cond, end_threading_event, pool, worker_queues, outqueue):
         # waits until all submitted jobs are done.
-        while not work_done(cache):
-            if end_threading_event.is_set():
-                return
-
-        # wait for all the initial processes to have come up and registered their signal handler
-        start_barrier_passed.wait()
+        with cache_cond:
+            cache_cond.wait_for(lambda: len(cache) == 0 or end_threading_event.is_set())
+        if end_threading_event.is_set():
+            return
 
         pool.stop_restart()
-        # send signal to shutdown pool workers
-        pool.send_signal(signal.SIGUSR2)
+        # send a sentinel to each pool worker and then to the results handler
+        _put_sentinels(worker_queues)
         end_threading_event.set()
+        outqueue.put(None)
 
     def close(self) -> None:
-        """This method starts a thread that waits for all submitted jobs to finish. This thread then sends signal.SIGUSR2 to the process group and sets the threading event to close the handle_results thread. Waiting and then sending the signals within the thread allows close to return without all work needing to be done.
+        """This method starts a thread that waits for all submitted jobs to finish. This thread then sends a shutdown sentinel to each worker and to the handle_results thread. Waiting and then sending the signals within the thread allows close to return without all work needing to be done.
 
         :raises ValueError: raised if `close` or `terminate` have been previously called
         """
@@ -446,9 +759,13 @@ class Pool:
             raise ValueError("Trying to close pool that has already been closed or terminated")
         if self._pg_closed:
             raise ValueError("Closing when ProcessGroup has been closed")
+        # imap jobs take no more items, so that close does not wait for the callers to consume them
+        for _, result in self._imap_feeders:
+            result.stop_feeding()
         # defines and starts thread that waits for work in input queue to be done before sending shutdown signal
         self._close_thread = threading.Thread(
-            target=self._close, args=(self._cache, self._start_barrier_passed, self._end_threading_event, self._pg)
+            target=self._close,
+            args=(self._cache, self._cache_cond, self._end_threading_event, self._pg, self._worker_queues, self._outqueue),
         )
         self.fdebug("starting close thread")
         self._close_thread.start()
@@ -480,6 +797,10 @@ class Pool:
         if self._map_launch_thread is not None:
             self.fdebug("joining map launch thread")
             self._map_launch_thread.join()
+        for feeder, result in self._imap_feeders:
+            result.stop_feeding()
+            feeder.join()
+        self._imap_feeders.clear()
 
         if not self._pg_closed:
             self.fdebug("joining process group")
@@ -508,6 +829,9 @@ class Pool:
         self._start_barrier.destroy()
         self._inqueue.destroy()
         self._outqueue.destroy()
+        for store in self._func_stores.values():
+            store.destroy()
+        self._func_stores.clear()
         del self._start_barrier
         del self._start_barrier_passed
         del self._inqueue
@@ -516,16 +840,16 @@ class Pool:
 
     @staticmethod
     def _worker_function(
-        inqueue, outqueue, start_barrier, start_barrier_passed, initializer=None, initargs=(), maxtasks=None
+        inqueue,
+        outqueue,
+        start_barrier,
+        start_barrier_passed,
+        initializer=None,
+        initargs=(),
+        maxtasks=None,
+        stealqueues=(),
     ):
         try:
-            termflag = threading.Event()
-
-            def handler(signum, frame):
-                termflag.set()
-
-            signal.signal(signal.SIGUSR2, handler)
-
             # setup logging
             fname = f"{dls.PG}_{socket.gethostname()}_workers.log"
             setup_BE_logging(service=dls.PG, fname=fname)
@@ -544,15 +868,23 @@ class Pool:
 
             completed_tasks = 0
 
-            while not termflag.is_set() and (maxtasks is None or (maxtasks and completed_tasks < maxtasks)):
+            while maxtasks is None or completed_tasks < maxtasks:
                 # get work item
                 try:
-                    # still need timeout here to check signal occasionally
-                    task = inqueue.get(timeout=WORKER_POLL_FREQUENCY)
-                except queue.Empty:
-                    continue
-                except TimeoutError:
-                    continue
+                    if stealqueues:
+                        # come back now and then to look for work on other nodes
+                        task = inqueue.get(timeout=WORKER_POLL_FREQUENCY)
+                    else:
+                        task = inqueue.get()
+                except (queue.Empty, TimeoutError):
+                    # nothing left on this node, so help out another one
+                    task = _steal(stealqueues)
+                    if task is None:
+                        continue
+                else:
+                    if task is None:
+                        # sentinel sent by close or terminate
+                        break
 
                 job, i, func, args, kwargs = task
 
@@ -582,17 +914,14 @@ class Pool:
             dlog.detach_from_dragon_handler(dls.PG)
 
     @classmethod
-    def _handle_results(cls, outqueue, cache, end_event):
+    def _handle_results(cls, outqueue, cache, cache_cond):
         fdebug, finfo = get_logs("results handler")
         fdebug(f"handle_results on node {socket.gethostname()} with thread id {threading.get_native_id()}")
-        while not end_event.is_set():
-            # timeout with some frequency so we check if end_event is set
-            try:
-                task = outqueue.get(timeout=RESULTS_HANDLER_POLL_FREQUENCY)
-            except queue.Empty:
-                continue
-            except TimeoutError:
-                continue
+        while True:
+            task = outqueue.get()
+            if task is None:
+                # sentinel sent by close, terminate or kill
+                break
 
             job, i, obj = task
 
@@ -602,6 +931,10 @@ class Pool:
             except KeyError:
                 pass
 
+            if len(cache) == 0:
+                with cache_cond:
+                    cache_cond.notify_all()
+
             task = job = obj = None
 
     def apply_async(
@@ -673,6 +1006,80 @@ class Pool:
         finally:
             task = taskseq = job = None
 
+    def _share_func(self, job, func, num_tasks):
+        # Jobs that are done no longer need their function.
+        for done in [j for j in self._func_stores if j not in self._cache]:
+            self._func_stores.pop(done).destroy()
+
+        copies = min(self._processes, num_tasks)
+        if num_tasks <= copies:
+            return func
+
+        try:
+            payload = cloudpickle.dumps(func)
+        except Exception:
+            # let the task put raise the error as it would have anyway
+            return func
+
+        if len(payload) < SHARED_FUNC_MIN_SIZE:
+            return func
+
+        # Several copies let workers fetch it concurrently.
+        store = Queue(maxsize=copies)
+        for _ in range(copies):
+            store.put(payload)
+        self._func_stores[job] = store
+        return _SharedFunc(job, store)
+
+    @staticmethod
+    def _feed_imap(inqueue, result, func, iterable, chunksize, end_event):
+        mapper = mapstar if chunksize is not None else timed_mapstar
+        it = iter(iterable)
+        i = 0
+        try:
+            while result._acquire_slot(end_event):
+                try:
+                    chunk = tuple(itertools.islice(it, chunksize or result._chunksize()))
+                except Exception as e:
+                    inqueue.put((result._job, i, _helper_reraises_exception, (e,), {}))
+                    i += 1
+                    break
+                if not chunk:
+                    result._slots.release()
+                    break
+                inqueue.put((result._job, i, mapper, ((func, chunk),), {}))
+                i += 1
+        finally:
+            result._set_length(i)
+
+    def _imap(self, func, iterable, chunksize, max_inflight, ordered):
+        if self._can_join:
+            raise ValueError("Pool closed or terminated. Cannot map to a closed pool.")
+        self._check_running()
+
+        if chunksize is not None and chunksize < 1:
+            raise ValueError(f"Chunksize must be 1+, not {chunksize}")
+        if max_inflight is None:
+            max_inflight = 4 * self._processes
+        elif max_inflight < 1:
+            raise ValueError(f"max_inflight must be 1+, not {max_inflight}")
+
+        result = _IMapResult(self, ordered, max_inflight, adaptive=chunksize is None)
+        # the stream has no known length, so send a large function once if it would pay off for any
+        func = self._share_func(result._job, func, float("inf"))
+
+        # each imap job has its own thread pulling chunks from its iterable as results are consumed,
+        # so that neither other imap jobs nor map jobs wait for the caller to consume this one
+        self._imap_feeders = [(feeder, res) for feeder, res in self._imap_feeders if feeder.is_alive()]
+        feeder = threading.Thread(
+            target=Pool._feed_imap,
+            args=(self._inqueue, result, func, iterable, chunksize, self._end_threading_event),
+        )
+        feeder.start()
+        self._imap_feeders.append((feeder, result))
+
+        return IMapIterator(result)
+
     def _map_async(self, func, iterable, mapper, chunksize=None, callback=None, error_callback=None):
         if self._can_join:
             raise ValueError("Pool closed or terminated. Cannot map to a closed pool.")
@@ -692,8 +1099,10 @@ class Pool:
                 chunksize += 1
 
         # Generate the tasks and place result reference in dict
-        task_batches = Pool._get_tasks(func, iterable, chunksize)
         result = MapResult(self, chunksize, len(iterable), callback, error_callback=error_callback)
+        if chunksize > 0:
+            func = self._share_func(result._job, func, -(-num_items // chunksize))
+        task_batches = Pool._get_tasks(func, iterable, chunksize)
 
         # wait to generate more tasks till last task generation thread has finished
         if self._map_launch_thread is not None:
@@ -731,3 +1140,39 @@ class Pool:
         :rtype: MapResult
         """
         return self._map_async(func, iterable, mapstar, chunksize, callback, error_callback)
+
+    def imap(self, func: callable, iterable: Iterable, chunksize: int = 1, *, max_inflight: int = None) -> IMapIterator:
+        """Apply `func` to each element in `iterable` and yield the results in order as they become available. Unlike `map_async`, the iterable is consumed lazily, so it may be unbounded or larger than memory. At most `max_inflight` chunks are submitted but not yet consumed by the caller at any time. No more elements are taken from `iterable` once the pool or the returned iterator is closed.
+
+        :param func: user provided function to call on elements of iterable
+        :type func: callable
+        :param iterable: input args to func
+        :type iterable: iterable
+        :param chunksize: number of elements in each task. If None, it is adjusted so each task takes about IMAP_TARGET_TASK_TIME seconds, defaults to 1
+        :type chunksize: int, optional
+        :param max_inflight: number of chunks submitted ahead of the caller, defaults to four times the number of workers
+        :type max_inflight: int, optional
+        :raises ValueError: raised if pool has already been closed or terminated or chunksize or max_inflight is less than 1
+        :return: An iterator over the output of applying `func` to each element of iterable. Its `next` method accepts a timeout.
+        :rtype: IMapIterator
+        """
+        return self._imap(func, iterable, chunksize, max_inflight, ordered=True)
+
+    def imap_unordered(
+        self, func: callable, iterable: Iterable, chunksize: int = 1, *, max_inflight: int = None
+    ) -> IMapIterator:
+        """Like `imap` but the results are yielded in the order they complete.
+
+        :param func: user provided function to call on elements of iterable
+        :type func: callable
+        :param iterable: input args to func
+        :type iterable: iterable
+        :param chunksize: number of elements in each task. If None, it is adjusted so each task takes about IMAP_TARGET_TASK_TIME seconds, defaults to 1
+        :type chunksize: int, optional
+        :param max_inflight: number of chunks submitted ahead of the caller, defaults to four times the number of workers
+        :type max_inflight: int, optional
+        :raises ValueError: raised if pool has already been closed or terminated or chunksize or max_inflight is less than 1
+        :return: An iterator over the output of applying `func` to each element of iterable
+        :rtype: IMapIterator
+        """
+        return self._imap(func, iterable, chunksize, max_inflight, ordered=False)
@@ -634,7 +634,7 @@ class Process(ProcessTemplate):
         :rtype: bool
         """
         try:
-            self._update_descriptor()
+            self._update_exit_status()
         except AttributeError:
             return False
         else:
@@ -707,7 +707,7 @@ class Process(ProcessTemplate):
     @property
     def returncode(self) -> int:
         """When the process has terminated, return exit code. None otherwise."""
-        self._update_descriptor()
+        self._update_exit_status()
         return self._descr.ecode
 
     def children(self) -> list[object]:
@@ -729,6 +729,12 @@ class Process(ProcessTemplate):
     def _update_descriptor(self, ident=None):
         self._descr = process_query(ident or self._descr.p_uid)
 
+    def _update_exit_status(self):
+        # Once the process is dead its state and exit code do not change, so
+        # polling a finished process does not need to ask Global Services again.
+        if self._descr.state != self._descr.State.DEAD:
+            self._update_descriptor()
+
     @property
     def stdin_conn(self):
         return self._descr.stdin_conn
@@ -274,13 +274,17 @@ cdef class FLISendH:
         except:
             pass
 
-    def send_bytes(self, bytes data, uint64_t arg=0, bool buffer=False, timeout=None):
+    def send_bytes(self, data, uint64_t arg=0, bool buffer=False, timeout=None):
         """
         When sending bytes it is possible to specify the bytes to be sent. In addition,
         you may specify a user specified argument or hint to be sent. If buffer is true, then
         data is not actually sent on this call, but buffered for future call or until the send
         handle is closed.
 
+        The data may be any object supporting the buffer protocol with contiguous,
+        unsigned byte data (e.g. bytes, bytearray or a memoryview cast to bytes). It
+        is read in place, so no copy is made before the data is sent.
+
         If the receiver closes the receive handle early, sending bytes may result in
         raising EOFError.
         """
@@ -296,8 +300,8 @@ cdef class FLISendH:
 
         time_ptr = _computed_timeout(timeout, &timer)
 
-        cdef const unsigned char[:] c_data = data
-        data_len = len(data)
+        cdef const unsigned char[::1] c_data = data
+        data_len = c_data.shape[0]
 
         with nogil:
             derr = dragon_fli_send_bytes(&self._sendh, data_len, <uint8_t *>&c_data[0], arg, buffer, time_ptr)
@@ -1096,19 +1100,22 @@ cdef class PickleWriteAdapter:
     def write(self, b):
         arg = 0
 
-        # for large Numpy/SciPy objects
+        # Large Numpy/SciPy objects pickled with protocol 5 are written as a PickleBuffer
+        # or memoryview of the object's own memory. These are sent directly from that
+        # memory. Only data that is not contiguous must first be copied.
         if isinstance(b, pickle.PickleBuffer):
-            sbuf = b.raw()
+            try:
+                sbuf = b.raw()
+            except BufferError:
+                sbuf = memoryview(b).tobytes()
         else:
             sbuf = b
 
-        if isinstance(sbuf, memoryview):
-            sbuf = sbuf.tobytes()
-
-        if isinstance(sbuf, bytearray):
-            sbuf = bytes(sbuf)
-
-        length = len(sbuf)
+        if isinstance(sbuf, memoryview) and (sbuf.format != "B" or sbuf.ndim != 1 or not sbuf.c_contiguous):
+            try:
+                sbuf = sbuf.cast("B")
+            except TypeError:
+                sbuf = sbuf.tobytes()
 
         if self._sendh._is_open == False:
             raise RuntimeError("Handle not open, cannot send data.")
@@ -1151,63 +1158,67 @@ cdef class PickleReadAdapter:
                     raise DragonFLIError(derr, "Got error while freeing Dragon memory.")
             self._have_mem = False
 
-    def read(self, size=0):
+    cdef _next_mem(self):
         cdef:
             dragonError_t derr
             timespec_t timer
             timespec_t* time_ptr
             uint64_t arg
-            size_t start = 0
-            size_t end = 0
 
-        if self._recvh._is_open == False:
-            raise RuntimeError("Handle is not open, cannot receive")
+        if self._have_mem:
+            if self._free_mem:
+                derr = dragon_memory_free(&self._mem)
+                if derr != DRAGON_SUCCESS:
+                    raise DragonFLIError(derr, "Got error while freeing Dragon memory.")
+            self._have_mem = False
 
-        if size < 0:
-            raise ValueError("Size cannot be less than zero")
+        time_ptr = _computed_timeout(self._timeout, &timer)
 
-        if self._offset >= self._mem_size:
-            if self._have_mem:
-                if self._free_mem:
-                    derr = dragon_memory_free(&self._mem)
-                    if derr != DRAGON_SUCCESS:
-                        raise DragonFLIError(derr, "Got error while freeing Dragon memory.")
-                self._have_mem = False
+        with nogil:
+            derr = dragon_fli_recv_mem(&self._recvh._recvh, &self._mem, &arg, time_ptr)
 
-            time_ptr = _computed_timeout(self._timeout, &timer)
+        if derr == DRAGON_TIMEOUT:
+            raise DragonFLITimeoutError(derr, "Time out while receiving bytes.")
 
-            with nogil:
-                derr = dragon_fli_recv_mem(&self._recvh._recvh, &self._mem, &arg, time_ptr)
+        if derr == DRAGON_OBJECT_DESTROYED:
+            raise DragonFLIObjectDestroyed(derr, "The data could not be received. Object destroyed.")
 
-            if derr == DRAGON_TIMEOUT:
-                raise DragonFLITimeoutError(derr, "Time out while receiving bytes.")
+        if derr == DRAGON_EOT:
+            raise DragonFLIEOT(derr, "End of Transmission")
 
-            if derr == DRAGON_OBJECT_DESTROYED:
-                raise DragonFLIObjectDestroyed(derr, "The data could not be received. Object destroyed.")
+        if derr == DRAGON_CHANNEL_EMPTY:
+            raise DragonFLIEOT(derr, "FLI Empty")
 
-            if derr == DRAGON_EOT:
-                raise DragonFLIEOT(derr, "End of Transmission")
+        if derr != DRAGON_SUCCESS:
+            raise DragonFLIError(derr, "Error receiving FLI data.")
 
-            if derr == DRAGON_CHANNEL_EMPTY:
-                raise DragonFLIEOT(derr, "FLI Empty")
+        self._have_mem = True
 
-            if derr != DRAGON_SUCCESS:
-                raise DragonFLIError(derr, "Error receiving FLI data.")
+        if self._hint is not None and self._hint != arg:
+            raise AssertionError(f"Expected hint {self._hint} but got {arg} from FLI")
 
-            self._have_mem = True
+        derr = dragon_memory_get_size(&self._mem, &self._mem_size)
+        if derr != DRAGON_SUCCESS:
+            raise DragonFLIError(derr, "Error getting the data size.")
 
-            if self._hint is not None and self._hint != arg:
-                raise AssertionError(f"Expected hint {self._hint} but got {arg} from FLI")
+        self._offset = 0
 
-            derr = dragon_memory_get_size(&self._mem, &self._mem_size)
-            if derr != DRAGON_SUCCESS:
-                raise DragonFLIError(derr, "Error getting the data size.")
+        derr = dragon_memory_get_pointer(&self._mem, <void**> &self._mem_ptr)
+        if derr != DRAGON_SUCCESS:
+            raise DragonFLIError(derr, "Error getting the data pointer.")
 
-            self._offset = 0
+    def read(self, size=0):
+        cdef:
+            size_t start = 0
 
-            derr = dragon_memory_get_pointer(&self._mem, <void**> &self._mem_ptr)
-            if derr != DRAGON_SUCCESS:
-                raise DragonFLIError(derr, "Error getting the data pointer.")
+        if self._recvh._is_open == False:
+            raise RuntimeError("Handle is not open, cannot receive")
+
+        if size < 0:
+            raise ValueError("Size cannot be less than zero")
+
+        if self._offset >= self._mem_size:
+            self._next_mem()
 
         if size == 0:
             # A size of 0 means get everything.
@@ -1225,5 +1236,35 @@ cdef class PickleReadAdapter:
 
         return self._mem_ptr[start:start+size]
 
+    def readinto(self, b):
+        """
+        Fill the writable buffer b with the next len(b) bytes of the stream and
+        return the number of bytes read. The unpickler uses this for large byte
+        strings and buffers, so they are copied once, straight from the received
+        memory into the object being unpickled.
+        """
+        cdef:
+            unsigned char[::1] dest
+            size_t total
+            size_t done = 0
+            size_t n
+
+        if self._recvh._is_open == False:
+            raise RuntimeError("Handle is not open, cannot receive")
+
+        dest = memoryview(b).cast("B")
+        total = dest.shape[0]
+
+        while done < total:
+            if self._offset >= self._mem_size:
+                self._next_mem()
+
+            n = min(total - done, self._mem_size - self._offset)
+            memcpy(&dest[done], self._mem_ptr + self._offset, n)
+            self._offset += n
+            done += n
+
+        return done
+
     def readline(self):
         return self.read()
\ No newline at end of file
@@ -6,10 +6,12 @@ import os
 import requests
 import multiprocessing as mp
 import queue
-import sqlite3
 import time
 import socket
 import json
+import math
+import re
+import cloudpickle
 from pickle import loads
 import logging
 import stat
@@ -17,11 +19,43 @@ import stat
 LOG = logging.getLogger(__name__)
 
 from dragon.telemetry.tsdb_server import tsdb, ENFORCED_DB_PERMISSIONS
+from dragon.telemetry import tsdb_store
 from dragon.telemetry.collector import Collector
+from dragon.telemetry.telemetry import LS_TSDB_INGEST_KEY
+from dragon.native.queue import Queue
+from dragon.utils import set_local_kv, B64
 from dragon.dlogging.util import setup_BE_logging, DragonLoggingServices as dls
 
 log = None
 
+# OpenTSDB downsample specifications look like "1m-avg" or "100ms-max-nan"
+_DOWNSAMPLE_RE = re.compile(r"^(\d+)(ms|s|m|h|d|w|n|y)-(\w+)")
+_DOWNSAMPLE_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800, "n": 2592000, "y": 31536000}
+_DOWNSAMPLE_ALIASES = {"zimsum": "sum", "mimmin": "min", "mimmax": "max"}
+
+
+def _downsample_interval(query: dict, start_time: float, end_time: float, max_data_points: int = None) -> tuple:
+    """Bucket width in whole seconds and aggregate to downsample a query with, or None to return raw datapoints.
+
+    The interval is the larger of the query's ``downsample`` interval and the one needed to stay within
+    ``max_data_points``, which is rounded up so that it can be read from a rollup. Intervals under a second do not
+    reduce the per-second datapoints and return None.
+    """
+    interval = 0
+    aggregate = "avg"
+    match = _DOWNSAMPLE_RE.match(query.get("downsample") or "")
+    if match is not None:
+        interval = int(match.group(1)) * _DOWNSAMPLE_UNITS[match.group(2)]
+        aggregate = _DOWNSAMPLE_ALIASES.get(match.group(3), match.group(3))
+    if max_data_points:
+        span = min(end_time, time.time()) - start_time
+        needed = span / int(max_data_points)
+        if needed >= 1:
+            interval = max(interval, tsdb_store.rollup_interval(needed))
+    if interval < 1 or aggregate not in tsdb_store.DOWNSAMPLE_AGGREGATES:
+        return None
+    return math.ceil(interval), aggregate
+
 
 class DragonServer:
     """Dragon Server retrieves requests from associated queue, performs queries, and returns response
@@ -64,6 +98,10 @@ class DragonServer:
         mp.set_start_method("dragon")
         collector_start_event = mp.Event()
         try:
+            # Telemetry clients on this node send batches of datapoints here instead of posting to the TSDB Server
+            ingest_queue = Queue()
+            set_local_kv(key=LS_TSDB_INGEST_KEY, value=B64.bytes_to_str(cloudpickle.dumps(ingest_queue)))
+
             with Policy(placement=Policy.Placement.HOST_NAME, host_name=socket.gethostname()):
                 tsdb_proc = mp.Process(
                     target=tsdb,
@@ -79,9 +117,14 @@ class DragonServer:
                 ds_proc = mp.Process(target=self._listen)
                 ds_proc.start()
 
+                ingest_proc = mp.Process(target=self._ingest, args=(ingest_queue,))
+                ingest_proc.start()
+
             if self.telemetry_level > 1:
                 collector_proc.join()
             ds_proc.join()
+            ingest_proc.join()
+            ingest_queue.destroy()
             # try to shutdown telemetry server gently
             self.shutdown_aggregator_server()
             self.shutdown_telemetry_server()
@@ -101,18 +144,8 @@ class DragonServer:
         tmdb_directory = str(self.telem_cfg.get("default_tmdb_directory", "/tmp"))
         filename = os.path.join(tmdb_directory, "ts_" + user + "_" + os.uname().nodename + ".db")
         log.debug(f"opening db at ")
-        connection = sqlite3.connect(filename)
+        connection = tsdb_store.connect(filename)
         cursor = connection.cursor()
-
-        # Create metrics table
-        sql_create_metrics = (
-            "CREATE TABLE IF NOT EXISTS datapoints (metric text, timestamp text, value real, tags json)"
-        )
-        cursor.execute(sql_create_metrics)
-        connection.commit()
-        sql_create_flags = "CREATE TABLE IF NOT EXISTS flags (id INTEGER PRIMARY KEY CHECK (id = 1), is_shutdown BLOB)"
-        cursor.execute(sql_create_flags)
-        connection.commit()
         log.debug(f"Listen DragonServer object on {hostname}")
         db_permissions = stat.S_IMODE(os.stat(filename).st_mode)
         if db_permissions != ENFORCED_DB_PERMISSIONS:
@@ -142,6 +175,32 @@ class DragonServer:
 
         LOG.debug(f"Dragon Server on {hostname} is exiting")
 
+    def _ingest(self, ingest_queue: object):
+        """Insert batches of datapoints sent by Telemetry clients into the local database
+        until shutdown, draining whatever is left in the queue before exiting.
+
+        Args:
+            ingest_queue (object): Queue of datapoint batches
+        """
+        self.setup_logging()
+        tmdb_directory = str(self.telem_cfg.get("default_tmdb_dir", "/tmp"))
+        user = os.environ.get("USER", str(os.getuid()))
+        filename = os.path.join(tmdb_directory, "ts_" + user + "_" + os.uname().nodename + ".db")
+        connection = tsdb_store.connect(filename)
+        while True:
+            try:
+                dps = ingest_queue.get(timeout=1)
+            except queue.Empty:
+                if self.shutdown_event.is_set():
+                    break
+                continue
+            _, failed, errors = tsdb_store.insert_datapoints(connection, dps, int(time.time()))
+            if failed > 0:
+                log.debug(f"Failed to insert {failed} datapoints: {errors}")
+
+        connection.close()
+        log.debug(f"Ingest on {os.uname().nodename} is exiting")
+
     def get_metrics_from_db(self, cursor: object) -> list:
         """Retrieve distinct metrics from database
 
@@ -151,10 +210,7 @@ class DragonServer:
         Returns:
             list: distinct metrics from metrics table
         """
-        sql = "SELECT DISTINCT(metric) FROM datapoints"
-        res = list(cursor.execute(sql))
-        res = [x[0] for x in res]
-        return res
+        return tsdb_store.metric_names(cursor)
 
     def check_is_shutdown(self, cursor: object) -> bool:
         """Check flags table if shutdown event is set
@@ -217,9 +273,9 @@ class DragonServer:
             for row in tsdb:
                 # row -> (metric, timestamp, value, tag_key, tag_value)
                 try:
-                    result[str(row[4])][row[1]] = row[2]
+                    result[str(row[4])][str(row[1])] = row[2]
                 except KeyError:
-                    result[str(row[4])] = {row[1]: row[2]}
+                    result[str(row[4])] = {str(row[1]): row[2]}
             return result
 
         hostname = os.uname().nodename
@@ -229,7 +285,7 @@ class DragonServer:
         # Grafana sends request in milliseconds. But expects response in seconds :)
         # New Info: (Milliseconds can be changed in dashboard settings!)
         start_time = int(request_body["start"]) / 1000
-        end_time = request_body.get("end", int(time.time()))
+        end_time = float(request_body.get("end", int(time.time())))
 
         metric_list = self.get_metrics_from_db(cursor)
         for q in queries:
@@ -245,13 +301,15 @@ class DragonServer:
                         tagk = tagk[0]
                 else:
                     tagk = None
-                # Filter datapoints by start time
-                if tagk is None:
-                    sql_query = "SELECT dps.metric, dps.timestamp, dps.value, json_each.key as tag_key, json_each.value as tag_value FROM datapoints as dps, json_each(dps.tags) WHERE dps.metric = ? AND CAST(timestamp as INTEGER) >= ? AND CAST(timestamp as INTEGER) <= ? ORDER BY tag_value"
-                    tsdb = cursor.execute(sql_query, [q["metric"], start_time, end_time]).fetchall()
+                # Filter datapoints by start time, and downsample them here so only reduced series are returned
+                downsample = _downsample_interval(q, start_time, end_time, request_body.get("maxDataPoints"))
+                if downsample is None:
+                    tsdb = tsdb_store.select_datapoints(cursor, q["metric"], start_time, end_time, tagk)
                 else:
-                    sql_query = "SELECT dps.metric, dps.timestamp, dps.value, json_each.key as tag_key, json_each.value as tag_value FROM datapoints as dps, json_each(dps.tags) WHERE dps.metric = ? AND tag_key = ? AND CAST(timestamp as INTEGER) >= ? AND CAST(timestamp as INTEGER) <= ? ORDER BY tag_value"
-                    tsdb = cursor.execute(sql_query, [q["metric"], tagk, start_time, end_time]).fetchall()
+                    interval, aggregate = downsample
+                    tsdb = tsdb_store.select_downsampled(
+                        cursor, q["metric"], start_time, end_time, interval, aggregate, tagk
+                    )
 
                 tsdb = create_dps_tags(tsdb)
 
@@ -3,7 +3,99 @@ import requests
 import time
 import socket
 import os
+import queue
+import atexit
+import threading
+import weakref
+from collections import deque
+import cloudpickle
 from yaml import safe_load
+from dragon.utils import get_local_kv, B64
+
+LS_TSDB_INGEST_KEY = "telemetry_tsdb_ingest_queue"
+BUFFER_SIZE = 8192
+FLUSH_SIZE = 512
+FLUSH_INTERVAL = 1.0
+INGEST_LOOKUP_TIMEOUT = 1.0
+POST_TIMEOUT = 5.0
+
+
+class _Flusher:
+    """Flushes the buffers of all Telemetry clients of a process from one background thread. The thread and its
+    exit handler only exist while there are clients to flush."""
+
+    def __init__(self):
+        self._clients = weakref.WeakSet()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def register(self, client) -> None:
+        with self._lock:
+            self._clients.add(client)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self.flush_all)
+
+    def unregister(self, client) -> None:
+        with self._lock:
+            self._clients.discard(client)
+        # let the thread notice it has nothing left to flush
+        self._wakeup.set()
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def flush_all(self) -> None:
+        for client in list(self._clients):
+            client.flush()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._clients:
+                    self._thread = None
+                    atexit.unregister(self.flush_all)
+                    return
+                interval = min(client._flush_interval for client in self._clients)
+            self._wakeup.wait(interval)
+            self._wakeup.clear()
+            self._flush_due()
+
+    def _flush_due(self):
+        # kept out of _run so no client is referenced while waiting and unused ones can be collected
+        now = time.monotonic()
+        for client in list(self._clients):
+            if len(client._buffer) >= client._flush_size or now - client._last_flush >= client._flush_interval:
+                try:
+                    client.flush()
+                except Exception:
+                    # a client whose queue went away must not stop the others from being flushed
+                    pass
+
+
+_flusher = _Flusher()
+
+# the node's ingest queue is looked up once per process and shared by all of its clients
+_ingest_lock = threading.Lock()
+_ingest_pid = None
+_ingest_queue = None
+
+
+def _lookup_ingest_queue():
+    global _ingest_pid, _ingest_queue
+    with _ingest_lock:
+        if _ingest_pid != os.getpid():
+            # The Dragon Server registers the queue with local services before the TSDB Server reports ready.
+            # Without it, batches are still posted to the TSDB Server over HTTP.
+            try:
+                ingest_sdesc = get_local_kv(key=LS_TSDB_INGEST_KEY, timeout=INGEST_LOOKUP_TIMEOUT)
+                _ingest_queue = cloudpickle.loads(B64.str_to_bytes(ingest_sdesc))
+            except Exception:
+                _ingest_queue = None
+            _ingest_pid = os.getpid()
+        return _ingest_queue
 
 
 class Telemetry:
@@ -35,9 +127,23 @@ class Telemetry:
             pool.join()
 
             dt.finalize()
+
+    Datapoints are kept in a ring buffer in the calling process and sent to the node's TSDB in batches, either once
+    ``flush_size`` of them have accumulated or every ``flush_interval`` seconds, by a background thread shared by all
+    clients of the process. Batches go over a Dragon queue that
+    the node's Dragon Server drains into the database, so ``add_data`` never waits on the network and is cheap enough
+    to call from inner loops. Nothing blocks when the buffer or the queue is full; the oldest buffered datapoints or
+    the batch that could not be sent are dropped instead and counted in ``dropped``.
     """
 
-    def __init__(self, metrics_url="http://localhost:4243/api/metrics", timeout= None):
+    def __init__(
+        self,
+        metrics_url="http://localhost:4243/api/metrics",
+        timeout=None,
+        buffer_size: int = BUFFER_SIZE,
+        flush_size: int = FLUSH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL,
+    ):
         telem_cfg = os.getenv("DRAGON_TELEMETRY_CONFIG", None)
 
         if telem_cfg is None:
@@ -49,7 +155,10 @@ class Telemetry:
         self.metrics_url = f"http://localhost:{tsdb_port}/api/metrics"
         self._shutdown_url = f"http://localhost:{tsdb_port}/api/set_shutdown"
         self._ready_url = f"http://localhost:{tsdb_port}/api/ready"
-        self.formatted_data = {"dps": {}}
+        self._buffer_size = buffer_size
+        self._flush_size = min(flush_size, buffer_size)
+        self._flush_interval = flush_interval
+        self.dropped = 0
         self._telemetry_level = int(os.getenv("DRAGON_TELEMETRY_LEVEL", 0))
         # Check if TSDB Server is up
         # If telemetry level is 0, telemetry infrastructure isn't requested
@@ -63,6 +172,33 @@ class Telemetry:
                     pass
                 except requests.exceptions.ReadTimeout as e:
                     raise TimeoutError("Telemetry took longer than expected to start.")
+        self._start_client()
+
+    def __getstate__(self):
+        self.flush()
+        state = self.__dict__.copy()
+        for attr in ("_buffer", "_flush_lock", "_ingest_queue"):
+            del state[attr]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._start_client()
+
+    def _start_client(self):
+        self._buffer = deque(maxlen=self._buffer_size)
+        self._flush_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._ingest_queue = None
+        if self._telemetry_level > 0:
+            self._ingest_queue = _lookup_ingest_queue()
+            _flusher.register(self)
+
+    def __del__(self):
+        try:
+            self.flush()
+        except Exception:
+            pass
 
     @property
     def level(self):
@@ -77,7 +213,8 @@ class Telemetry:
         tagk: str = None,
         tagv: int | str = None,
     ) -> None:
-        """Adds user defined metric data to node local database that can then be retrieved via Grafana
+        """Adds user defined metric data to node local database that can then be retrieved via Grafana. The datapoint is
+        buffered and written with the next batch.
 
         :param ts_metric_name: Metric name used to store data and retrieve it in Grafana. This should be consistent across nodes. Grafana's retrieval will add the hostname to the metric.
         :type ts_metric_name: str
@@ -94,19 +231,48 @@ class Telemetry:
         """
 
         if telemetry_level <= self._telemetry_level:
-            data_name = ts_metric_name
             if timestamp is None:
                 timestamp = int(time.time())
-            self.formatted_data["timestamp"] = timestamp
-            if tagk is None or tagv is None:
-                self.formatted_data["dps"] = [{"metric": data_name, "value": ts_data}]
+            dp = {"metric": ts_metric_name, "value": ts_data, "timestamp": timestamp}
+            if tagk is not None and tagv is not None:
+                dp["tags"] = {tagk: tagv}
+
+            if len(self._buffer) == self._buffer_size:
+                self.dropped += 1
+            self._buffer.append(dp)
+            if len(self._buffer) == self._flush_size:
+                _flusher.wake()
+
+    def flush(self) -> None:
+        """Send all buffered datapoints to the node local database. This is done periodically and whenever enough
+        datapoints are buffered, so users only need to call it to make data visible right away."""
+        with self._flush_lock:
+            self._last_flush = time.monotonic()
+            nitems = len(self._buffer)
+            if nitems == 0:
+                return
+            dps = [self._buffer.popleft() for _ in range(nitems)]
+
+            if self._ingest_queue is not None:
+                try:
+                    self._ingest_queue.put(dps, block=False)
+                except (queue.Full, ValueError):
+                    self.dropped += nitems
             else:
-                self.formatted_data["dps"] = [{"metric": data_name, "value": ts_data, "tags": {tagk: tagv}}]
+                try:
+                    requests.post(self.metrics_url, json={"dps": dps}, timeout=POST_TIMEOUT)
+                except requests.exceptions.RequestException:
+                    self.dropped += nitems
 
-            api_resp = requests.post(self.metrics_url, json=self.formatted_data)
+    def close(self) -> None:
+        """Stop flushing this client in the background and send the datapoints still buffered. Datapoints added
+        afterwards are only sent by an explicit `flush`."""
+        _flusher.unregister(self)
+        self.flush()
 
     def finalize(self) -> None:
         """Finalize shuts down the telemetry service if it was started. It can be called when the user is done with telemetry. If it is not called the user will have to Ctrl-C from the terminal to shutdown the telemetry service."""
         # if telemetry_level is 0 then the telemetry infrastructure wasn't started
         if self._telemetry_level > 0:
+            self.close()
             _ = requests.get(self._shutdown_url)
@@ -8,6 +8,8 @@ import logging
 from yaml import safe_load
 from http import HTTPStatus
 
+from dragon.telemetry import tsdb_store
+
 LOG = logging.getLogger(__name__)
 
 
@@ -26,7 +28,7 @@ class TSDBApp(Flask):
 
         tmdb_directory = telemetry_cfg.get("default_tmdb_dir", "/tmp")
         self.filename = os.path.join(tmdb_directory, "ts_" + user + "_" + os.uname().nodename + ".db")
-        self.connection = sqlite3.connect(self.filename)
+        self.connection = tsdb_store.connect(self.filename)
         self.cursor = self.connection.cursor()
 
     def get_metrics_from_db(self) -> list:
@@ -35,10 +37,7 @@ class TSDBApp(Flask):
         Returns:
             list: Distinct metrics from database
         """
-        sql = "SELECT DISTINCT(metric) FROM datapoints"
-        res = list(self.cursor.execute(sql))
-        res = [x[0] for x in res]
-        return res
+        return tsdb_store.metric_names(self.cursor)
 
     def set_filename(self, filename: str) -> None:
         """Sets the filename for the database connection
@@ -47,7 +46,7 @@ class TSDBApp(Flask):
             filename (str): Path to the database file
         """
         self.filename = filename
-        self.connection = sqlite3.connect(self.filename)
+        self.connection = tsdb_store.connect(self.filename)
         self.cursor = self.connection.cursor()
 
     def get_filename(self) -> str:
@@ -107,27 +106,8 @@ def add_metrics() -> object:
               description: Error messages accompanying failures
     """
     req_body = request.json
-    metrics_list = app.get_metrics_from_db()
-    success = 0
-    failed = 0
-    error_msg = []
     timestamp = req_body["timestamp"] if "timestamp" in req_body.keys() else int(time.time())
-    for req in req_body["dps"]:
-        metric = req["metric"]
-        tags = req.get("tags", None)
-        try:
-            sql_insert = "INSERT INTO datapoints VALUES (?,?,?,?)"
-            app.cursor.execute(sql_insert, [metric, str(timestamp), req["value"], json.dumps(tags)])
-            app.connection.commit()
-            # Check if metric exists in the table
-            if metric not in metrics_list:
-                metrics_list.append(metric)
-            success += 1
-
-        except Exception as e:
-            failed += 1
-            error_msg.append(str(e))
-            continue
+    success, failed, error_msg = tsdb_store.insert_datapoints(app.connection, req_body["dps"], timestamp)
 
     resp = {"success": success, "failed": failed, "errors": error_msg}
 
@@ -202,9 +182,7 @@ def cleanup_tsdb() -> object:
     req_body = request.json
     # LOG.debug(f"Cleanup request on: {os.uname().nodename}, Request: {req_body}")
     start_time = req_body["start_time"]
-    select_sql = "DELETE FROM datapoints WHERE CAST(timestamp as INTEGER) < ?"
-    res = list(app.cursor.execute(select_sql, [int(start_time)]))
-    app.connection.commit()
+    tsdb_store.delete_before(app.connection, start_time)
     success = 0
     failed = 0
     error_msg = []
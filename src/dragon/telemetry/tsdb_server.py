@@ -1,8 +1,8 @@
 import os
 import sys
-import sqlite3
 import gunicorn.app.base
 from dragon.telemetry.tsdb_app import app as tsdb_app
+from dragon.telemetry import tsdb_store
 import dragon
 import multiprocessing
 from pickle import dumps, loads
@@ -11,7 +11,7 @@ import stat
 
 LOG = logging.getLogger(__name__)
 
-ENFORCED_DB_PERMISSIONS = 0o750
+ENFORCED_DB_PERMISSIONS = tsdb_store.DB_PERMISSIONS
 
 
 def tsdb(start_event: multiprocessing.Event, shutdown_event: multiprocessing.Event, telemetry_cfg: object):
@@ -30,16 +30,8 @@ def tsdb(start_event: multiprocessing.Event, shutdown_event: multiprocessing.Eve
     tmdb_directory = str(telemetry_cfg.get("default_tmdb_dir", "/tmp"))
     delete_db_file = int(telemetry_cfg.get("delete_tmdb", 1))
     filename = os.path.join(tmdb_directory, "ts_" + user + "_" + os.uname().nodename + ".db")
-    connection = sqlite3.connect(filename)
+    connection = tsdb_store.connect(filename)
     c = connection.cursor()
-    sql_create_metrics = (
-        "CREATE TABLE IF NOT EXISTS datapoints (metric varchar(50), timestamp varchar(30), value real, tags json)"
-    )
-    c.execute(sql_create_metrics)
-    connection.commit()
-    sql_create_flags = "CREATE TABLE IF NOT EXISTS flags (id INTEGER PRIMARY KEY CHECK (id = 1), is_shutdown BLOB)"
-    c.execute(sql_create_flags)
-    connection.commit()
 
     db_permissions = stat.S_IMODE(os.stat(filename).st_mode)
     if db_permissions != ENFORCED_DB_PERMISSIONS:
@@ -93,7 +85,7 @@ def tsdb(start_event: multiprocessing.Event, shutdown_event: multiprocessing.Eve
         """
         LOG.debug(f"Exiting TSDBServer on {os.uname().nodename}....")
         if delete_db_file == 1:
-            os.remove(filename)
+            tsdb_store.remove(filename)
         return
 
     tsdb_port = telemetry_cfg.get("tsdb_server_port", "4243")
@@ -0,0 +1,328 @@
+"""Storage for the node-local telemetry time series database.
+
+Metric names are kept once in the ``metric_names`` table and datapoints refer
+to them by id. Timestamps are stored as integers so that the composite index on
+metric and time serves both Grafana queries and cleanup. The database runs in
+WAL mode so the TSDB server can insert while the Dragon Server queries.
+
+Every insert also updates the ``rollups`` table, which keeps the count, sum,
+minimum and maximum of each metric and tag set over buckets of each of the
+``ROLLUP_RESOLUTIONS``. Downsampled queries read from the coarsest rollup that
+fits the requested interval rather than from the raw datapoints.
+"""
+
+import os
+import json
+import math
+import stat
+import sqlite3
+import logging
+
+LOG = logging.getLogger(__name__)
+
+# Mode of the database file and of the write-ahead log and shared memory files SQLite creates next to it
+DB_PERMISSIONS = 0o750
+
+# Bucket widths in seconds of the rollups maintained on insert
+ROLLUP_RESOLUTIONS = (10, 60, 600)
+
+# How each downsampling aggregate combines rows, which are either raw datapoints or rollup buckets
+DOWNSAMPLE_AGGREGATES = {
+    "avg": "SUM({sum}) / SUM({count})",
+    "sum": "SUM({sum})",
+    "min": "MIN({min})",
+    "max": "MAX({max})",
+    "count": "SUM({count})",
+}
+
+_RAW_COLUMNS = {"count": "1", "sum": "dps.value", "min": "dps.value", "max": "dps.value"}
+_ROLLUP_COLUMNS = {"count": "dps.value_count", "sum": "dps.value_sum", "min": "dps.value_min", "max": "dps.value_max"}
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS metric_names (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS datapoints (metric_id INTEGER NOT NULL REFERENCES metric_names(id), timestamp INTEGER NOT NULL, value REAL, tags JSON)",
+    "CREATE INDEX IF NOT EXISTS datapoints_metric_timestamp ON datapoints (metric_id, timestamp)",
+    "CREATE INDEX IF NOT EXISTS datapoints_timestamp ON datapoints (timestamp)",
+    "CREATE TABLE IF NOT EXISTS rollups (resolution INTEGER NOT NULL, metric_id INTEGER NOT NULL REFERENCES metric_names(id), bucket INTEGER NOT NULL, tags JSON, value_count INTEGER, value_sum REAL, value_min REAL, value_max REAL, PRIMARY KEY (resolution, metric_id, bucket, tags))",
+    "CREATE INDEX IF NOT EXISTS rollups_bucket ON rollups (bucket)",
+    "CREATE TABLE IF NOT EXISTS flags (id INTEGER PRIMARY KEY CHECK (id = 1), is_shutdown BLOB)",
+)
+
+
+def connect(filename: str) -> sqlite3.Connection:
+    """Open the database, creating or upgrading its schema as needed.
+
+    :param filename: path to the database file
+    :type filename: str
+    :return: connection to the database
+    :rtype: sqlite3.Connection
+    """
+    _restrict_permissions(filename)
+    connection = sqlite3.connect(filename)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    with connection:
+        # Several processes connect at startup. Taking the write lock before looking at the schema keeps
+        # two of them from both upgrading it, which would count every datapoint twice in the rollups.
+        connection.execute("BEGIN IMMEDIATE")
+        has_rollups = _has_table(connection, "rollups")
+        _upgrade_legacy_schema(connection)
+        for sql in _SCHEMA:
+            connection.execute(sql)
+        if not has_rollups:
+            _build_rollups(connection)
+    return connection
+
+
+def _restrict_permissions(filename):
+    # SQLite gives the -wal and -shm files the mode of the database file, so the
+    # database file is created with its mode before SQLite first opens it.
+    fd = os.open(filename, os.O_RDWR | os.O_CREAT, DB_PERMISSIONS)
+    try:
+        if stat.S_IMODE(os.fstat(fd).st_mode) != DB_PERMISSIONS:
+            os.fchmod(fd, DB_PERMISSIONS)
+    finally:
+        os.close(fd)
+    # left behind by an earlier run that did not close its last connection
+    for suffix in ("-wal", "-shm"):
+        try:
+            if stat.S_IMODE(os.stat(filename + suffix).st_mode) != DB_PERMISSIONS:
+                os.chmod(filename + suffix, DB_PERMISSIONS)
+        except FileNotFoundError:
+            pass
+
+
+def _has_table(connection, name):
+    sql = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+    return connection.execute(sql, (name,)).fetchone() is not None
+
+
+def _build_rollups(connection):
+    # Rollups of datapoints stored before the rollups table existed
+    for resolution in ROLLUP_RESOLUTIONS:
+        connection.execute(
+            "INSERT INTO rollups SELECT ?, metric_id, (timestamp / ?) * ?, tags, COUNT(*), SUM(value), MIN(value), MAX(value) "
+            "FROM datapoints GROUP BY metric_id, timestamp / ?, tags",
+            (resolution, resolution, resolution, resolution),
+        )
+
+
+def _upgrade_legacy_schema(connection):
+    # Databases kept from earlier runs store metric names and timestamps as text in each row.
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(datapoints)")]
+    if len(columns) == 0 or "metric_id" in columns:
+        return
+
+    LOG.debug("Upgrading telemetry database to indexed schema")
+    connection.execute("ALTER TABLE datapoints RENAME TO legacy_datapoints")
+    for sql in _SCHEMA:
+        connection.execute(sql)
+    connection.execute("INSERT OR IGNORE INTO metric_names (name) SELECT DISTINCT metric FROM legacy_datapoints")
+    connection.execute(
+        "INSERT INTO datapoints SELECT names.id, CAST(old.timestamp AS INTEGER), old.value, old.tags "
+        "FROM legacy_datapoints AS old JOIN metric_names AS names ON names.name = old.metric"
+    )
+    connection.execute("DROP TABLE legacy_datapoints")
+
+
+def metric_names(cursor: sqlite3.Cursor) -> list:
+    """Names of all metrics that have been stored.
+
+    :param cursor: cursor of the database
+    :type cursor: sqlite3.Cursor
+    :return: metric names
+    :rtype: list
+    """
+    return [row[0] for row in cursor.execute("SELECT name FROM metric_names")]
+
+
+def _metric_ids(cursor, names):
+    cursor.executemany("INSERT OR IGNORE INTO metric_names (name) VALUES (?)", [(name,) for name in names])
+    ids = {}
+    for name in names:
+        ids[name] = cursor.execute("SELECT id FROM metric_names WHERE name = ?", (name,)).fetchone()[0]
+    return ids
+
+
+def insert_datapoints(connection: sqlite3.Connection, dps: list, timestamp: int) -> tuple:
+    """Insert datapoints in a single transaction.
+
+    :param connection: connection to the database
+    :type connection: sqlite3.Connection
+    :param dps: datapoints, each a dict with ``metric``, ``value`` and optionally ``tags`` and ``timestamp``
+    :type dps: list
+    :param timestamp: time in seconds of datapoints that do not carry their own
+    :type timestamp: int
+    :return: number of datapoints inserted, number that failed, and the error messages of the failures
+    :rtype: tuple
+    """
+    failed = 0
+    errors = []
+    valid = []
+    for dp in dps:
+        try:
+            valid.append(
+                (dp["metric"], int(dp.get("timestamp", timestamp)), float(dp["value"]), json.dumps(dp.get("tags", None)))
+            )
+        except Exception as e:
+            failed += 1
+            errors.append(str(e))
+
+    if len(valid) == 0:
+        return 0, failed, errors
+
+    try:
+        with connection:
+            cursor = connection.cursor()
+            ids = _metric_ids(cursor, {dp[0] for dp in valid})
+            rows = [(ids[metric], ts, value, tags) for metric, ts, value, tags in valid]
+            cursor.executemany("INSERT INTO datapoints VALUES (?,?,?,?)", rows)
+            cursor.executemany(
+                "INSERT INTO rollups VALUES (?,?,?,?,1,?,?,?) ON CONFLICT (resolution, metric_id, bucket, tags) DO UPDATE SET "
+                "value_count = value_count + 1, value_sum = value_sum + excluded.value_sum, "
+                "value_min = MIN(value_min, excluded.value_min), value_max = MAX(value_max, excluded.value_max)",
+                [
+                    (resolution, metric_id, ts - ts % resolution, tags, value, value, value)
+                    for resolution in ROLLUP_RESOLUTIONS
+                    for metric_id, ts, value, tags in rows
+                ],
+            )
+    except sqlite3.Error as e:
+        return 0, failed + len(valid), errors + [str(e)] * len(valid)
+
+    return len(valid), failed, errors
+
+
+def select_datapoints(cursor: sqlite3.Cursor, metric: str, start_time, end_time, tagk: str = None) -> list:
+    """Datapoints of a metric between two times, one row per tag of each datapoint.
+
+    :param cursor: cursor of the database
+    :type cursor: sqlite3.Cursor
+    :param metric: metric name
+    :type metric: str
+    :param start_time: earliest time in seconds
+    :param end_time: latest time in seconds
+    :param tagk: only return this tag of each datapoint, defaults to None for all of them
+    :type tagk: str, optional
+    :return: rows of (metric, timestamp, value, tag key, tag value) ordered by tag value
+    :rtype: list
+    """
+    sql = (
+        "SELECT names.name, dps.timestamp, dps.value, json_each.key AS tag_key, json_each.value AS tag_value "
+        "FROM metric_names AS names JOIN datapoints AS dps ON dps.metric_id = names.id, json_each(dps.tags) "
+        "WHERE names.name = ? AND dps.timestamp >= ? AND dps.timestamp <= ?"
+    )
+    args = [metric, start_time, end_time]
+    if tagk is not None:
+        sql += " AND tag_key = ?"
+        args.append(tagk)
+    sql += " ORDER BY tag_value"
+    return cursor.execute(sql, args).fetchall()
+
+
+def rollup_interval(interval: float) -> int:
+    """Round a bucket width up so that a rollup can serve it.
+
+    :param interval: smallest acceptable bucket width in seconds
+    :type interval: float
+    :return: the interval rounded up to a multiple of the largest resolution in ``ROLLUP_RESOLUTIONS`` that is not
+        above it, or up to whole seconds if it is below all of them
+    :rtype: int
+    """
+    resolution = max((r for r in ROLLUP_RESOLUTIONS if r <= interval), default=1)
+    return math.ceil(interval / resolution) * resolution
+
+
+def select_downsampled(
+    cursor: sqlite3.Cursor, metric: str, start_time, end_time, interval: int, aggregate: str, tagk: str = None
+) -> list:
+    """Datapoints of a metric between two times, aggregated over buckets of ``interval`` seconds.
+
+    Reads from the coarsest rollup whose resolution divides the interval, or from the raw datapoints if there is none.
+    Only datapoints from ``start_time`` up to ``end_time`` are aggregated, so the first and last buckets may cover less
+    than ``interval``. Rollup buckets are only read where they lie entirely within that range, and the raw datapoints
+    are read for the part before the first and after the last of them.
+
+    :param cursor: cursor of the database
+    :type cursor: sqlite3.Cursor
+    :param metric: metric name
+    :type metric: str
+    :param start_time: earliest time in seconds
+    :param end_time: latest time in seconds
+    :param interval: width of each bucket in seconds
+    :type interval: int
+    :param aggregate: one of ``DOWNSAMPLE_AGGREGATES``
+    :type aggregate: str
+    :param tagk: only return this tag of each datapoint, defaults to None for all of them
+    :type tagk: str, optional
+    :return: rows of (metric, bucket start time, value, tag key, tag value) ordered by tag value and time
+    :rtype: list
+    """
+    resolution = max((r for r in ROLLUP_RESOLUTIONS if interval % r == 0), default=None)
+    # filtering on the aligned bucket instead would pull in datapoints from before start_time
+    start_time = math.ceil(start_time)
+    if resolution is None:
+        columns = _RAW_COLUMNS
+        sql = (
+            "SELECT names.name, (dps.timestamp / ?) * ? AS time_bucket, {value} AS value, "
+            "json_each.key AS tag_key, json_each.value AS tag_value "
+            "FROM metric_names AS names JOIN datapoints AS dps ON dps.metric_id = names.id, json_each(dps.tags) "
+            "WHERE names.name = ? AND dps.timestamp >= ? AND dps.timestamp <= ?"
+        )
+        args = [interval, interval, metric, start_time, end_time]
+    else:
+        columns = _ROLLUP_COLUMNS
+        rollup_start = math.ceil(start_time / resolution) * resolution
+        # the first bucket that runs past end_time
+        rollup_end = max((math.floor(end_time) + 1) // resolution * resolution, rollup_start)
+        sql = (
+            "SELECT dps.name, (dps.bucket / ?) * ? AS time_bucket, {value} AS value, "
+            "json_each.key AS tag_key, json_each.value AS tag_value "
+            "FROM ("
+            "SELECT names.name, raw.timestamp AS bucket, raw.tags, 1 AS value_count, raw.value AS value_sum, "
+            "raw.value AS value_min, raw.value AS value_max "
+            "FROM metric_names AS names JOIN datapoints AS raw ON raw.metric_id = names.id "
+            "WHERE names.name = ? AND raw.timestamp >= ? AND raw.timestamp <= ? "
+            "AND (raw.timestamp < ? OR raw.timestamp >= ?) "
+            "UNION ALL "
+            "SELECT names.name, rollup.bucket, rollup.tags, rollup.value_count, rollup.value_sum, "
+            "rollup.value_min, rollup.value_max "
+            "FROM metric_names AS names JOIN rollups AS rollup ON rollup.metric_id = names.id "
+            "WHERE rollup.resolution = ? AND names.name = ? AND rollup.bucket >= ? AND rollup.bucket < ?"
+            ") AS dps, json_each(dps.tags)"
+        )
+        args = [interval, interval, metric, start_time, end_time, rollup_start, rollup_end]
+        args += [resolution, metric, rollup_start, rollup_end]
+    if tagk is not None:
+        sql += " AND tag_key = ?" if resolution is None else " WHERE tag_key = ?"
+        args.append(tagk)
+    sql += " GROUP BY time_bucket, tag_key, tag_value ORDER BY tag_value, time_bucket"
+    value = DOWNSAMPLE_AGGREGATES[aggregate].format(**columns)
+    return cursor.execute(sql.format(value=value), args).fetchall()
+
+
+def delete_before(connection: sqlite3.Connection, start_time: int) -> None:
+    """Remove datapoints older than the given time.
+
+    :param connection: connection to the database
+    :type connection: sqlite3.Connection
+    :param start_time: time in seconds of the oldest datapoints to keep
+    :type start_time: int
+    """
+    with connection:
+        connection.execute("DELETE FROM datapoints WHERE timestamp < ?", [int(start_time)])
+        connection.execute("DELETE FROM rollups WHERE bucket + resolution <= ?", [int(start_time)])
+
+
+def remove(filename: str) -> None:
+    """Remove the database file along with its write-ahead log.
+
+    :param filename: path to the database file
+    :type filename: str
+    """
+    os.remove(filename)
+    for suffix in ("-wal", "-shm"):
+        try:
+            os.remove(filename + suffix)
+        except FileNotFoundError:
+            pass
@@ -89,6 +89,7 @@ async def tcp_transport_agent(
     oob_ip_addr: str = None,
     oob_port: str = None,
     frontend: bool = False,
+    connections_per_peer: int = None,
 ) -> None:
 
     # TODO: get rid of globals from proxy-api work (when possible)
@@ -220,6 +221,9 @@ async def tcp_transport_agent(
                 transport._oob_accept = True
             wait_mode = IDLE_WAIT
 
+        if connections_per_peer is not None:
+            transport.connections_per_peer = int(connections_per_peer)
+
         LOGGER.info(f"Created transport: {transport.addr} with wait mode {wait_mode}")
 
         if tls_enabled:
@@ -342,6 +346,13 @@ def main(args=None):
     parser.add_argument("--no-tls-verify", dest="tls_verify", action="store_false", help="Disable TLS verficiation")
 
     parser.add_argument("--max-threads", type=int, help="Maximum number of threads to use")
+    parser.add_argument(
+        "--connections-per-peer",
+        type=int,
+        choices=range(1, 257),
+        metavar="N",
+        help="Number of connections to open to each peer (default: %(default)s)",
+    )
     parser.add_argument("--frontend", action="store_true", help="Whether this is being started on the frontend")
 
     def get_log_level(level):
@@ -395,6 +406,9 @@ def main(args=None):
         keyfile=os.environ.get("DRAGON_TRANSPORT_TCP_KEYFILE"),
         tls_verify=os.environ.get("DRAGON_TRANSPORT_TCP_TLS_VERIFY", True),
         max_threads=os.environ.get("DRAGON_TRANSPORT_TCP_MAX_THREADS"),
+        connections_per_peer=os.environ.get(
+            "DRAGON_TRANSPORT_TCP_CONNECTIONS_PER_PEER", StreamTransport.CONNECTIONS_PER_PEER
+        ),
         log_level=os.environ.get("DRAGON_TRANSPORT_LOG_LEVEL", "WARNING"),
         dragon_logging=True,
         log_sdesc=None,
@@ -476,6 +490,7 @@ def main(args=None):
                 args.oob_ip_addr,
                 args.oob_port,
                 args.frontend,
+                args.connections_per_peer,
             )
         )
     except Exception:
@@ -1,13 +1,14 @@
 import asyncio
 from functools import partial, singledispatchmethod
 import logging
+import threading
 from typing import Optional
 
 from ...channels import GatewayMessage, Channel, ChannelEmpty, ChannelRecvTimeout
 from ...dtypes import WaitMode, DEFAULT_WAIT_MODE
 from ...infrastructure.node_desc import NodeDescriptor
 
-from .errno import get_errno, DRAGON_TIMEOUT
+from .errno import get_errno, DRAGON_FAILURE, DRAGON_TIMEOUT
 from .io import UUIDBytesIO
 from .messages import (
     ErrorResponse,
@@ -33,8 +34,18 @@ LOGGER = logging.getLogger("dragon.transport.tcp.client")
 class Client(TaskMixin):
     """Attaches to channel, receives gateway messages, and processes requests
     with the corresponding transport server.
+
+    Gateway messages are received by a dedicated thread that blocks on the
+    channel and hands them to the event loop in batches, so a message that
+    arrives after an idle period is processed as soon as it is received.
     """
 
+    RECV_BATCH_SIZE = 64
+    """Maximum number of gateway messages handed to the event loop at once."""
+
+    READER_STOP_INTERVAL = 1.0
+    """Seconds between checks by the receiving thread for whether to stop."""
+
     def __init__(
         self,
         channel_sdesc: bytes,
@@ -51,43 +62,49 @@ class Client(TaskMixin):
         self._recv_handle = None
         self._wait_mode = wait_mode
         self._background_tasks = set()
+        self._received = None
+        self._reader = None
+        self._stop_reader = threading.Event()
 
     @run_forever
     async def run(self) -> None:
         await asyncio.to_thread(self.open)
         try:
+            self._start_reader()
             while True:
-                msg = await self.recv()
-                LOGGER.debug(f"Received gateway message: {msg}")
-                try:
-                    task = self.process(msg)
-                except BaseException as e:
-                    LOGGER.exception(f"Error processing gateway message: {msg}")
+                for msg in await self.recv():
+                    LOGGER.debug(f"Received gateway message: {msg}")
+                    self._process(msg)
+        finally:
+            await asyncio.to_thread(self._join_reader)
+            self._discard_received()
+            await asyncio.to_thread(self.close)
 
-                    # Try to complete the gateway message with the error
-                    try:
-                        msg.complete_error(get_errno(e))
-                    except:
-                        LOGGER.exception("Failed to complete gateway message with error")
+    def _process(self, msg: GatewayMessage) -> None:
+        try:
+            task = self.process(msg)
+        except BaseException as e:
+            LOGGER.exception(f"Error processing gateway message: {msg}")
 
-                    # Ensure gateway message is destroyed
-                    try:
-                        msg.destroy()
-                    except:
-                        LOGGER.exception("Failed to destroy gateway message")
+            # Try to complete the gateway message with the error
+            try:
+                msg.complete_error(get_errno(e))
+            except:
+                LOGGER.exception("Failed to complete gateway message with error")
 
-                    # Finally, ignore Exceptions, but not BaseExceptions (e.g., KeyboardInterrupt)
-                    try:
-                        raise e
-                    except Exception:
-                        continue
-                else:
-                    self._background_tasks.add(task)
-                    task.add_done_callback(self._background_tasks.discard)
-                    LOGGER.debug(f"Processed gateway message: {msg}")
+            # Ensure gateway message is destroyed
+            try:
+                msg.destroy()
+            except:
+                LOGGER.exception("Failed to destroy gateway message")
 
-        finally:
-            await asyncio.to_thread(self.close)
+            # Finally, ignore Exceptions, but not BaseExceptions (e.g., KeyboardInterrupt)
+            if not isinstance(e, Exception):
+                raise
+        else:
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            LOGGER.debug(f"Processed gateway message: {msg}")
 
     def open(self) -> None:
         self._channel = Channel.attach(self.channel_sdesc)
@@ -102,24 +119,74 @@ class Client(TaskMixin):
         self._recv_handle.close()
         self._channel.detach()
 
-    async def recv(self, interval: float = 0.1) -> GatewayMessage:
-        # TODO Consider revisiting this recv loop
+    def _start_reader(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._received = asyncio.Queue()
+        self._stop_reader.clear()
+        self._reader = threading.Thread(
+            target=self._read_channel, args=(loop, self._received), name=f"Client-{id(self)}-Reader", daemon=True
+        )
+        self._reader.start()
+
+    def _join_reader(self) -> None:
+        self._stop_reader.set()
+        if self._reader is not None:
+            self._reader.join()
+            self._reader = None
+
+    def _read_channel(self, loop: asyncio.AbstractEventLoop, received: asyncio.Queue) -> None:
+        """Receive gateway messages until stopped, passing each batch or the
+        error that ended receiving to the event loop.
+        """
         try:
-            msg = self._recv_handle.recv(blocking=False)
-        except (ChannelEmpty, ChannelRecvTimeout):
-            while True:
+            while not self._stop_reader.is_set():
                 try:
-                    msg = await asyncio.to_thread(self._recv_handle.recv, timeout=interval)
-                    break
-                except (ChannelRecvTimeout, ChannelEmpty):
+                    batch = [self._recv_handle.recv(timeout=self.READER_STOP_INTERVAL)]
+                except (ChannelEmpty, ChannelRecvTimeout):
                     continue
-                except asyncio.CancelledError:
-                    await asyncio.sleep(interval)
-                    raise
-        try:
-            return GatewayMessage.from_message(msg)
-        finally:
-            msg.destroy()
+                while len(batch) < self.RECV_BATCH_SIZE:
+                    try:
+                        batch.append(self._recv_handle.recv(blocking=False))
+                    except (ChannelEmpty, ChannelRecvTimeout):
+                        break
+                msgs = []
+                for msg in batch:
+                    try:
+                        msgs.append(GatewayMessage.from_message(msg))
+                    except Exception:
+                        LOGGER.exception("Failed to attach gateway message")
+                    finally:
+                        msg.destroy()
+                loop.call_soon_threadsafe(received.put_nowait, msgs)
+        except BaseException as e:
+            try:
+                loop.call_soon_threadsafe(received.put_nowait, e)
+            except RuntimeError:
+                # Event loop is closed
+                pass
+
+    def _discard_received(self) -> None:
+        # Fail gateway messages received but not processed before stopping
+        while self._received is not None and not self._received.empty():
+            batch = self._received.get_nowait()
+            if isinstance(batch, BaseException):
+                continue
+            for msg in batch:
+                try:
+                    msg.complete_error(DRAGON_FAILURE)
+                    msg.destroy()
+                except:
+                    LOGGER.exception("Failed to discard gateway message")
+
+    async def recv(self) -> list[GatewayMessage]:
+        """Returns the next batch of gateway messages received from the channel.
+
+        Raises the error that stopped the receiving thread, if any.
+        """
+        batch = await self._received.get()
+        if isinstance(batch, BaseException):
+            raise batch
+        return batch
 
     def update_nodes(self, node_update_map: dict[int, Address]):
         """Update the node dictionary for routing gateway requests
@@ -162,6 +162,26 @@ class Hello6(Hello, typeid=b"\x60"):
     """Host `ipaddress.IPv6Address`"""
 
 
+@dataclass
+class LaneHello(Hello, typeid=b"\x41"):
+    """Handshake message to communicate corresponding IPv4 server address
+    and the lane carried by the connection.
+    """
+
+    lane: uint8
+    """Lane number"""
+
+
+@dataclass
+class LaneHello6(Hello6, typeid=b"\x61"):
+    """Handshake message to communicate corresponding IPv6 server address
+    and the lane carried by the connection.
+    """
+
+    lane: uint8
+    """Lane number"""
+
+
 @dataclass
 class SequencedTransportMessage(TransportMessage):
     """Base class for messages with sequnce numbers."""
@@ -412,27 +432,67 @@ async def read_message(reader: asyncio.StreamReader) -> TransportMessage:
     return msg
 
 
-async def write_message(writer: asyncio.StreamWriter, msg: TransportMessage) -> None:
-    """Write message to specified stream.
+class _BufferList(list):
+    """List of buffers that stands in for a stream when encoding messages, so
+    that a batch of messages may be written with a single call to
+    `asyncio.StreamWriter.writelines`.
+    """
+
+    write = list.append
+
+
+def encode_message(msg: TransportMessage) -> list[bytes]:
+    """Encode message as a list of buffers.
 
     See `TransportMessage` for more information about how messages are
-    deserialized based on annotations.
+    serialized based on annotations.
 
-    :param writer: Stream to write
-    :param msg: Message to write
+    :param msg: Message to encode
+    :return: Buffers which, written in order, make up the message
     """
     cls = type(msg)
     try:
         typeid = cls._typeid
     except AttributeError:
         raise NotImplementedError(f"TransportMessage type not writable: {cls}")
-    writer.write(typeid)
+    buffers = _BufferList()
+    buffers.write(typeid)
     for name, io in _get_io_annotations(cls).items():
         try:
-            io.write(writer, getattr(msg, name))
+            io.write(buffers, getattr(msg, name))
         except:
             LOGGER.exception(f"Error writing message attribute: {cls.__name__}.{name}")
             raise
+    return buffers
+
+
+async def write_message(writer: asyncio.StreamWriter, msg: TransportMessage) -> None:
+    """Write message to specified stream.
+
+    See `TransportMessage` for more information about how messages are
+    deserialized based on annotations.
+
+    :param writer: Stream to write
+    :param msg: Message to write
+    """
+    await write_messages(writer, [msg])
+
+
+async def write_messages(writer: asyncio.StreamWriter, msgs: list[TransportMessage]) -> None:
+    """Write a batch of messages to specified stream.
+
+    The messages are encoded into a single list of buffers which is handed to
+    the stream at once, so that small messages share system calls and TCP
+    segments instead of being sent one at a time.
+
+    :param writer: Stream to write
+    :param msgs: Messages to write, in order
+    """
+    buffers = []
+    for msg in msgs:
+        buffers.extend(encode_message(msg))
+    writer.writelines(buffers)
     await writer.drain()
-    # Set the I/O event since the message has been written to a stream
-    msg._io_event.set()
+    # Set the I/O event since the messages have been written to a stream
+    for msg in msgs:
+        msg._io_event.set()
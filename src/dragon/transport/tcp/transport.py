@@ -8,6 +8,7 @@ from ipaddress import ip_address, IPv4Address, IPv6Address
 from itertools import chain, count
 import logging
 import os
+import time
 from typing import IO, Union
 from urllib.parse import urlsplit
 from warnings import warn
@@ -73,9 +74,15 @@ class Address:
             return host
         return f"{host}:{self.port}"
 
-    def hello(self) -> Union[Hello, Hello6]:
-        """Returns corresponding Hello message for this address."""
+    def hello(self, lane: int = 0) -> Union[Hello, Hello6]:
+        """Returns corresponding Hello message for this address.
+
+        :param lane: Lane carried by the connection, see `StreamTransport`
+        """
         assert self.port is not None
+        if lane:
+            cls = LaneHello6 if isinstance(self.host, IPv6Address) else LaneHello
+            return cls(self.host, self.port, lane)
         cls = Hello6 if isinstance(self.host, IPv6Address) else Hello
         return cls(self.host, self.port)
 
@@ -84,17 +91,31 @@ class Address:
         """Returns Address from `Hello` message."""
         return cls(ip_address(hello.host), int(hello.port))
 
-    async def do_handshake(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Address:
+    async def do_handshake(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, lane: int = 0) -> Address:
         """Exchange Hello messages with peer.
 
         :param reader: Stream for messages from peer
         :param writer: Stream for messages to peer
+        :param lane: Lane carried by the connection
         :return: Peer address
         """
-        await write_message(writer, self.hello())
+        addr, _ = await self.do_lane_handshake(reader, writer, lane)
+        return addr
+
+    async def do_lane_handshake(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, lane: int = 0
+    ) -> tuple[Address, int]:
+        """Exchange Hello messages with peer.
+
+        :param reader: Stream for messages from peer
+        :param writer: Stream for messages to peer
+        :param lane: Lane carried by the connection
+        :return: Peer address and the lane advertised by the peer
+        """
+        await write_message(writer, self.hello(lane))
         resp = await read_message(reader)
         assert isinstance(resp, Hello)
-        return type(self).from_hello(resp)
+        return type(self).from_hello(resp), getattr(resp, "lane", 0)
 
 
 LOOPBACK_ADDRESS_IPv4 = Address.from_netloc("127.0.0.1")
@@ -211,13 +232,16 @@ class Transport:
     @_handle_recv.register
     def _(self, req: Request, addr: Address, /) -> None:
         """ "Handle a `Request."""
+        self._handle_request(req, addr, addr)
+
+    def _handle_request(self, req: Request, addr: Address, source, /) -> None:
         LOGGER.debug(f"Received request from {addr}: {req}")
         # Protect against inadvertant replays by checking the last seqno from
-        # each address.
-        if req.seqno <= self._last_request[addr]:
+        # each source, i.e., each address or each lane of an address.
+        if req.seqno <= self._last_request[source]:
             LOGGER.error("Received duplicate request from {addr}: {req}")
             return
-        self._last_request[addr] = req.seqno
+        self._last_request[source] = req.seqno
         # Queue request so it can be read
         self._requests.put_nowait((req, addr))
 
@@ -308,6 +332,23 @@ class StreamTransport(Transport, TaskMixin):
     send-loop task exists or creates one using using the most recent
     `asyncio.StreamWriter` available for the recipient, see
     `StreamTransport._do_send`.
+    Each time it wakes, the send-loop takes every message queued for the
+    recipient, up to `StreamTransport.MAX_SEND_BATCH`, and writes them with a
+    single `asyncio.StreamWriter.writelines` call so that small messages share
+    system calls and TCP segments. Set `StreamTransport.SEND_COALESCE_DELAY` to
+    also wait briefly for messages queued right after.
+
+    By default each peer is reached over a single connection. Setting
+    `StreamTransport.connections_per_peer` to *N* > 1 opens up to *N*
+    connections, or *lanes*, to each peer, each with its own mailbox and
+    send-loop. Lane 0 is the priority lane for control traffic; messages whose
+    payload is at least `StreamTransport.LARGE_MESSAGE_SIZE` bytes are spread
+    over the remaining bulk lanes so a large transfer neither holds up small
+    messages nor is limited to a single stream. Requests from the same channel
+    send handle must arrive in order, so they are pinned to the lane of the
+    first one until the handle has had nothing in flight for
+    `StreamTransport.LANE_PIN_TIMEOUT` seconds. A connection advertises its
+    lane in the handshake, and replayed requests are detected per lane.
 
     Messages are not tied to underlying connections and do not need to be sent
     and received on corresponding `asyncio.StreamReader` and
@@ -361,6 +402,27 @@ class StreamTransport(Transport, TaskMixin):
 
     IDLE_SEND_TIMEOUT = 60.0
 
+    MAX_SEND_BATCH = 256
+    """Maximum number of queued messages written to a connection at once."""
+
+    SEND_COALESCE_DELAY = 0.0
+    """Seconds a sender waits after taking a message for more to write along
+    with it, e.g., ``50e-6``. Disabled by default, in which case only messages
+    already queued are batched.
+    """
+
+    CONNECTIONS_PER_PEER = 1
+    """Default number of connections, or lanes, opened to each peer."""
+
+    LARGE_MESSAGE_SIZE = 2**16
+    """Payload size in bytes from which messages are sent on bulk lanes."""
+
+    LANE_PIN_TIMEOUT = 5.0
+    """Seconds a channel send handle must be idle before it may change lanes."""
+
+    MAX_LANE_PINS = 4096
+    """Number of pinned send handles per peer above which idle ones are dropped."""
+
     def __init__(self, addr: Address):
         """
         :param addr: Server address to accept peer connections.
@@ -380,6 +442,10 @@ class StreamTransport(Transport, TaskMixin):
         self._recv_tasks = defaultdict(WeakSet)
         self._mailboxes = defaultdict(asyncio.Queue)
         self._send_tasks = WeakValueDictionary()
+        self.connections_per_peer = self.CONNECTIONS_PER_PEER
+        """Number of connections, or lanes, opened to each peer, at most 256."""
+        self._lane_pins = defaultdict(dict)
+        self._next_bulk_lane = defaultdict(int)
         self._oob_connect = False
         self._oob_accept = False
 
@@ -462,7 +528,7 @@ class StreamTransport(Transport, TaskMixin):
             Called by the transport server when accepting new connections. Not
             intended to be called directly.
         """
-        addr = await self.addr.do_handshake(reader, writer)
+        addr, lane = await self.addr.do_lane_handshake(reader, writer)
         # XXX Verifying the connection in this way prevents test code from
         # XXX forging addresses, but also impacts legitimate use cases, e.g.,
         # XXX proxies. The only resolution is to real client authentication,
@@ -472,42 +538,51 @@ class StreamTransport(Transport, TaskMixin):
         ## from the server side.
         # host, _ = writer.get_extra_info('peername')
         # assert addr.host == ip_address(host)
-        self.add_connection(addr, reader, writer)
+        self.add_connection(addr, reader, writer, lane)
 
-    async def _open_connection(self, addr: Address, /) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    async def _open_connection(
+        self, addr: Address, lane: int = 0, /
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
         """Open a connection to a peer transport server.
 
         :param addr: Peer address
+        :param lane: Lane carried by the connection
         :return: `asyncio.StreamReader` and `asyncio.StreamWriter` pair
         """
         opts = self.default_connection_options.new_child(self.connection_options[addr])
         if self._oob_connect or self._oob_accept:
             reader, writer = await asyncio.open_connection("localhost", int(addr.port), **opts)
-            await self.addr.do_handshake(reader, writer)
+            await self.addr.do_handshake(reader, writer, lane)
         else:
             reader, writer = await asyncio.open_connection(str(addr.host), int(addr.port), **opts)
-            addr = await self.addr.do_handshake(reader, writer)
+            addr = await self.addr.do_handshake(reader, writer, lane)
 
         # XXX See comment above in accept_connection() on why this is not a
         # XXX tenable workaround for actual server authentication.
         ## Verify connection is to the advertised address
         # host, port = writer.get_extra_info('peername')
         # assert addr == Address(ip_address(host), int(port))
-        self.add_connection(addr, reader, writer)
+        self.add_connection(addr, reader, writer, lane)
         return reader, writer
 
-    def add_connection(self, addr: Address, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        self._writers[addr].append(writer)
-        task = asyncio.create_task(self._do_recv(addr, reader), name=f"{type(self).__name__}-Receiver-{addr}")
-        self._recv_tasks[addr].add(task)
-        LOGGER.debug(f"Added connection to {addr}")
+    def add_connection(self, addr: Address, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, lane: int = 0):
+        key = lane_key(addr, lane)
+        self._writers[key].append(writer)
+        task = asyncio.create_task(
+            self._do_recv(addr, reader, lane), name=f"{type(self).__name__}-Receiver-{lane_name(addr, lane)}"
+        )
+        self._recv_tasks[key].add(task)
+        LOGGER.debug(f"Added connection to {lane_name(addr, lane)}")
 
-    async def connect(self, addr: Address) -> asyncio.StreamWriter:
+    async def connect(self, addr: Address, lane: int = 0) -> asyncio.StreamWriter:
         """Returns an open `asyncio.StreamWriter` connected to the specified
         address, opening a new connection if necessary.
 
         A task will be created to run the receive-loop for the corresponding
         `asyncio.StreamReader` as appropriate.
+
+        :param addr: Peer address
+        :param lane: Lane of the connection, see `StreamTransport`
         """
         # Do not allow self-connections, since messages to oneself are
         # short-circuited and never actually written to a connection.
@@ -517,42 +592,43 @@ class StreamTransport(Transport, TaskMixin):
         # XXX the resulting StreamWriters are ordered the same at both, i.e.,
         # XXX they may each have different views on which is the "latest". As a
         # XXX result two sockets may still be used.
+        key = lane_key(addr, lane)
         try:
-            lock = self._connection_locks[addr]
+            lock = self._connection_locks[key]
         except KeyError:
-            lock = self._connection_locks[addr] = asyncio.Lock()
+            lock = self._connection_locks[key] = asyncio.Lock()
         async with lock:
             # Search for open writers, opening a new connection as appropriate.
             while True:
-                open_writers = [w for w in self._writers[addr] if not w.is_closing()]
+                open_writers = [w for w in self._writers[key] if not w.is_closing()]
                 # If there are open writers, then this loop breaks and we only
                 # want to keep one, so clearing self._writers[addr] here is
                 # fine. Otherwise, if there are no open writers, then clearing
                 # self._writers[addr] before waiting for an open connection
                 # simply gets rid of closed writers, if any.
-                self._writers[addr].clear()
+                self._writers[key].clear()
                 if open_writers:
                     break
                 # Loop after _open_connection() completes to select an open
                 # writer instead of choosing the writer returned in case any
                 # connections were accepted while waiting.
                 try:
-                    await self._open_connection(addr)
+                    await self._open_connection(addr, lane)
                 except ConnectionRefusedError:
-                    LOGGER.exception(f"Failed to open connection to {addr}")
+                    LOGGER.exception(f"Failed to open connection to {lane_name(addr, lane)}")
                     continue
             # TODO I now think sorting the open_writers is pointless, remove?
             # Sort open writers to increase the chance that both peers choose
             # to keep the same  attempt to reduce the number of open sockets
             open_writers.sort(key=writer_addrs)
             writer = open_writers.pop()
-            self._writers[addr].append(writer)
+            self._writers[key].append(writer)
         # Close remaining open writers.
         await asyncio.gather(*[close_writer(w) for w in open_writers], return_exceptions=True)
         return writer
 
     @run_forever
-    async def _do_recv(self, addr: Address, reader: asyncio.StreamReader):
+    async def _do_recv(self, addr: Address, reader: asyncio.StreamReader, lane: int = 0):
         while not reader.at_eof():
             try:
                 msg = await read_message(reader)
@@ -561,9 +637,15 @@ class StreamTransport(Transport, TaskMixin):
                 # read; however, since the stream will have gotten EOF there
                 # isn't much to do with an incomplete message.
                 continue
-            LOGGER.debug(f"Received from {addr}: {msg}")
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(f"Received from {addr}: {msg}")
             try:
-                self._handle_recv(msg, addr)
+                if lane and isinstance(msg, Request):
+                    # Requests on different lanes are not ordered with
+                    # respect to one another, so check for replays per lane.
+                    self._handle_request(msg, addr, (addr, lane))
+                else:
+                    self._handle_recv(msg, addr)
             except Exception as e:
                 if isinstance(msg, Request):
                     resp = ErrorResponse(msg.seqno, DRAGON_FAILURE, "Uncaught exception handling message")
@@ -578,67 +660,147 @@ class StreamTransport(Transport, TaskMixin):
         if isinstance(msg, SendRequest) and msg.return_mode == SendReturnMode.IMMEDIATELY:
             resp = SendResponse(msg.seqno)
             self._handle_recv(resp, self.addr)
+        lane = self._select_lane(msg, addr)
         # Enqueue outgoing message
-        self._mailboxes[addr].put_nowait(msg)
+        self._mailboxes[lane_key(addr, lane)].put_nowait(msg)
         # Ensure send task is running
-        self._ensure_send_task(addr)
+        self._ensure_send_task(addr, lane)
+
+    def _select_lane(self, msg: TransportMessage, addr: Address) -> int:
+        if self.connections_per_peer <= 1:
+            return 0
+        large = len(getattr(msg, "payload", b"")) >= self.LARGE_MESSAGE_SIZE
+        if not isinstance(msg, SendRequest):
+            return self._next_lane(addr) if large else 0
+        # Requests from a channel send handle are processed in the order they
+        # arrive, so keep them on one lane while any may still be in flight.
+        pins = self._lane_pins[addr]
+        key = (msg.channel_sd, msg.sendhid)
+        pin = pins.get(key)
+        if pin is None or pin.expired(self.LANE_PIN_TIMEOUT):
+            if pin is None and len(pins) >= self.MAX_LANE_PINS:
+                for k in [k for k, p in pins.items() if p.expired(self.LANE_PIN_TIMEOUT)]:
+                    del pins[k]
+            pin = pins[key] = _LanePin(self._next_lane(addr) if large else 0)
+        pin.pending += 1
+        return pin.lane
+
+    def _next_lane(self, addr: Address) -> int:
+        # Round-robin over the bulk lanes
+        n = self._next_bulk_lane[addr]
+        self._next_bulk_lane[addr] = n + 1
+        return 1 + n % (self.connections_per_peer - 1)
+
+    def _unpin(self, msg: TransportMessage, addr: Address) -> None:
+        try:
+            pin = self._lane_pins[addr][(msg.channel_sd, msg.sendhid)]
+        except KeyError:
+            return
+        pin.pending -= 1
+        pin.written = time.monotonic()
 
-    def _ensure_send_task(self, addr: Address):
+    def _ensure_send_task(self, addr: Address, lane: int = 0):
+        key = lane_key(addr, lane)
         # Check if send task is still running
         try:
-            task = self._send_tasks[addr]
+            task = self._send_tasks[key]
         except KeyError:
             task = None
         else:
             if task.done():
                 # Remove reference to task
-                del self._send_tasks[addr]
+                del self._send_tasks[key]
                 task = None
         if task is None:
             # (Re-)Start send task
-            LOGGER.debug(f"Starting sender: {type(self).__name__}-Sender-{addr}")
-            self._send_tasks[addr] = asyncio.create_task(
-                self._do_send(addr), name=f"{type(self).__name__}-Sender-{addr}"
-            )
+            name = f"{type(self).__name__}-Sender-{lane_name(addr, lane)}"
+            LOGGER.debug(f"Starting sender: {name}")
+            self._send_tasks[key] = asyncio.create_task(self._do_send(addr, lane), name=name)
+
+    def _next_batch(self, mailbox: asyncio.Queue, batch: list) -> None:
+        # Drain messages already queued, up to the batch limit
+        while len(batch) < self.MAX_SEND_BATCH and not mailbox.empty():
+            batch.append(mailbox.get_nowait())
 
     @run_forever
-    async def _do_send(self, addr: Address) -> None:
-        writer = await self.connect(addr)
+    async def _do_send(self, addr: Address, lane: int = 0) -> None:
+        key = lane_key(addr, lane)
+        writer = await self.connect(addr, lane)
         while True:
+            mailbox = self._mailboxes[key]
             try:
-                msg = await asyncio.wait_for(self._mailboxes[addr].get(), self.IDLE_SEND_TIMEOUT)
+                msg = await asyncio.wait_for(mailbox.get(), self.IDLE_SEND_TIMEOUT)
             except asyncio.TimeoutError:
-                if self._mailboxes[addr].empty():
+                if mailbox.empty():
                     LOGGER.debug("Cleaning up idle mailbox")
                     # Idle timeout and still no outgoing messages, shutdown
-                    del self._mailboxes[addr]
+                    del self._mailboxes[key]
                     break
                 continue
 
-            LOGGER.debug(f"Sending to {addr}: {msg}")
-            if isinstance(msg, Request):
-                # Normalizes Request timeout based on the current monotonic
-                # clock. May scale timeout down to 0 if deadline exceeded, but
-                # does not preemptively raise DRAGON_TIMEOUT in order to satisfy
-                # "try once" semantics.
-                msg.deadline = msg.deadline
+            batch = [msg]
+            self._next_batch(mailbox, batch)
+            if self.SEND_COALESCE_DELAY > 0 and len(batch) < self.MAX_SEND_BATCH:
+                # Give messages queued shortly after the chance to share the write
+                await asyncio.sleep(self.SEND_COALESCE_DELAY)
+                self._next_batch(mailbox, batch)
+
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                for msg in batch:
+                    LOGGER.debug(f"Sending to {lane_name(addr, lane)}: {msg}")
+            for msg in batch:
+                if isinstance(msg, Request):
+                    # Normalizes Request timeout based on the current monotonic
+                    # clock. May scale timeout down to 0 if deadline exceeded, but
+                    # does not preemptively raise DRAGON_TIMEOUT in order to satisfy
+                    # "try once" semantics.
+                    msg.deadline = msg.deadline
             try:
-                await write_message(writer, msg)
+                await write_messages(writer, batch)
             except ConnectionError:
-                LOGGER.exception(f"Connection error while writing to {addr}: {msg}")
-                unget_nowait(self._mailboxes[addr], msg)
+                LOGGER.exception(f"Connection error while writing {len(batch)} messages to {lane_name(addr, lane)}")
+                for msg in reversed(batch):
+                    unget_nowait(mailbox, msg)
                 # Close existing writer, then get a new one and retry
                 await close_writer(writer)
-                writer = await self.connect(addr)
+                writer = await self.connect(addr, lane)
             except:
-                LOGGER.exception(f"Uncaught error while writing to {addr}: {msg}")
-                unget_nowait(self._mailboxes[addr], msg)
+                LOGGER.exception(f"Uncaught error while writing {len(batch)} messages to {lane_name(addr, lane)}")
+                for msg in reversed(batch):
+                    unget_nowait(mailbox, msg)
                 raise
             else:
-                self._mailboxes[addr].task_done()
-                if isinstance(msg, SendRequest) and msg.return_mode == SendReturnMode.WHEN_BUFFERED:
-                    resp = SendResponse(msg.seqno)
-                    self._handle_recv(resp, self.addr)
+                for msg in batch:
+                    mailbox.task_done()
+                    if isinstance(msg, SendRequest):
+                        if self.connections_per_peer > 1:
+                            self._unpin(msg, addr)
+                        if msg.return_mode == SendReturnMode.WHEN_BUFFERED:
+                            resp = SendResponse(msg.seqno)
+                            self._handle_recv(resp, self.addr)
+
+
+@dataclass
+class _LanePin:
+    """Lane of a channel send handle and its requests still to be written."""
+
+    lane: int
+    pending: int = 0
+    written: float = 0.0
+
+    def expired(self, timeout: float) -> bool:
+        return self.pending == 0 and time.monotonic() - self.written >= timeout
+
+
+def lane_key(addr: Address, lane: int):
+    """Key of the connection state for a lane; lane 0 is keyed by the address
+    alone.
+    """
+    return (addr, lane) if lane else addr
+
+
+def lane_name(addr: Address, lane: int) -> str:
+    return f"{addr}/{lane}" if lane else str(addr)
 
 
 def writer_addrs(writer):
@@ -3,7 +3,9 @@
 import unittest
 import os
 import multiprocessing as mp
-from dragon.fli import FLInterface, DragonFLIError, DragonFLIEOT
+import pickle
+import numpy as np
+from dragon.fli import FLInterface, DragonFLIError, DragonFLIEOT, PickleWriteAdapter, PickleReadAdapter
 from dragon.managed_memory import MemoryPool, MemoryAlloc
 from dragon.channels import Channel
 from dragon.localservices.options import ChannelOptions
@@ -272,6 +274,29 @@ class FLISendRecvTest(unittest.TestCase):
         sendh.close()
         p.join()
 
+    def test_send_recv_memoryview(self):
+        data = bytearray(b"Hello World")
+        with self.fli.sendh() as sendh:
+            sendh.send_bytes(memoryview(data)[6:])
+
+        with self.fli.recvh() as recvh:
+            (x, _) = recvh.recv_bytes()
+            self.assertEqual(b"World", x)
+
+    def test_pickle_adapters(self):
+        arr = np.arange(1024 * 1024, dtype=np.float64).reshape(1024, 1024)
+        value = {"contiguous": arr, "strided": arr[:, ::2], "bytes": b"x" * 1024**2}
+
+        with self.fli.sendh() as sendh:
+            pickle.dump(value, file=PickleWriteAdapter(sendh=sendh), protocol=5)
+
+        with self.fli.recvh() as recvh:
+            x = pickle.load(file=PickleReadAdapter(recvh=recvh))
+
+        self.assertTrue(np.array_equal(value["contiguous"], x["contiguous"]))
+        self.assertTrue(np.array_equal(value["strided"], x["strided"]))
+        self.assertEqual(value["bytes"], x["bytes"])
+
     def test_pass_fli(self):
         main2_ch = Channel(self.mpool, 101)
         manager2_ch = Channel(self.mpool, 102)
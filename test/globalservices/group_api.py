@@ -262,12 +262,13 @@ class GSGroupBaseClass(unittest.TestCase):
     def _send_get_responses(self, nitems, result):
         if result == "fail":
             shep_msg = tsu.get_and_check_type(self.shep_input_rh, dmsg.SHMultiProcessCreate)
+            procs = shep_msg.expand()
             responses = []
             for i in range(nitems):
                 responses.append(
                     dmsg.SHProcessCreateResponse(
                         tag=self.next_tag(),
-                        ref=shep_msg.procs[i].tag,
+                        ref=procs[i].tag,
                         err=dmsg.SHProcessCreateResponse.Errors.FAIL,
                         err_info="simulated failure",
                     )
@@ -281,11 +282,12 @@ class GSGroupBaseClass(unittest.TestCase):
             self.gs_input_wh.send(shep_reply_msg.serialize())
         elif result == "success":
             shep_msg = tsu.get_and_check_type(self.shep_input_rh, dmsg.SHMultiProcessCreate)
+            procs = shep_msg.expand()
             responses = []
             for i in range(nitems):
                 responses.append(
                     dmsg.SHProcessCreateResponse(
-                        tag=self.next_tag(), ref=shep_msg.procs[i].tag, err=dmsg.SHProcessCreateResponse.Errors.SUCCESS
+                        tag=self.next_tag(), ref=procs[i].tag, err=dmsg.SHProcessCreateResponse.Errors.SUCCESS
                     )
                 )
             shep_reply_msg = dmsg.SHMultiProcessCreateResponse(
@@ -298,12 +300,13 @@ class GSGroupBaseClass(unittest.TestCase):
         else:
             # we create half failed processes and half successful ones
             shep_msg = tsu.get_and_check_type(self.shep_input_rh, dmsg.SHMultiProcessCreate)
+            procs = shep_msg.expand()
 
             responses = []
             for i in range(0, nitems // 2):
                 responses.append(
                     dmsg.SHProcessCreateResponse(
-                        tag=self.next_tag(), ref=shep_msg.procs[i].tag, err=dmsg.SHProcessCreateResponse.Errors.SUCCESS
+                        tag=self.next_tag(), ref=procs[i].tag, err=dmsg.SHProcessCreateResponse.Errors.SUCCESS
                     )
                 )
 
@@ -311,7 +314,7 @@ class GSGroupBaseClass(unittest.TestCase):
                 responses.append(
                     dmsg.SHProcessCreateResponse(
                         tag=self.next_tag(),
-                        ref=shep_msg.procs[i].tag,
+                        ref=procs[i].tag,
                         err=dmsg.SHProcessCreateResponse.Errors.FAIL,
                         err_info="simulated failure",
                     )
@@ -772,11 +775,12 @@ class GSGroupAPI(GSGroupBaseClass):
 
     def _send_responses(self, nitems):
         shep_msg = tsu.get_and_check_type(self.shep_input_rh, dmsg.SHMultiProcessCreate)
+        procs = shep_msg.expand()
         responses = []
         for i in range(nitems):
             responses.append(
                 dmsg.SHProcessCreateResponse(
-                    tag=self.next_tag(), ref=shep_msg.procs[i].tag, err=dmsg.SHProcessCreateResponse.Errors.SUCCESS
+                    tag=self.next_tag(), ref=procs[i].tag, err=dmsg.SHProcessCreateResponse.Errors.SUCCESS
                 )
             )
         shep_reply_msg = dmsg.SHMultiProcessCreateResponse(
@@ -3,7 +3,9 @@
 
 import time
 
+import asyncio
 import copy
+import gc
 import inspect
 import logging
 import multiprocessing
@@ -14,6 +16,7 @@ import unittest
 import dragon.channels as dch
 import dragon.managed_memory as dmm
 
+import dragon.globalservices.aio as dgsaio
 import dragon.globalservices.api_setup as dapi
 import dragon.globalservices.channel as dchannel
 import dragon.globalservices.pool as dpool
@@ -335,6 +338,16 @@ class SingleProcAPIChannels(GSProcessBaseClass):
         descr = dproc.query(plist[0])
         self.assertEqual(descr.p_uid, self.head_puid)
 
+    def test_query_list(self):
+        bobdesc = self._create_proc("bob")
+        unknown_puid = bobdesc.p_uid + 1000
+
+        descrs = dproc.query_list([bobdesc.p_uid, unknown_puid, self.head_puid])
+        self.assertEqual(len(descrs), 3)
+        self.assertEqual(descrs[0].name, "bob")
+        self.assertIsNone(descrs[1])
+        self.assertEqual(descrs[2].p_uid, self.head_puid)
+
     def test_create(self):
         descr = self._create_proc("bob")
 
@@ -405,6 +418,70 @@ class SingleProcAPIChannels(GSProcessBaseClass):
         join_thread.join()
         self.assertEqual(join_result[0], test_exit_code)
 
+    def test_async_query_many(self):
+        names = ["bob", "fred", "sue"]
+        descs = [self._create_proc(name) for name in names]
+
+        queried = asyncio.run(dgsaio.query_many(names))
+        self.assertEqual([d.p_uid for d in queried], [d.p_uid for d in descs])
+
+        queried = asyncio.run(dgsaio.query_many(["bob", "nobody"], return_exceptions=True))
+        self.assertEqual(queried[0].p_uid, descs[0].p_uid)
+        self.assertIsInstance(queried[1], dproc.ProcessError)
+
+    def test_async_join_pipelined(self):
+        descs = [self._create_proc(name) for name in ["bob", "fred"]]
+
+        async def join_all():
+            joins = asyncio.gather(*(dgsaio.process_join(d.p_uid) for d in descs))
+            # a blocking caller is served while the async requests are outstanding
+            me = await asyncio.to_thread(dproc.query, self.head_puid)
+            for code, desc in enumerate(descs):
+                self.gs_input_wh.send(
+                    dmsg.SHProcessExit(tag=self.next_tag(), p_uid=desc.p_uid, exit_code=code).serialize()
+                )
+            return me, await joins
+
+        me, codes = asyncio.run(join_all())
+        self.assertEqual(me.p_uid, self.head_puid)
+        self.assertEqual(codes, [0, 1])
+
+    def test_async_finalizer_request(self):
+        descs = [self._create_proc(name) for name in ["bob", "fred"]]
+        head_puid = self.head_puid
+        queried = []
+
+        class Finalized:
+            # like the finalizers of Dragon objects, this one talks to GS
+            def __init__(self):
+                self.cycle = self
+
+            def __del__(self):
+                queried.append(dproc.query(head_puid).p_uid)
+
+        async def join_all():
+            joins = asyncio.gather(*(dgsaio.process_join(d.p_uid) for d in descs))
+            await asyncio.sleep(0.1)
+            # collections may now run on any thread while the async requests are outstanding
+            threshold = gc.get_threshold()
+            gc.set_threshold(1)
+            try:
+                for _ in range(10):
+                    Finalized()
+                    await asyncio.sleep(0.01)
+                await asyncio.to_thread(gc.collect)
+            finally:
+                gc.set_threshold(*threshold)
+            for code, desc in enumerate(descs):
+                self.gs_input_wh.send(
+                    dmsg.SHProcessExit(tag=self.next_tag(), p_uid=desc.p_uid, exit_code=code).serialize()
+                )
+            return await joins
+
+        codes = asyncio.run(asyncio.wait_for(join_all(), 30))
+        self.assertEqual(codes, [0, 1])
+        self.assertEqual(queried, [head_puid] * 10)
+
     def test_join_timeout(self):
         proc_name = "bob"
         desc = self._create_proc(proc_name)
@@ -432,6 +509,45 @@ class SingleProcAPIChannels(GSProcessBaseClass):
             self.assertEqual(res, None)
             self.assertGreater(duration, 0.5)
 
+    def test_join_timeout_busy(self):
+        proc_name = "bob"
+        self._create_proc(proc_name)
+
+        def join_wrap(identifier, result_list):
+            start = time.monotonic()
+            result_list.append(dproc.join(identifier, timeout=1.0))
+            result_list.append(time.monotonic() - start)
+
+        def query():
+            msg = dmsg.GSProcessQuery(
+                tag=self.next_tag(), p_uid=dfacts.LAUNCHER_PUID, r_c_uid=dfacts.BASE_BE_CUID, t_p_uid=self.head_puid
+            )
+            self.gs_input_wh.send(msg.serialize())
+
+        join_result = []
+        join_thread = threading.Thread(target=join_wrap, args=(proc_name, join_result))
+        join_thread.start()
+
+        # keep more messages queued than GS handles per turn of its main loop, within the channel capacity
+        outstanding = dserver.GlobalContext.MSGS_PER_ITERATION + 16
+        for _ in range(outstanding):
+            query()
+        sent = outstanding
+        deadline = time.monotonic() + 10
+        while join_thread.is_alive() and time.monotonic() < deadline:
+            tsu.get_and_check_type(self.bela_input_rh, dmsg.GSProcessQueryResponse)
+            query()
+            sent += 1
+        for _ in range(outstanding):
+            tsu.get_and_check_type(self.bela_input_rh, dmsg.GSProcessQueryResponse)
+        join_thread.join()
+
+        # the join times out on time although the input never ran empty
+        self.assertEqual(join_result[0], None)
+        self.assertGreater(join_result[1], 1.0)
+        self.assertLess(join_result[1], 5.0)
+        self.assertGreater(sent, 2 * outstanding)
+
     def test_pool_create(self):
         fake_pool_name = "swimming"
         desc = self._make_a_pool(fake_pool_name)
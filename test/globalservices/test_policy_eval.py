@@ -145,6 +145,42 @@ class TestEvaluator(unittest.TestCase):
         self.assertEqual(self.nodes[2].num_policies, 2)
         self.assertEqual(self.nodes[3].num_policies, 1)
 
+    def test_least_loaded(self):
+        eval = PolicyEvaluator(self.nodes, self.policy)
+        eval.process_started(100, 1)
+        eval.process_started(101, 1)
+        eval.process_started(102, 2)
+
+        policies = [Policy(distribution=Policy.Distribution.LEAST_LOADED) for _ in range(5)]
+        layouts = eval.evaluate(policies=policies)
+        self.assertEqual([layout.h_uid for layout in layouts], [3, 4, 2, 3, 4])
+
+        # The load is back to even once the processes exit
+        for p_uid in (100, 101, 102):
+            eval.process_exited(p_uid)
+        eval.process_exited(100)
+        self.assertEqual(eval.num_procs, {1: 0, 2: 0, 3: 0, 4: 0})
+
+    def test_bin_pack(self):
+        eval = PolicyEvaluator(self.nodes, self.policy)
+        eval.process_started(100, 3)
+
+        policies = [Policy(distribution=Policy.Distribution.BIN_PACK) for _ in range(self.node_cpus + 1)]
+        layouts = eval.evaluate(policies=policies)
+        self.assertEqual([layout.h_uid for layout in layouts], [3, 3, 3, 1, 1])
+
+    def test_spread(self):
+        eval = PolicyEvaluator(self.nodes, self.policy)
+        for p_uid in range(100, 100 + self.node_cpus):
+            eval.process_started(p_uid, 1)
+        eval.process_started(200, 2)
+
+        policies = [Policy(distribution=Policy.Distribution.SPREAD) for _ in range(self.num_nodes + 1)]
+        layouts = eval.evaluate(policies=policies)
+        self.assertEqual(sorted(layout.h_uid for layout in layouts[: self.num_nodes]), [1, 2, 3, 4])
+        self.assertEqual(layouts[0].h_uid, 3)
+        self.assertEqual(layouts[-1].h_uid, 3)
+
     def test_host_id(self):
         p = Policy(placement=Policy.Placement.HOST_ID, host_id=2)
         eval = PolicyEvaluator(self.nodes, self.policy)
@@ -0,0 +1,79 @@
+import unittest
+
+import dragon.infrastructure.messages as dmsg
+
+
+class MessageEncodingTest(unittest.TestCase):
+
+    def test_small_message(self):
+        msg = dmsg.GSTeardown(tag=7)
+        ser = msg.serialize()
+        self.assertTrue(ser.startswith("{"))
+
+        parsed = dmsg.parse(ser)
+        self.assertIsInstance(parsed, dmsg.GSTeardown)
+        self.assertEqual(parsed.tag, 7)
+
+        parsed = dmsg.parse(ser.encode())
+        self.assertIsInstance(parsed, dmsg.GSTeardown)
+
+    def test_large_message(self):
+        data = "x" * dmsg.SHFwdOutput.MAX
+        hostname = "h" * dmsg.COMPRESSION_THRESHOLD
+        msg = dmsg.SHFwdOutput(
+            tag=1, p_uid=2, idx=0, fd_num=dmsg.SHFwdOutput.FDNum.STDOUT.value, data=data, hostname=hostname
+        )
+        ser = msg.serialize()
+        self.assertFalse(ser.startswith("{"))
+        self.assertLess(len(ser), len(data) + len(hostname))
+
+        parsed = dmsg.parse(ser)
+        self.assertIsInstance(parsed, dmsg.SHFwdOutput)
+        self.assertEqual(parsed.data, data)
+        self.assertEqual(parsed.hostname, hostname)
+
+    def test_uncompressed_serialize(self):
+        msg = dmsg.LAExit(tag=3, sigint=True)
+        parsed = dmsg.parse(msg.uncompressed_serialize())
+        self.assertIsInstance(parsed, dmsg.LAExit)
+        self.assertTrue(parsed.sigint)
+
+    def test_capnp_message(self):
+        msg = dmsg.DDGetFreeze(tag=5, clientID=3)
+        parsed = dmsg.parse(msg.serialize())
+        self.assertIsInstance(parsed, dmsg.DDGetFreeze)
+        self.assertEqual(parsed.tag, 5)
+
+    def test_multi_process_create_template(self):
+        template = dmsg.SHProcessCreate(
+            tag=1, p_uid=0, r_c_uid=2, t_p_uid=10, exe="a.out", args=["-v"], env={"FOO": "bar"}
+        )
+        members = [
+            dmsg.ProcessCreateMember(template=0, tag=1, t_p_uid=10),
+            dmsg.ProcessCreateMember(template=0, tag=4, t_p_uid=12),
+        ]
+        msg = dmsg.SHMultiProcessCreate(tag=3, r_c_uid=2, procs=[], templates=[template], members=members)
+
+        parsed = dmsg.parse(msg.serialize())
+        self.assertIsInstance(parsed, dmsg.SHMultiProcessCreate)
+        procs = parsed.expand()
+        self.assertEqual([proc.tag for proc in procs], [1, 4])
+        self.assertEqual([proc.t_p_uid for proc in procs], [10, 12])
+        for proc in procs:
+            self.assertEqual(proc.exe, "a.out")
+            self.assertEqual(proc.args, ["-v"])
+            self.assertEqual(proc.env["FOO"], "bar")
+            self.assertEqual(proc.env["DRAGON_MY_PUID"], str(proc.t_p_uid))
+
+    def test_restrict(self):
+        ser = dmsg.GSTeardown(tag=1).serialize()
+        with self.assertRaises(TypeError):
+            dmsg.parse(ser, restrict={dmsg.MessageTypes.GS_HALTED.value})
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            dmsg.parse("not a message")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,7 @@ import sys
 import ctypes
 import random
 import string
+import numpy as np
 
 from dragon.globalservices.process import create, multi_join
 from dragon.infrastructure.process_desc import ProcessOptions
@@ -67,6 +68,15 @@ def square(A):
         a.y **= 2
 
 
+def double(A):
+    """Double every element of a zero copy array in place"""
+
+    with A:
+        view = A.get_memview()
+        for i in range(len(view)):
+            view[i] *= 2
+
+
 class TestArray(unittest.TestCase):
     def test_typedef_or_type(self):
         """typedef_or_type type checking"""
@@ -130,6 +140,42 @@ class TestArray(unittest.TestCase):
         with self.assertRaises(AttributeError):
             y.value
 
+    def test_zero_copy(self):
+        """zero copy arrays share one native buffer across processes"""
+
+        A = Array("d", [1.5, 2.5, 3.5, 4.5], zero_copy=True)
+        self.assertEqual(A[:], [1.5, 2.5, 3.5, 4.5])
+        self.assertEqual(A[-1], 4.5)
+
+        A[0] = 0.5
+        A[1:3] = [10.0, 20.0]
+        self.assertEqual(A[:], [0.5, 10.0, 20.0, 4.5])
+
+        B = Array("i", 3, zero_copy=True)
+        self.assertEqual(B[:], [0, 0, 0])
+        self.assertEqual(B.get_memview().format, "i")
+        with self.assertRaises(IndexError):
+            B[3]
+
+        p = Process(target=double, args=(A,))
+        p.start()
+        p.join()
+        self.assertEqual(A[:], [1.0, 20.0, 40.0, 9.0])
+
+        self.assertRaises(AttributeError, lambda: Array("c", 3, zero_copy=True))
+        self.assertRaises(AttributeError, lambda: Array("i", 3).get_memview())
+
+    def test_zero_copy_ndarray(self):
+        """the NumPy view aliases the array's memory"""
+
+        A = Array("q", range(8), zero_copy=True)
+        nd = A.get_ndarray()
+        self.assertEqual(nd.dtype, np.dtype(ctypes.c_longlong))
+        nd += 1
+        self.assertEqual(A[:], list(range(1, 9)))
+        A[0] = 100
+        self.assertEqual(nd[0], 100)
+
     def test_ping_pong(self):
         """queue ping pong between 2 processes that tests array assignment in
         parent and child processes"""
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import unittest
+import asyncio
 import traceback
 import cloudpickle
 import os
@@ -39,6 +40,7 @@ from dragon.infrastructure.policy import Policy
 from dragon.utils import b64encode, b64decode, hash as dhash, host_id
 from dragon.data.ddict import (
     DDict,
+    AsyncDDict,
     DDictFullError,
     DDictError,
     DDictCheckpointSyncError,
@@ -46,6 +48,7 @@ from dragon.data.ddict import (
     DDictPersistCheckpointError,
     strip_pickled_bytes,
     PosixCheckpointPersister,
+    PosixDeltaCheckpointPersister,
     DAOSCheckpointPersister,
     NULLCheckpointPersister,
 )
@@ -114,6 +117,14 @@ def batch_put(d, key, val):
     d.detach()
 
 
+def read_keys(d, num_keys):
+    for i in range(num_keys):
+        assert d[f"key{i}"] == i
+        assert f"key{i}" in d
+    assert d.mget([f"key{i}" for i in range(num_keys)]) == list(range(num_keys))
+    d.detach()
+
+
 def fillit(d):
     i = 0
     key = "abc"
@@ -2309,6 +2320,116 @@ class TestDDict(unittest.TestCase):
 
         d.destroy()
 
+    def test_mput_mget(self):
+        d = DDict(4, 1, 12000000, trace=True)
+        NUM_KEYS = 100
+        kvs = {f"key{i}": i for i in range(NUM_KEYS)}
+
+        d.mput(kvs)
+
+        keys = list(kvs.keys())
+        self.assertEqual(d.mget(keys), [kvs[key] for key in keys])
+        self.assertEqual(d.mget(reversed(keys)), [kvs[key] for key in reversed(keys)])
+
+        with self.assertRaises(KeyError):
+            d.mget(["key0", "no_such_key"])
+
+        d.destroy()
+
+    def test_mget_stale_response(self):
+        d = DDict(2, 1, 3000000, trace=True)
+        d.mput({"key0": "value0", "key1": "value1"})
+        self.assertEqual(d.mget(["key0"]), ["value0"])
+
+        # the response to a request no mget waits for still streams its value, which is tossed
+        manager_id, pickled_key = d._choose_manager_pickle_key("key0")
+        stale = dmsg.DDMultiGet(
+            d._tag_inc(),
+            d._client_id,
+            chkptID=d._chkpt_id,
+            keys=[pickled_key],
+            respFLI=d._serialized_stream_return_connector,
+        )
+        d._send([(stale, None)], d._managers[manager_id], buffered=True)
+        time.sleep(1)
+
+        self.assertEqual(d.mget(["key0", "key1"]), ["value0", "value1"])
+        self.assertEqual(d.mget(["key1", "key0"]), ["value1", "value0"])
+
+        d.destroy()
+
+    def test_threads_per_manager(self):
+        d = DDict(2, 1, 3000000, trace=True, threads_per_manager=4)
+        NUM_KEYS = 50
+        for i in range(NUM_KEYS):
+            d[f"key{i}"] = i
+
+        # the lookups are checked in the readers, so each of them has to exit cleanly
+        readers = [mp.Process(target=read_keys, args=(d, NUM_KEYS)) for _ in range(4)]
+        for proc in readers:
+            proc.start()
+        for proc in readers:
+            proc.join()
+            self.assertEqual(0, proc.exitcode)
+
+        # writes are still served in between lookups
+        d["key0"] = "value0"
+        self.assertEqual(d["key0"], "value0")
+        self.assertEqual(len(d), NUM_KEYS)
+
+        d.destroy()
+
+    def test_mcontains(self):
+        d = DDict(4, 1, 12000000, trace=True)
+        d.mput([("hello", "world"), (100, 200)])
+
+        self.assertEqual(d.mcontains(["hello", "dragon", 100, 101]), [True, False, True, False])
+        self.assertEqual(d.mcontains([]), [])
+
+        d.destroy()
+
+    def test_mput_during_batch_put(self):
+        d = DDict(2, 1, 3000000, trace=True)
+        d.start_batch_put()
+        with self.assertRaises(DDictError):
+            d.mput({"hello": "world"})
+        d.end_batch_put()
+        d.destroy()
+
+    def test_get_put_async(self):
+        d = DDict(2, 1, 3000000, trace=True)
+        NUM_KEYS = 50
+
+        put_futures = [d.put_async(f"key{i}", i) for i in range(NUM_KEYS)]
+        for future in put_futures:
+            self.assertIsNone(future.result())
+
+        get_futures = [d.get_async(f"key{i}") for i in range(NUM_KEYS)]
+        self.assertEqual([future.result() for future in get_futures], list(range(NUM_KEYS)))
+
+        self.assertTrue(d.contains_async("key0").result())
+        self.assertFalse(d.contains_async("no_such_key").result())
+        with self.assertRaises(KeyError):
+            d.get_async("no_such_key").result()
+
+        # synchronous operations still work while the dispatcher is running
+        d["sync_key"] = "sync_value"
+        self.assertEqual(d.get_async("sync_key").result(), "sync_value")
+
+        d.destroy()
+
+    def test_async_ddict(self):
+        d = DDict(2, 1, 3000000, trace=True)
+
+        async def run(ad):
+            await asyncio.gather(*[ad.put(f"key{i}", i) for i in range(20)])
+            self.assertTrue(await ad.contains("key1"))
+            return await ad.mget([f"key{i}" for i in range(20)])
+
+        self.assertEqual(asyncio.run(run(AsyncDDict(d))), list(range(20)))
+
+        d.destroy()
+
     def test_batch_put_multi_clients(self):
         d = DDict(4, 1, 12000000, trace=True, working_set_size=2, wait_for_keys=True)
 
@@ -2822,6 +2943,51 @@ class TestDDict(unittest.TestCase):
 
         ddict.destroy()
 
+    def test_read_cache(self):
+        ddict = DDict(2, 1, 1500000 * 2, trace=True, working_set_size=2, wait_for_keys=True)
+        ddict["hello"] = "world"
+        ddict["Miska"] = "dog"
+        ddict.enable_read_cache(1024)
+
+        # Nothing is cached until the dictionary is frozen
+        self.assertEqual(ddict["hello"], "world")
+        self.assertEqual(len(ddict.read_cache), 0)
+
+        ddict.freeze()
+        self.assertEqual(ddict["hello"], "world")
+        self.assertEqual(ddict.mget(["hello", "Miska"]), ["world", "dog"])
+        self.assertEqual(ddict["Miska"], "dog")
+        self.assertEqual(len(ddict.read_cache), 2)
+        self.assertEqual(ddict.read_cache.hits, 2)
+        self.assertEqual(ddict.read_cache.misses, 2)
+
+        ddict.unfreeze()
+        self.assertEqual(len(ddict.read_cache), 0)
+        ddict["hello"] = "there"
+        ddict.freeze()
+        self.assertEqual(ddict["hello"], "there")
+
+        ddict.unfreeze()
+        ddict.destroy()
+
+    def test_read_cache_eviction(self):
+        ddict = DDict(2, 1, 1500000 * 2, trace=True, working_set_size=2, wait_for_keys=True)
+        for i in range(4):
+            ddict[i] = bytes(100)
+        ddict.freeze()
+        ddict.enable_read_cache(300)
+
+        for i in range(4):
+            ddict[i]
+        self.assertEqual(len(ddict.read_cache), 2)
+        self.assertTrue(ddict.read_cache.nbytes <= 300)
+
+        ddict.checkpoint()
+        self.assertEqual(len(ddict.read_cache), 0)
+
+        ddict.unfreeze()
+        ddict.destroy()
+
     def test_get_from_frozen_dict(self):
         ddict = DDict(2, 1, 1500000 * 2, trace=True, working_set_size=2, wait_for_keys=True)
         ddict["hello"] = "world"
@@ -2845,6 +3011,9 @@ class TestDDictPersist(unittest.TestCase):
         for p in pathlib.Path(".").glob("*.ddict"):
             os.remove(p)
 
+        for p in pathlib.Path(".").glob("*.ddelta"):
+            os.remove(p)
+
         for p in pathlib.Path(".").glob("ddict_orc_*"):
             os.remove(p)
 
@@ -3159,6 +3328,62 @@ class TestDDictPersist(unittest.TestCase):
         self.assertEqual(dd_restore["key"], "v4")
         dd_restore.destroy()
 
+    def test_persist_delta_restore(self):
+        """
+        Make sure the delta persister restores unchanged, changed and deleted keys
+        of every persisted checkpoint by replaying its segments.
+        """
+        NUM_MANAGERS = 1
+        d = DDict(
+            NUM_MANAGERS,
+            1,
+            1500000 * NUM_MANAGERS,
+            trace=True,
+            working_set_size=2,
+            wait_for_keys=True,
+            persist_path="",
+            persist_freq=1,
+            persist_count=-1,
+            persister_class=PosixDeltaCheckpointPersister,
+        )
+        d["unchanged"] = "u"
+        d["key"] = "v0"
+        d["deleted"] = "d"
+        d.checkpoint()  ## 1
+        d["key"] = "v1"
+        d.checkpoint()  ## 2
+        d["key"] = "v2"  ## retire and write a full segment for checkpoint 0
+        del d["deleted"]
+        d.checkpoint()  ## 3
+        d["key"] = "v3"  ## retire and write checkpoint 1 relative to 0
+        d.checkpoint()  ## 4
+        d["key"] = "v4"  ## retire and write checkpoint 2 relative to 1
+
+        restore_name = d.get_name()
+        d.destroy()
+
+        path = pathlib.Path(".")
+        self.assertEqual(len(list(path.glob(f"{restore_name}*.ddelta"))), 3)
+
+        for chkpt_restore, value, has_deleted in ((0, "v0", True), (1, "v1", True), (2, "v2", False)):
+            dd_restore = DDict(
+                NUM_MANAGERS,
+                1,
+                1500000 * NUM_MANAGERS,
+                trace=True,
+                persist_path=".",
+                name=restore_name,
+                restore_from=chkpt_restore,
+                read_only=True,
+                persister_class=PosixDeltaCheckpointPersister,
+            )
+            self.assertEqual(dd_restore.persisted_ids(), [0, 1, 2])
+            self.assertEqual(dd_restore.checkpoint_id, chkpt_restore)
+            self.assertEqual(dd_restore["unchanged"], "u")
+            self.assertEqual(dd_restore["key"], value)
+            self.assertEqual("deleted" in dd_restore, has_deleted)
+            dd_restore.destroy()
+
     def test_persist_restore_from_non_existing_persist_chkpt(self):
         """
         Make sure that the dictionary raise exception when it is brought up with a non-existing
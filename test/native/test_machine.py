@@ -27,6 +27,16 @@ class TestMachineSingle(unittest.TestCase):
         mynode = dragon.native.machine.current()
         self.assertTrue(mynode.h_uid == host_id())
 
+    def test_system_nodes(self):
+        """Test that System builds its nodes from a single query of all node descriptors"""
+
+        alloc = dragon.native.machine.System()
+        self.assertEqual(alloc.nodes, dragon.globalservices.node.get_list())
+        self.assertTrue(alloc.primary_node.is_primary)
+
+        mynode = dragon.native.machine.Node(host_id())
+        self.assertEqual(mynode.hostname, alloc.primary_node.hostname)
+
 
 if __name__ == "__main__":
     unittest.main()
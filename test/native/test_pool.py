@@ -1,8 +1,9 @@
 import unittest
+import itertools
 import time
 
 import dragon  # DRAGON import before multiprocessing
-from dragon.native.pool import Pool
+from dragon.native.pool import Pool, IMAP_MAX_CHUNKSIZE
 
 TIMEOUT_DELTA_TOL = 1.0
 
@@ -66,6 +67,32 @@ class TestDragonNativePool(unittest.TestCase):
         pool.close()
         pool.join()
 
+    def test_node_queues(self):
+
+        pool = Pool(processes=4, node_queues=True)
+
+        self.assertEqual(pool.apply_async(sqr, (7,)).get(), 49)
+        self.assertEqual(pool.map_async(sqr, list(range(100)), chunksize=3).get(), list(map(sqr, list(range(100)))))
+
+        pool.close()
+        pool.join()
+
+    def test_map_async_shared_func(self):
+
+        pool = Pool(processes=4)
+
+        # the closure pickles to well over SHARED_FUNC_MIN_SIZE so it is sent once per worker
+        table = [x * x for x in range(100000)]
+
+        def lookup(x):
+            return table[x]
+
+        self.assertEqual(pool.map_async(lookup, list(range(100)), chunksize=1).get(), table[:100])
+        self.assertEqual(pool.map_async(lookup, list(range(100, 200)), chunksize=3).get(), table[100:200])
+
+        pool.close()
+        pool.join()
+
     # if max value of range is huge then we can wait in main thread for a long time before returning
     def test_terminate(self):
         pool = Pool(processes=4)
@@ -78,6 +105,80 @@ class TestDragonNativePool(unittest.TestCase):
         # Sanity check the pool didn't wait for all work to be done
         self.assertLess(stop - start, 2.0)
 
+    def test_close_idle(self):
+        pool = Pool(processes=4)
+        self.assertEqual(pool.apply_async(sqr, (3,)).get(), 9)
+        time.sleep(0.5)
+
+        # idle workers and the results handler are woken by sentinels rather than a poll
+        start = time.monotonic()
+        pool.close()
+        pool.join()
+        stop = time.monotonic()
+
+        self.assertLess(stop - start, 2.0)
+
+    def test_imap(self):
+        pool = Pool(processes=4)
+
+        self.assertEqual(list(pool.imap(sqr, range(100))), list(map(sqr, range(100))))
+        self.assertEqual(sorted(pool.imap_unordered(sqr, range(100), chunksize=7)), list(map(sqr, range(100))))
+        self.assertEqual(list(pool.imap(sqr, iter([]))), [])
+        self.assertRaises(ValueError, pool.imap, sqr, range(10), max_inflight=0)
+        self.assertRaises(ValueError, pool.imap_unordered, sqr, range(10), max_inflight=-1)
+
+        pool.close()
+        pool.join()
+
+    def test_imap_streaming(self):
+        pool = Pool(processes=4)
+        pulled = [0]
+
+        def numbers():
+            for i in itertools.count():
+                pulled[0] += 1
+                yield i
+
+        # an unbounded iterable is pulled only as far as results are consumed
+        it = pool.imap(sqr, numbers(), chunksize=None, max_inflight=8)
+        for i in range(1000):
+            self.assertEqual(it.next(timeout=30), i * i)
+        self.assertLess(pulled[0], 1000 + 8 * IMAP_MAX_CHUNKSIZE + 1)
+
+        pool.terminate()
+        pool.join()
+
+    def test_imap_partially_consumed(self):
+        pool = Pool(processes=4)
+
+        # a map does not wait for an imap the caller stopped consuming, nor do imaps wait on each other
+        it = pool.imap(sqr, itertools.count(), max_inflight=4)
+        self.assertEqual(it.next(timeout=30), 0)
+        self.assertEqual(pool.map(sqr, range(10)), list(map(sqr, range(10))))
+        pairs = zip(pool.imap(sqr, itertools.count()), pool.imap(sqr, itertools.count()))
+        self.assertEqual(list(itertools.islice(pairs, 10)), [(i * i, i * i) for i in range(10)])
+
+        # a closed iterator takes no more items and stops yielding
+        it.close()
+        self.assertRaises(StopIteration, it.next)
+
+        del pairs
+        start = time.monotonic()
+        pool.close()
+        pool.join()
+        self.assertLess(time.monotonic() - start, 10.0)
+
+    def test_imap_partially_consumed_close(self):
+        pool = Pool(processes=4)
+
+        # closing the pool stops unbounded iterables from being pulled, so join returns
+        it = pool.imap_unordered(sqr, itertools.count(), max_inflight=4)
+        self.assertIn(it.next(timeout=30), [0, 1, 4, 9])
+        start = time.monotonic()
+        pool.close()
+        pool.join()
+        self.assertLess(time.monotonic() - start, 10.0)
+
     def test_empty_iterable(self):
         p = Pool(1)
         self.assertEqual(p.map_async(sqr, []).get(), [])
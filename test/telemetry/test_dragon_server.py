@@ -12,6 +12,7 @@ import copy
 
 from dragon.globalservices.node import get_list, query
 from dragon.telemetry.dragon_server import DragonServer
+from dragon.telemetry import tsdb_store
 from dragon.infrastructure.policy import Policy
 
 from telemetry.telemetry_data import SAMPLE_DATA, BASE_GRAFANA_QUERY
@@ -58,16 +59,10 @@ class TestDragonTelemetryDragonServer(unittest.TestCase):
 
     @classmethod
     def add_data_to_DB(cls):
-        connection = sqlite3.connect(cls.filename)
-        cursor = connection.cursor()
-        sql_create_metrics = "CREATE TABLE IF NOT EXISTS datapoints (metric text, timestamp text, value real, tags json)"
-        cursor.execute(sql_create_metrics)
-        connection.commit()
-        sql_insert = "INSERT INTO datapoints VALUES (?,?,?,?)"
+        connection = tsdb_store.connect(cls.filename)
         for k, v in SAMPLE_DATA.items():
             for t, d in v.items():
-                cursor.execute(sql_insert, [k, t, d, json.dumps(None)])
-        connection.commit()
+                tsdb_store.insert_datapoints(connection, [{"metric": k, "value": d}], t)
         connection.close()
 
     def test_dragon_server_shutdown(self):
@@ -109,6 +104,85 @@ class TestDragonTelemetryDragonServer(unittest.TestCase):
         response = self.return_queue_aggregator.get()
         self.assertFalse(response["result"])
 
+    def test_dragon_server_downsample(self):
+        query_from_grafana = copy.deepcopy(BASE_GRAFANA_QUERY)
+        for key in list(SAMPLE_DATA.keys()):
+            for aggregate, reduce in (("max", max), ("min", min)):
+                with self.subTest(key=key, aggregate=aggregate):
+                    uid = str(int(time.time() * 100)) + "_" + str(get_ident())
+                    query_from_grafana["queries"][0]["metric"] = key
+                    query_from_grafana["queries"][0]["downsample"] = f"1m-{aggregate}"
+                    query_from_grafana["req_id"] = uid
+                    query_from_grafana["type"] = "query"
+                    self.input_queue.put(query_from_grafana)
+                    response = self.return_queue_aggregator.get(timeout=5)
+                    bucket = str((int(min(SAMPLE_DATA[key])) // 60) * 60)
+                    self.assertEqual({bucket: reduce(SAMPLE_DATA[key].values())}, response["result"][0]["dps"])
+
+    def test_dragon_server_max_data_points(self):
+        # 10s over one datapoint is served by the 10s rollup, and the datapoint before start stays out of its bucket
+        query_from_grafana = copy.deepcopy(BASE_GRAFANA_QUERY)
+        query_from_grafana["start"] = "1722010527000"
+        query_from_grafana["end"] = 1722010537
+        query_from_grafana["maxDataPoints"] = 1
+        del query_from_grafana["queries"][0]["downsample"]
+        for key in list(SAMPLE_DATA.keys()):
+            with self.subTest(key=key):
+                uid = str(int(time.time() * 100)) + "_" + str(get_ident())
+                query_from_grafana["queries"][0]["metric"] = key
+                query_from_grafana["req_id"] = uid
+                query_from_grafana["type"] = "query"
+                self.input_queue.put(query_from_grafana)
+                response = self.return_queue_aggregator.get(timeout=5)
+                dps = response["result"][0]["dps"]
+                self.assertEqual(["1722010520"], list(dps))
+                values = [SAMPLE_DATA[key]["1722010527"], SAMPLE_DATA[key]["1722010528"]]
+                self.assertAlmostEqual(sum(values) / len(values), dps["1722010520"])
+
+    def test_dragon_server_max_data_points_end(self):
+        # 10s up to mid-bucket is served by the 10s rollup, and the datapoint after end stays out of the last bucket
+        query_from_grafana = copy.deepcopy(BASE_GRAFANA_QUERY)
+        query_from_grafana["start"] = "1722010517000"
+        query_from_grafana["end"] = 1722010527
+        query_from_grafana["maxDataPoints"] = 1
+        del query_from_grafana["queries"][0]["downsample"]
+        for key in list(SAMPLE_DATA.keys()):
+            with self.subTest(key=key):
+                uid = str(int(time.time() * 100)) + "_" + str(get_ident())
+                query_from_grafana["queries"][0]["metric"] = key
+                query_from_grafana["req_id"] = uid
+                query_from_grafana["type"] = "query"
+                self.input_queue.put(query_from_grafana)
+                response = self.return_queue_aggregator.get(timeout=5)
+                dps = response["result"][0]["dps"]
+                self.assertEqual(["1722010520"], list(dps))
+                values = [SAMPLE_DATA[key]["1722010526"], SAMPLE_DATA[key]["1722010527"]]
+                self.assertAlmostEqual(sum(values) / len(values), dps["1722010520"])
+
+    def test_dragon_server_ingest(self):
+        ingest_queue = mp.Queue()
+        shutdown_event = mp.Event()
+        ds = DragonServer(
+            input_queue=mp.Queue(),
+            return_queue_dict=self.return_queue_dict,
+            shutdown_event=shutdown_event,
+            telemetry_config=self.telemetry_cfg,
+        )
+        batch = [
+            {"metric": "ingest_metric", "value": 1.5, "timestamp": 1722010600},
+            {"metric": "ingest_metric", "value": 2.5, "timestamp": 1722010601, "tags": {"gpu": 0}},
+        ]
+        ingest_queue.put(batch)
+        shutdown_event.set()
+        ingest_proc = mp.Process(target=ds._ingest, args=(ingest_queue,))
+        ingest_proc.start()
+        ingest_proc.join()
+
+        connection = tsdb_store.connect(self.filename)
+        rows = tsdb_store.select_datapoints(connection.cursor(), "ingest_metric", 1722010600, 1722010601)
+        connection.close()
+        self.assertEqual(sorted((row[1], row[2]) for row in rows), [(1722010600, 1.5), (1722010601, 2.5)])
+
 
 if __name__ == "__main__":
     mp.set_start_method("dragon")
@@ -5,12 +5,15 @@ import multiprocessing as mp
 import time
 import json
 import os
+import stat
+import threading
 from threading import get_ident
 import sqlite3
 from pickle import dumps
 
 from dragon.globalservices.node import get_list, query
 from dragon.telemetry.tsdb_app import app
+from dragon.telemetry import tsdb_store
 
 from telemetry.telemetry_data import SAMPLE_DATA
 
@@ -18,7 +21,7 @@ from telemetry.telemetry_data import SAMPLE_DATA
 def get_dps_of_each_row(filename):
     connection = sqlite3.connect(filename)
     cursor = connection.cursor()
-    stmt = "SELECT * FROM datapoints"
+    stmt = "SELECT names.name, dps.timestamp, dps.value FROM datapoints AS dps JOIN metric_names AS names ON dps.metric_id = names.id"
     result = cursor.execute(stmt).fetchall()
     final = {}
     for row in result:
@@ -37,23 +40,13 @@ class TestDragonTelemetryTSDBApp(unittest.TestCase):
         cls.shutdown_event = mp.Event()
         user = os.environ.get("USER", str(os.getuid()))
         cls.filename = "/tmp/ts_" + user + "_" + os.uname().nodename + "_tsdb_app_test" + ".db"
-        cls.connection = sqlite3.connect(cls.filename)
+        cls.connection = tsdb_store.connect(cls.filename)
         cursor = cls.connection.cursor()
-        sql_create_metrics = (
-            "CREATE TABLE IF NOT EXISTS datapoints (metric text, timestamp text, value real, tags json)"
-        )
-        cursor.execute(sql_create_metrics)
-        cls.connection.commit()
-        sql_create_flags = "CREATE TABLE IF NOT EXISTS flags (id INTEGER PRIMARY KEY CHECK (id = 1), is_shutdown BLOB)"
-        cursor.execute(sql_create_flags)
-        cls.connection.commit()
 
-        sql_insert = "INSERT INTO datapoints VALUES (?,?,?,?)"
         cls.sample_data = SAMPLE_DATA
         for k, v in cls.sample_data.items():
             for t, d in v.items():
-                cursor.execute(sql_insert, [k, t, d, json.dumps(None)])
-        cls.connection.commit()
+                tsdb_store.insert_datapoints(cls.connection, [{"metric": k, "value": d}], t)
 
         # Shutdown event
         sql_insert_flag_event = "INSERT OR REPLACE INTO flags VALUES (1, ?)"
@@ -159,6 +152,59 @@ class TestDragonTelemetryTSDBApp(unittest.TestCase):
                 with self.subTest(k):
                     self.assertEqual(len(v), len(pre_mock_db.get(k, {})) - 1)
 
+    def test_legacy_schema_upgrade(self):
+        filename = self.filename + ".legacy"
+        connection = sqlite3.connect(filename)
+        connection.execute("CREATE TABLE datapoints (metric text, timestamp text, value real, tags json)")
+        for k, v in SAMPLE_DATA.items():
+            for t, d in v.items():
+                connection.execute("INSERT INTO datapoints VALUES (?,?,?,?)", [k, t, d, json.dumps(None)])
+        connection.commit()
+        connection.close()
+
+        connection = tsdb_store.connect(filename)
+        upgraded = get_dps_of_each_row(filename)
+        connection.close()
+        tsdb_store.remove(filename)
+        self.assertEqual(sorted(upgraded.keys()), sorted(SAMPLE_DATA.keys()))
+        for k, v in SAMPLE_DATA.items():
+            with self.subTest(k):
+                self.assertEqual(upgraded[k], {int(t): d for t, d in v.items()})
+
+    def test_concurrent_connect(self):
+        filename = self.filename + ".concurrent"
+        connection = sqlite3.connect(filename)
+        connection.execute("CREATE TABLE datapoints (metric text, timestamp text, value real, tags json)")
+        rows = [["load_average", str(t), 1.0, json.dumps(None)] for t in range(1722010000, 1722060000)]
+        connection.executemany("INSERT INTO datapoints VALUES (?,?,?,?)", rows)
+        connection.commit()
+        connection.close()
+        os.chmod(filename, 0o644)
+
+        # processes connecting at startup upgrade the schema and build the rollups once
+        errors = []
+
+        def connect():
+            try:
+                tsdb_store.connect(filename).close()
+            except Exception as ex:
+                errors.append(ex)
+
+        threads = [threading.Thread(target=connect) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        connection = tsdb_store.connect(filename)
+        counts = connection.execute("SELECT resolution, SUM(value_count) FROM rollups GROUP BY resolution").fetchall()
+        modes = [stat.S_IMODE(os.stat(filename + suffix).st_mode) for suffix in ("", "-wal", "-shm")]
+        connection.close()
+        tsdb_store.remove(filename)
+        self.assertEqual(errors, [])
+        self.assertEqual(counts, [(r, len(rows)) for r in tsdb_store.ROLLUP_RESOLUTIONS])
+        self.assertEqual(modes, [tsdb_store.DB_PERMISSIONS] * 3)
+
     def tearDown(self):
         pass
 
@@ -166,7 +212,7 @@ class TestDragonTelemetryTSDBApp(unittest.TestCase):
     def tearDownClass(cls):
         cls.context.pop()
         cls.connection.close()
-        os.remove(cls.filename)
+        tsdb_store.remove(cls.filename)
 
 
 class TestDragonTelemetryTSDBAppErrors(unittest.TestCase):
@@ -4,6 +4,7 @@ import unittest
 from infrastructure.env_parameter_tests import LaunchParameterTest
 from infrastructure.newline_stream_wrapper_test import NewlineStreamWrapperTest
 from infrastructure.test_dragon_config import DragonConfigTest
+from infrastructure.message_encoding_test import MessageEncodingTest
 
 
 if __name__ == "__main__":
@@ -4,9 +4,11 @@
 import shim_dragon_paths
 import inspect
 import multiprocessing as mp
+import json
 import logging
 import os
 import signal
+import subprocess
 import sys
 import time
 import unittest
@@ -19,6 +21,7 @@ import dragon.infrastructure.connection as dconn
 import dragon.infrastructure.facts as dfacts
 import dragon.infrastructure.parameters as parms
 import dragon.localservices.local_svc as dsls
+import dragon.localservices.zygote as dzygote
 import dragon.dlogging.util as dlog
 import dragon.utils as du
 
@@ -726,5 +729,64 @@ class SingleLS(unittest.TestCase):
         self.do_teardown()
 
 
+# Runs in its own process, which becomes a child subreaper like Local Services does.
+_ZYGOTE_SPAWN = """
+import json, os, subprocess, sys
+import dragon.localservices.zygote as dzygote
+
+class ZygotePopen(dzygote.ZygotePopenMixin, subprocess.Popen):
+    def __init__(self, zyg, *args, **kwds):
+        self._zygote = zyg
+        super().__init__(*args, **kwds)
+
+zyg = dzygote.Zygote(preload=["json"])
+code = "import os, sys; print(os.getppid(), os.environ['ZYGOTE_TEST'], sys.argv); sys.exit(7)"
+proc = ZygotePopen(
+    zyg,
+    [sys.executable, "-c", code],
+    stdin=subprocess.PIPE,
+    stdout=subprocess.PIPE,
+    stderr=subprocess.STDOUT,
+    env=dict(os.environ, ZYGOTE_TEST="forked"),
+)
+out, _ = proc.communicate(timeout=30)
+zyg.stop(5)
+print(json.dumps([proc.pid != zyg.pid, out.decode().split(), os.getpid(), proc.returncode]))
+"""
+
+
+class Zygote(unittest.TestCase):
+    def setUp(self) -> None:
+        self.zygote = dzygote.Zygote(preload=["json"], subreaper=False)
+
+    def tearDown(self) -> None:
+        self.zygote.stop(5)
+
+    def test_preload(self):
+        self.assertEqual(self.zygote.preload_failures, [])
+
+    def test_serves(self):
+        self.assertTrue(self.zygote.serves(sys.executable, ["-c", "pass"]))
+        self.assertFalse(self.zygote.serves(sys.executable, ["script.py"]))
+        self.assertFalse(self.zygote.serves("/bin/true", ["-c", "pass"]))
+
+    def test_serves_env(self):
+        env = dict(os.environ)
+        self.assertTrue(self.zygote.serves(sys.executable, ["-c", "pass"], env))
+        self.assertTrue(self.zygote.serves(sys.executable, ["-c", "pass"], dict(env, ZYGOTE_TEST="forked")))
+        # the interpreter would start differently or be a different one
+        self.assertFalse(self.zygote.serves(sys.executable, ["-c", "pass"], dict(env, PYTHONPATH="/nonexistent")))
+        self.assertFalse(self.zygote.serves(sys.executable, ["-c", "pass"], dict(env, PYTHONOPTIMIZE="1")))
+        self.assertFalse(self.zygote.serves("python3", ["-c", "pass"], dict(env, PATH="/nonexistent")))
+
+    def test_spawn(self):
+        result = subprocess.run([sys.executable, "-c", _ZYGOTE_SPAWN], capture_output=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr.decode())
+        distinct, out, parent, returncode = json.loads(result.stdout)
+        self.assertTrue(distinct)
+        self.assertEqual(out, [str(parent), "forked", "['-c']"])
+        self.assertEqual(returncode, 7)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -37,6 +37,12 @@ class AddressIPv4TestCase(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(hello.host, self.IP)
         self.assertEqual(hello.port, 8888)
 
+    def test_lane_hello(self):
+        hello = transport.Address(self.IP, 8888).hello(2)
+        self.assertIsInstance(hello, self.Hello)
+        self.assertEqual(hello.lane, 2)
+        self.assertEqual(transport.Address.from_hello(hello), transport.Address(self.IP, 8888))
+
     def test_from_hello(self):
         addr = transport.Address.from_hello(self.Hello(self.IP, 8888))
         self.assertEqual(addr.host, self.IP)
@@ -63,6 +69,22 @@ class AddressIPv4TestCase(unittest.IsolatedAsyncioTestCase):
         write_message.assert_called_once_with(writer, my_addr.hello())
         read_message.assert_awaited_once_with(reader)
 
+    @patch.object(transport, "write_message")
+    @patch.object(transport, "read_message")
+    async def test_do_lane_handshake(self, read_message, write_message):
+        my_addr = transport.Address(self.IP, 8888)
+        peer_addr = transport.Address(self.IP, 9999)
+        read_message.return_value = peer_addr.hello(3)
+
+        reader = MagicMock(spec=StreamReader)
+        writer = MagicMock(spec=StreamWriter)
+
+        addr, lane = await my_addr.do_lane_handshake(reader, writer, 1)
+
+        self.assertEqual(addr, peer_addr)
+        self.assertEqual(lane, 3)
+        write_message.assert_called_once_with(writer, my_addr.hello(1))
+
 
 class AddressIPv6TestCase(AddressIPv4TestCase):
 
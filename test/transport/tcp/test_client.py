@@ -1,4 +1,10 @@
+import asyncio
+from types import SimpleNamespace
 import unittest
+from unittest.mock import MagicMock, patch
+
+from dragon.channels import ChannelEmpty, ChannelRecvTimeout
+from dragon.transport.tcp.client import Client
 
 from test_transport import TestMessages
 
@@ -17,9 +23,39 @@ class ClientTestCase(TestMessages, unittest.IsolatedAsyncioTestCase):
     def test_close(self):
         raise NotImplementedError
 
-    @unittest.skip
-    async def test_recv(self):
-        raise NotImplementedError
+    @patch("dragon.transport.tcp.client.GatewayMessage")
+    async def test_recv(self, GatewayMessage):
+        client = Client(b"", MagicMock())
+        client._recv_handle = MagicMock()
+        raw = [MagicMock(), MagicMock(), MagicMock()]
+        gw = [MagicMock(), MagicMock(), MagicMock()]
+        GatewayMessage.from_message.side_effect = gw
+
+        def recv(blocking=True, timeout=None):
+            # Two messages are waiting, the third arrives after the channel was found empty
+            if channel.pending:
+                return channel.pending.pop(0)
+            if not blocking:
+                raise ChannelEmpty("empty")
+            if channel.later:
+                return channel.later.pop(0)
+            client._stop_reader.wait(timeout)
+            raise ChannelRecvTimeout("timeout")
+
+        channel = SimpleNamespace(pending=raw[:2], later=raw[2:])
+        client._recv_handle.recv.side_effect = recv
+
+        client._start_reader()
+        try:
+            first = await asyncio.wait_for(client.recv(), 5)
+            second = await asyncio.wait_for(client.recv(), 5)
+        finally:
+            await asyncio.to_thread(client._join_reader)
+
+        self.assertEqual(first, gw[:2])
+        self.assertEqual(second, gw[2:])
+        for msg in raw:
+            msg.destroy.assert_called_once()
 
     @unittest.skip
     def test_process(self):
@@ -92,6 +92,22 @@ class Hello6TestCase(TransmittableTestCase):
         cls.data = b'\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01"\xb8'
 
 
+class LaneHelloTestCase(TransmittableTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.msg = messages.LaneHello(ip_address("127.0.0.1"), 8888, 3)
+        cls.data = b'\x41\x7f\x00\x00\x01"\xb8\x03'
+
+
+class LaneHello6TestCase(TransmittableTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.msg = messages.LaneHello6(ip_address("::1"), 8888, 3)
+        cls.data = b'\x61\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01"\xb8\x03'
+
+
 class SendRequestTestCase(TransmittableTestCase):
 
     @classmethod
@@ -185,6 +201,22 @@ class EventResponseTestCase(TransmittableTestCase):
 
 class MessagesTestCase(unittest.IsolatedAsyncioTestCase):
 
+    async def test_write_messages(self):
+        msgs = [messages.Hello(ip_address("127.0.0.1"), 8888), messages.Hello(ip_address("127.0.0.1"), 8889)]
+        reader, writer = await transport.create_pipe_streams()
+        try:
+            await messages.write_messages(writer, msgs)
+        finally:
+            await transport.close_writer(writer)
+        for msg in msgs:
+            self.assertEqual(await messages.read_message(reader), msg)
+            self.assertTrue(msg._io_event.is_set())
+        self.assertEqual(await reader.read(), b"")
+
+    def test_encode_message(self):
+        msg = messages.Hello(ip_address("127.0.0.1"), 8888)
+        self.assertEqual(b"".join(messages.encode_message(msg)), b'\x40\x7f\x00\x00\x01"\xb8')
+
     # XXX Not sure of a more effective test compared to all the
     # XXX TransmittableTestCase subclasses.
 
@@ -1,13 +1,15 @@
 import asyncio
 from datetime import timedelta
+from functools import partial
 import logging
 from pathlib import Path
 import ssl
 from tempfile import TemporaryDirectory
 import unittest
 from unittest.mock import MagicMock, patch
+from uuid import uuid4
 
-from dragon.transport.tcp import transport
+from dragon.transport.tcp import messages, transport
 
 from test_transport import TestMessages
 
@@ -50,11 +52,11 @@ class StreamTransportTestCase(unittest.IsolatedAsyncioTestCase):
         reader = MagicMock(spec=asyncio.StreamReader)
         writer = MagicMock(spec=asyncio.StreamWriter)
 
-        with patch.object(transport.Address, "do_handshake", return_value=addr) as do_handshake:
+        with patch.object(transport.Address, "do_lane_handshake", return_value=(addr, 2)) as do_lane_handshake:
             await self.transport.accept_connection(reader, writer)
 
-        do_handshake.assert_awaited_once_with(reader, writer)
-        add_connection.assert_called_once_with(addr, reader, writer)
+        do_lane_handshake.assert_awaited_once_with(reader, writer)
+        add_connection.assert_called_once_with(addr, reader, writer, 2)
 
     @patch.object(transport.StreamTransport, "add_connection")
     @patch("asyncio.open_connection")
@@ -72,8 +74,8 @@ class StreamTransportTestCase(unittest.IsolatedAsyncioTestCase):
             r, w = await self.transport._open_connection(addr)
 
         self.assertEqual(open_connection.await_args.args, (str(addr.host), int(addr.port)))
-        do_handshake.assert_awaited_once_with(reader, writer)
-        add_connection.assert_called_once_with(addr, reader, writer)
+        do_handshake.assert_awaited_once_with(reader, writer, 0)
+        add_connection.assert_called_once_with(addr, reader, writer, 0)
 
     @patch.object(transport.StreamTransport, "_do_recv", new_callable=MagicMock)
     @patch("asyncio.create_task")
@@ -89,7 +91,7 @@ class StreamTransportTestCase(unittest.IsolatedAsyncioTestCase):
         # Verify writer added to _writers list for addr
         self.assertIn(writer, self.transport._writers[addr])
         # Verify recv task started
-        _do_recv.assert_called_once_with(addr, reader)
+        _do_recv.assert_called_once_with(addr, reader, 0)
         create_task.assert_called_once()
         # Verify recv task added to set of recv tasks for addr
         self.assertIn(task, self.transport._recv_tasks[addr])
@@ -98,7 +100,7 @@ class StreamTransportTestCase(unittest.IsolatedAsyncioTestCase):
     @patch.object(transport, "close_writer")
     @patch.object(transport.StreamTransport, "_open_connection")
     async def test_connect(self, open_connection, close_writer):
-        def _open_connection(addr):
+        def _open_connection(addr, lane):
             # Simulate connection errors when trying to open a new connection
             if open_connection.await_count < 5:
                 raise ConnectionRefusedError
@@ -124,7 +126,7 @@ class StreamTransportTestCase(unittest.IsolatedAsyncioTestCase):
 
         # Verify new connection opened
         writer = await self.transport.connect(addr)
-        open_connection.assert_awaited_with(addr)
+        open_connection.assert_awaited_with(addr, 0)
         self.assertIn(writer, self.transport._writers[addr])
 
         # Verify existing connection is returned
@@ -136,13 +138,65 @@ class StreamTransportTestCase(unittest.IsolatedAsyncioTestCase):
         writer.is_closing.return_value = True
         open_connection.reset_mock()
         writer3 = await self.transport.connect(addr)
-        open_connection.assert_awaited_with(addr)
+        open_connection.assert_awaited_with(addr, 0)
         # Check that closed writer has been removed
         self.assertNotIn(writer, self.transport._writers[addr])
         self.assertIn(writer3, self.transport._writers[addr])
         # XXX Not sure we can speculate about how many recv tasks may be running
         # XXX at this point
 
+    @patch.object(transport.StreamTransport, "_do_recv", new_callable=MagicMock)
+    @patch("asyncio.create_task")
+    def test_add_lane_connection(self, create_task, _do_recv):
+        addr = transport.Address.from_netloc("127.0.0.1:8888")
+        reader = MagicMock(spec=asyncio.StreamReader)
+        writer = MagicMock(spec=asyncio.StreamWriter)
+        self.transport.add_connection(addr, reader, writer, 2)
+
+        # Lanes other than 0 are kept apart from the address' own connections
+        self.assertIn(writer, self.transport._writers[(addr, 2)])
+        self.assertNotIn(addr, self.transport._writers)
+        _do_recv.assert_called_once_with(addr, reader, 2)
+        self.assertIn(create_task.return_value, self.transport._recv_tasks[(addr, 2)])
+
+    def test__select_lane(self):
+        addr = transport.Address.from_netloc("127.0.0.1:8888")
+        send_request = partial(
+            messages.SendRequest,
+            timeout=0.5,
+            channel_sd=b"channel desc",
+            return_mode=messages.SendReturnMode.WHEN_BUFFERED,
+            sendhid=uuid4(),
+            clientid=0,
+            hints=0,
+        )
+        payload = bytes(self.transport.LARGE_MESSAGE_SIZE)
+        small = send_request(seqno=1, payload=b"payload")
+        large = send_request(seqno=2, payload=payload)
+
+        # Everything uses a single lane by default
+        self.assertEqual(self.transport._select_lane(large, addr), 0)
+
+        self.transport.connections_per_peer = 3
+        # Small messages use the priority lane and large responses alternate
+        # over the bulk lanes
+        self.assertEqual(self.transport._select_lane(messages.SendResponse(seqno=1), addr), 0)
+        resp = messages.RecvResponse(seqno=1, clientid=0, hints=0, payload=payload)
+        self.assertEqual([self.transport._select_lane(resp, addr) for _ in range(4)], [1, 2, 1, 2])
+
+        # Requests of a send handle stay on the lane of the first one until it
+        # has been idle
+        self.assertEqual(self.transport._select_lane(small, addr), 0)
+        self.assertEqual(self.transport._select_lane(large, addr), 0)
+        other = send_request(seqno=3, sendhid=uuid4(), payload=payload)
+        self.assertEqual(self.transport._select_lane(other, addr), 1)
+        self.assertEqual(self.transport._select_lane(small, addr), 0)
+
+        for msg in (small, large, small):
+            self.transport._unpin(msg, addr)
+        self.transport.LANE_PIN_TIMEOUT = 0.0
+        self.assertEqual(self.transport._select_lane(large, addr), 2)
+
     @unittest.skip
     async def _do_recv(self):
         raise NotImplementedError